@@ -3,7 +3,7 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 
 @dataclass
@@ -20,6 +20,7 @@ class DataRedundancyManager:
 
     def __post_init__(self) -> None:
         self._cfg = self._load_cfg(self.config_path)
+        self._synthetic_quote = self._build_synthetic_quote()
 
     def _load_cfg(self, p: str) -> Dict[str, Any]:
         path = Path(p)
@@ -66,14 +67,23 @@ class DataRedundancyManager:
                 cfg[current_section][k] = val
         return cfg
 
-    def get_quote(self, symbol: str) -> Dict[str, float]:
-        """
-        Tool-safe quote snapshot.
-        Replace this with your real market data connection later.
-        """
+    def _build_synthetic_quote(self) -> Dict[str, float]:
+        # Defaults are static for the lifetime of the manager; parse them once.
         defaults = (self._cfg.get("synthetic_quote_defaults") or {})
         bid = float(defaults.get("bid", 100.0))
         ask = float(defaults.get("ask", 100.02))
         last = float(defaults.get("last", (bid + ask) / 2.0))
         mid = (bid + ask) / 2.0
         return {"bid": bid, "ask": ask, "mid": mid, "last": last}
+
+    def get_quote(self, symbol: str) -> Dict[str, float]:
+        """
+        Tool-safe quote snapshot.
+        Replace this with your real market data connection later.
+        """
+        return dict(self._synthetic_quote)
+
+    def get_quotes(self, symbols: List[str]) -> Dict[str, Dict[str, float]]:
+        """Batch variant of get_quote for backtests / multi-symbol scans."""
+        q = self._synthetic_quote
+        return {sym: dict(q) for sym in symbols}
@@ -3,7 +3,8 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Tuple
 
 import yaml
 
@@ -15,6 +16,9 @@ from Core.signals.execution import QueuePositionSignal, SpreadCaptureSignal, Sli
 
 LOG = logging.getLogger("alpha_stack")
 
+# Shared read-only cfg for modules without a config block (no fresh {} per decide()).
+_NO_MODULE_CFG: Mapping[str, Any] = MappingProxyType({})
+
 
 def _load_yaml(path: Path) -> Dict[str, Any]:
     if not path.exists():
@@ -66,11 +70,11 @@ class AlphaStackDecision:
                         "confidence": v.confidence,
                         "urgency": v.urgency_tier(),
                         "reason": v.reason,
-                        "outputs": v.outputs,
+                        "outputs": dict(v.outputs),
                     }
                     for k, v in self.module_results.items()
                 },
-                "execution_hints": dict(self.execution_hints),
+                "execution_hints": {k: dict(v) for k, v in self.execution_hints.items()},
             }
         }
 
@@ -110,7 +114,7 @@ class AlphaStack:
         active_scores: List[Tuple[str, float, float]] = []  # (name, score, weight)
 
         for name, module in self.modules.items():
-            mcfg = mod_cfgs.get(name, {}) or {}
+            mcfg = mod_cfgs.get(name) or _NO_MODULE_CFG
             if not bool(mcfg.get("enabled", True)):
                 results[name] = SignalDecision(module=name, kind=module.kind, active=False, reason="disabled")
                 continue
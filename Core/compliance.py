@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
@@ -20,10 +21,16 @@ class ExecutionMode:
     LIVE = "LIVE"
 
 
+@functools.lru_cache(maxsize=64)
+def _normalize_mode(raw: str) -> str:
+    return raw.strip().upper() or ExecutionMode.TOOL
+
+
 def get_execution_mode() -> str:
     """Returns the configured execution mode (defaults to TOOL)."""
-    mode = (os.getenv("BOTTRADER_EXECUTION_MODE") or os.getenv("BOT_EXECUTION_MODE") or ExecutionMode.TOOL).strip().upper()
-    return mode or ExecutionMode.TOOL
+    # Called several times per order; the env value is almost always already
+    # canonical, so the strip/upper result is cached per raw string.
+    return _normalize_mode(os.getenv("BOTTRADER_EXECUTION_MODE") or os.getenv("BOT_EXECUTION_MODE") or ExecutionMode.TOOL)
 
 
 def enforce_signals_only(context: str = "") -> None:
@@ -0,0 +1,38 @@
+# Core/config_cache.py
+from __future__ import annotations
+
+import copy
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+import yaml
+
+# libyaml-backed loader when PyYAML was built with it; same semantics as safe_load.
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# resolved path -> ((st_mtime_ns, st_size), parsed document)
+_YAML_CACHE: Dict[Path, Tuple[Tuple[int, int], Any]] = {}
+
+
+def load_yaml_cached(path: str | Path) -> Dict[str, Any]:
+    """
+    Parse a YAML config file, reusing the previous parse while the file's
+    mtime and size are unchanged. Returns a private deep copy so callers may
+    mutate the result freely. Missing files raise like open() would.
+    """
+    p = Path(path).resolve()
+    st = p.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+
+    hit = _YAML_CACHE.get(p)
+    if hit is None or hit[0] != stamp:
+        with p.open("r", encoding="utf-8") as f:
+            data = yaml.load(f, Loader=_SafeLoader) or {}
+        _YAML_CACHE[p] = (stamp, data)
+    else:
+        data = hit[1]
+    return copy.deepcopy(data)
+
+
+def clear_yaml_cache() -> None:
+    _YAML_CACHE.clear()
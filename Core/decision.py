@@ -5,11 +5,14 @@ from dataclasses import dataclass, field
 from typing import Any, Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class Decision:
     """
     Standard decision object returned by gates.
     Tests expect attributes like: allowed, action, adjusted_qty.
+
+    Fixed (slotted) layout so consumers read fields directly instead of
+    duck-typing with getattr(..., default).
     """
     allowed: bool
     qty: int
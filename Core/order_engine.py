@@ -1,11 +1,53 @@
 from __future__ import annotations
 
+import threading
 import time
 import uuid
+from array import array
+from collections import ChainMap, deque
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, List
+from enum import IntEnum
+from typing import Any, Dict, Optional, List, Tuple
 
-from Core.compliance import Signal, enforce_signals_only, get_execution_mode
+from Core.compliance import ExecutionMode, Signal, enforce_signals_only
+
+# Per-thread scratch buffer for the single-order trace; reused across calls.
+_tls = threading.local()
+
+
+class StepStatus(IntEnum):
+    """Trace status codes. Traces hold (step, code, error) tuples internally."""
+
+    OK = 0
+    SKIPPED = 1
+    BLOCKED_UPSTREAM = 2
+    ERROR = 3
+    BLOCKED = 4
+
+
+# Rendered only when the trace is serialized into the result.
+_STATUS_STR = ("OK", "SKIPPED", "SKIPPED", "ERROR", "BLOCKED")
+
+# Constant part of every result. Entrypoints call enforce_signals_only() first,
+# so by the time a result is built the execution mode can only be TOOL.
+_RESULT_TEMPLATE: Dict[str, Any] = {"status": "SIGNAL_ONLY", "execution_mode": ExecutionMode.TOOL}
+
+# Recycled Signal envelopes. A Signal only lives long enough to be rendered via
+# to_dict(), so instances are returned here instead of being reallocated.
+# deque.append/pop are atomic, so the pool is safe to share across threads.
+_SIGNAL_POOL: "deque[Signal]" = deque(maxlen=1024)
+
+
+def _acquire_signal() -> Signal:
+    try:
+        return _SIGNAL_POOL.pop()
+    except IndexError:
+        return Signal.__new__(Signal)
+
+
+def _release_signal(sig: Signal) -> None:
+    sig.meta = None  # don't pin the last order's meta
+    _SIGNAL_POOL.append(sig)
 
 
 @dataclass
@@ -17,6 +59,13 @@ class OrderIntent:
     meta: Dict[str, Any]
 
 
+def _coerce_qty(qty: Any) -> int:
+    try:
+        return int(qty)
+    except (TypeError, ValueError):
+        return 0
+
+
 class OrderEngine:
     """
     SIGNAL-ONLY orchestrator (tool mode).
@@ -28,9 +77,23 @@ class OrderEngine:
       eligibility_mask -> event_blackouts -> execution_safe_mode -> trade_throttle
       -> portfolio_constraints -> (execution alpha optional) -> SIGNAL OUTPUT
 
+    A gate that blocks short-circuits the rest of the pipeline. Gates are
+    categorized (per-order vs. batch-capable) once, at construction.
+
     You can plug in your existing modules here without changing their logic.
     """
 
+    __slots__ = (
+        "eligibility_mask",
+        "event_blackouts",
+        "safe_mode",
+        "trade_throttle",
+        "portfolio_constraints",
+        "execution_alpha",
+        "signal_writer",
+        "_stage_table",
+    )
+
     def __init__(
         self,
         *,
@@ -49,6 +112,7 @@ class OrderEngine:
         self.portfolio_constraints = portfolio_constraints
         self.execution_alpha = execution_alpha
         self.signal_writer = signal_writer
+        self._stage_table = self._build_stages()
 
     def place_order(
         self,
@@ -66,72 +130,255 @@ class OrderEngine:
         """
         enforce_signals_only(context="OrderEngine.place_order")
         meta = meta or {}
-        intent = OrderIntent(symbol=symbol, side=side, qty=int(qty), strategy=strategy, meta=meta)
+        qty_i = _coerce_qty(qty)
+        intent = OrderIntent(symbol=symbol, side=side, qty=qty_i, strategy=strategy, meta=meta)
+        if qty_i <= 0:
+            # Fast reject: no gate can make a non-positive qty valid.
+            return self._reject_qty(intent, time.perf_counter_ns())
         return self._run_pipeline(intent)
 
-    def _run_pipeline(self, intent: OrderIntent) -> Dict[str, Any]:
-        t0 = time.time()
-        trace: List[Dict[str, Any]] = []
+    def place_orders(self, orders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Batch entrypoint.
 
-        def _step(name: str, fn: Optional[Any], payload: Dict[str, Any]) -> Dict[str, Any]:
-            if fn is None:
-                trace.append({"step": name, "status": "SKIPPED"})
-                return payload
-            try:
-                out = fn(payload)
-                trace.append({"step": name, "status": "OK"})
-                return out if isinstance(out, dict) else payload
-            except Exception as e:
-                trace.append({"step": name, "status": "ERROR", "error": str(e)})
-                # In signals-only mode, we do not crash the whole tool; we return a BLOCKED signal.
+        Each order is a dict with symbol/side/qty/strategy and optional meta.
+        Stages run over the whole surviving cohort before moving to the next,
+        so an order blocked at eligibility never reaches the later gates.
+        A gate exposing a callable `batch(payloads)` gets the cohort in one call.
+        """
+        enforce_signals_only(context="OrderEngine.place_orders")
+        t0_ns = time.perf_counter_ns()
+        intents, payloads, traces = self._run_batch(orders)
+        return [self._finalize(intents[i], payloads[i], traces[i], t0_ns) for i in range(len(intents))]
+
+    def place_orders_soa(self, orders: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Columnar variant of place_orders for analytics over large batches.
+
+        Returns equal-length columns instead of one result dict per order:
+          symbol/side/strategy_id: lists of str
+          blocked: array('b') of 0/1, qty: array('q'), confidence: array('d')
+          traces: {index: trace} for blocked orders only (sparse)
+
+        No per-order Signal envelope is built and signal_writer is not called.
+        """
+        enforce_signals_only(context="OrderEngine.place_orders_soa")
+        intents, payloads, traces = self._run_batch(orders)
+
+        n = len(intents)
+        blocked = array("b", bytes(n))
+        qty = array("q", bytes(8 * n))
+        confidence = array("d", bytes(8 * n))
+        blocked_traces: Dict[int, Any] = {}
+        for i in range(n):
+            payload = payloads[i]
+            qty[i] = intents[i].qty
+            confidence[i] = float(payload.get("confidence", 0.5) or 0.5)
+            if payload.get("blocked"):
+                blocked[i] = 1
+                blocked_traces[i] = self._render_trace(traces[i], True)
+
+        return {
+            "status": "SIGNAL_ONLY",
+            "execution_mode": ExecutionMode.TOOL,
+            "symbol": [it.symbol for it in intents],
+            "side": [it.side for it in intents],
+            "strategy_id": [it.strategy for it in intents],
+            "qty": qty,
+            "confidence": confidence,
+            "blocked": blocked,
+            "traces": blocked_traces,
+        }
+
+    def _run_batch(
+        self, orders: List[Dict[str, Any]]
+    ) -> Tuple[List[OrderIntent], List[Dict[str, Any]], List[List[tuple]]]:
+        intents: List[OrderIntent] = []
+        payloads: List[Dict[str, Any]] = []
+        traces: List[List[tuple]] = []
+        alive: List[int] = []
+        for i, o in enumerate(orders):
+            intent = OrderIntent(
+                symbol=o["symbol"],
+                side=o["side"],
+                qty=_coerce_qty(o["qty"]),
+                strategy=o["strategy"],
+                meta=o.get("meta") or {},
+            )
+            payload = self._new_payload(intent)
+            intents.append(intent)
+            payloads.append(payload)
+            if intent.qty <= 0:
+                # Fast reject, same as place_order: never enters the cohort.
                 payload["blocked"] = True
-                payload.setdefault("reasons", []).append(f"{name}_error:{e}")
-                return payload
+                payload["reasons"].append("qty<=0")
+                traces.append([("sanity", StepStatus.BLOCKED, None)])
+            else:
+                traces.append([])
+                alive.append(i)
+
+        dropped: List[int] = []
+        for name, fn, batch in self._stage_table:
+            for i in dropped:
+                traces[i].append((name, StepStatus.BLOCKED_UPSTREAM, None))
+
+            if fn is None:
+                for i in alive:
+                    traces[i].append((name, StepStatus.SKIPPED, None))
+                continue
+
+            if batch is not None and alive:
+                try:
+                    outs = list(batch([payloads[i] for i in alive]))
+                    if len(outs) != len(alive):
+                        # every order must get a decision; a short batch blocks the cohort
+                        raise ValueError(f"batch returned {len(outs)} results for {len(alive)} orders")
+                    for i, out in zip(alive, outs):
+                        traces[i].append((name, StepStatus.OK, None))
+                        if isinstance(out, dict):
+                            payloads[i] = out
+                except Exception as e:
+                    for i in alive:
+                        self._stage_error(name, e, payloads[i], traces[i])
+            else:
+                for i in alive:
+                    payloads[i] = self._apply_stage(name, fn, payloads[i], traces[i])
+
+            dropped.extend(i for i in alive if payloads[i].get("blocked"))
+            alive = [i for i in alive if not payloads[i].get("blocked")]
 
-        payload: Dict[str, Any] = {
+        return intents, payloads, traces
+
+    def _build_stages(self) -> Tuple[Tuple[str, Optional[Any], Optional[Any]], ...]:
+        """
+        Gate pipeline in evaluation order: (step name, gate callable or None,
+        bound batch callable or None). A gate is batch-capable if it exposes a
+        callable `batch(payloads)`.
+        """
+        stages = (
+            ("eligibility_mask", self.eligibility_mask),
+            ("event_blackouts", self.event_blackouts),
+            ("execution_safe_mode", self.safe_mode),
+            ("trade_throttle", self.trade_throttle),
+            ("portfolio_constraints", self.portfolio_constraints),
+            # Optional planner (still signals-only)
+            ("execution_alpha_plan", self.execution_alpha),
+        )
+        table = []
+        for name, fn in stages:
+            batch = getattr(fn, "batch", None) if fn is not None else None
+            table.append((name, fn, batch if callable(batch) else None))
+        return tuple(table)
+
+    def _reject_qty(self, intent: OrderIntent, t0_ns: int) -> Dict[str, Any]:
+        payload = {"meta": intent.meta, "blocked": True, "reasons": ["qty<=0"]}
+        return self._finalize(intent, payload, [("sanity", StepStatus.BLOCKED, None)], t0_ns)
+
+    @staticmethod
+    def _new_payload(intent: OrderIntent) -> Dict[str, Any]:
+        return {
             "symbol": intent.symbol,
             "side": intent.side,
             "qty": intent.qty,
             "strategy": intent.strategy,
-            "meta": intent.meta,
+            # Gates may annotate meta; writes land in the overlay so the caller's
+            # dict is never mutated, without copying it up front.
+            "meta": ChainMap({}, intent.meta),
             "blocked": False,
             "reasons": [],
         }
 
-        payload = _step("eligibility_mask", self.eligibility_mask, payload)
-        payload = _step("event_blackouts", self.event_blackouts, payload)
-        payload = _step("execution_safe_mode", self.safe_mode, payload)
-        payload = _step("trade_throttle", self.trade_throttle, payload)
-        payload = _step("portfolio_constraints", self.portfolio_constraints, payload)
-
-        # Optional planner (still signals-only)
-        payload = _step("execution_alpha_plan", self.execution_alpha, payload)
-
-        # Build final signal
-        signal = Signal(
-            symbol=intent.symbol,
-            side=intent.side,
-            qty=intent.qty,
-            strategy_id=intent.strategy,
-            confidence=float(payload.get("confidence", 0.5) or 0.5),
-            rationale=str(payload.get("rationale", "") or ""),
-            meta={
-                **(intent.meta or {}),
-                "blocked": bool(payload.get("blocked")),
-                "reasons": payload.get("reasons", []),
-                "trace": trace,
-            },
-        )
+    @staticmethod
+    def _stage_error(name: str, e: Exception, payload: Dict[str, Any], trace: List[tuple]) -> None:
+        trace.append((name, StepStatus.ERROR, str(e)))
+        # In signals-only mode, we do not crash the whole tool; we return a BLOCKED signal.
+        payload["blocked"] = True
+        payload.setdefault("reasons", []).append(f"{name}_error:{e}")
 
-        out = {
-            "status": "SIGNAL_ONLY",
-            "id": str(uuid.uuid4()),
-            "ts": time.time(),
-            "elapsed_ms": int((time.time() - t0) * 1000),
-            "execution_mode": get_execution_mode(),
-            "signal": signal.to_dict(),
+    def _apply_stage(
+        self, name: str, fn: Any, payload: Dict[str, Any], trace: List[tuple]
+    ) -> Dict[str, Any]:
+        try:
+            out = fn(payload)
+            trace.append((name, StepStatus.OK, None))
+            return out if isinstance(out, dict) else payload
+        except Exception as e:
+            self._stage_error(name, e, payload, trace)
+            return payload
+
+    def _run_pipeline(self, intent: OrderIntent) -> Dict[str, Any]:
+        t0_ns = time.perf_counter_ns()
+        trace: Optional[List[tuple]] = getattr(_tls, "trace", None)
+        if trace is None:
+            trace = _tls.trace = []
+        else:
+            trace.clear()
+        payload = self._new_payload(intent)
+
+        # Stage bodies are inlined here (rather than going through _apply_stage)
+        # to keep the per-order path free of extra Python calls.
+        append = trace.append
+        blocked = False
+        for name, fn, _ in self._stage_table:
+            if blocked:
+                # Short-circuit: once a gate blocks, later gates have nothing to decide.
+                append((name, StepStatus.BLOCKED_UPSTREAM, None))
+                continue
+            if fn is None:
+                append((name, StepStatus.SKIPPED, None))
+                continue
+            try:
+                out = fn(payload)
+                append((name, StepStatus.OK, None))
+                if isinstance(out, dict):
+                    payload = out
+            except Exception as e:
+                self._stage_error(name, e, payload, trace)
+            blocked = bool(payload.get("blocked"))
+
+        # Rendering builds a fresh structure, so the recycled buffer never escapes.
+        return self._finalize(intent, payload, trace, t0_ns)
+
+    @staticmethod
+    def _render_trace(trace: List[tuple], emit: bool) -> Any:
+        if not emit:
+            return tuple((name, _STATUS_STR[code]) for name, code, _ in trace)
+        out: List[Dict[str, Any]] = []
+        for name, code, error in trace:
+            d: Dict[str, Any] = {"step": name, "status": _STATUS_STR[code]}
+            if code == StepStatus.BLOCKED_UPSTREAM:
+                d["reason"] = "blocked_upstream"
+            elif code == StepStatus.ERROR:
+                d["error"] = error
+            out.append(d)
+        return out
+
+    def _finalize(self, intent: OrderIntent, payload: Dict[str, Any], trace: List[tuple], t0_ns: int) -> Dict[str, Any]:
+        trace = self._render_trace(trace, bool(intent.meta.get("emit_trace", True)))
+        # Build final signal (pooled envelope, see _SIGNAL_POOL)
+        signal = _acquire_signal()
+        signal.symbol = intent.symbol
+        signal.side = intent.side
+        signal.qty = intent.qty
+        signal.strategy_id = intent.strategy
+        signal.confidence = float(payload.get("confidence", 0.5) or 0.5)
+        signal.rationale = str(payload.get("rationale", "") or "")
+        signal.meta = {
+            **payload.get("meta", intent.meta),
+            "blocked": bool(payload.get("blocked")),
+            "reasons": payload.get("reasons", []),
             "trace": trace,
         }
+        signal_dict = signal.to_dict()
+        _release_signal(signal)
+
+        out = _RESULT_TEMPLATE.copy()
+        out["id"] = str(uuid.uuid4())
+        out["ts"] = time.time()
+        # Monotonic clock for elapsed; wall clock only for the timestamp.
+        out["elapsed_ms"] = (time.perf_counter_ns() - t0_ns) // 1_000_000
+        out["signal"] = signal_dict
+        out["trace"] = trace
 
         # Optional: write signal to disk if a writer is provided
         if self.signal_writer is not None:
@@ -17,7 +17,8 @@ class PolicyEngine:
     def evaluate(self, order: Any, meta: Dict[str, Any], price: float) -> Decision:
         # 1) Eligibility mask first (hard block)
         if self.eligibility_mask is not None:
-            d = self.eligibility_mask.check(order, meta)
+            # only a block is returned, so skip the ALLOW diagnostics
+            d = self.eligibility_mask.check(order, meta, verbose=False)
             if not d.allowed:
                 return d
 
@@ -26,4 +27,4 @@ class PolicyEngine:
             return self.portfolio_gate.check_pre_trade(order, meta=meta, price=price)
 
         # If nothing configured, allow as-is
-        return Decision(True, int(getattr(order, "qty")), reason="NO_GATES_CONFIGURED", action="ALLOW")
+        return Decision(True, int(order.qty), reason="NO_GATES_CONFIGURED", action="ALLOW")
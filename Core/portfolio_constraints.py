@@ -1,23 +1,39 @@
 # Core/portfolio_constraints.py
 from __future__ import annotations
 
+import atexit
 import json
+import weakref
 from pathlib import Path
-from typing import Any, Dict, Optional
-
-import yaml
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
+from Core.config_cache import load_yaml_cached
 from Core.decision import Decision
 
 
+class PositionRow(NamedTuple):
+    symbol: str
+    qty: float
+    price: Optional[float]  # None -> value at the caller's fallback price
+
+
+# symbol -> (exposure of rows with a usable price, sum |qty| of rows priced at fallback),
+# plus the same two totals across all symbols.
+_ExposureIndex = Tuple[Dict[str, Tuple[float, float]], float, float]
+
+
 class MetaPortfolioProvider:
+    @staticmethod
+    def _raw_positions(meta: Dict[str, Any]) -> Any:
+        p = meta.get("portfolio", {}) if isinstance(meta.get("portfolio"), dict) else {}
+        return p.get("positions", []) or []
+
     def nav(self, meta: Dict[str, Any]) -> float:
         p = meta.get("portfolio", {}) if isinstance(meta.get("portfolio"), dict) else {}
         return float(p.get("nav", meta.get("nav", 0.0)))
 
     def positions(self, meta: Dict[str, Any]) -> list[Dict[str, Any]]:
-        p = meta.get("portfolio", {}) if isinstance(meta.get("portfolio"), dict) else {}
-        return list(p.get("positions", []) or [])
+        return list(self._raw_positions(meta))
 
     def risk_metrics(self, meta: Dict[str, Any]) -> Dict[str, Any]:
         p = meta.get("portfolio", {}) if isinstance(meta.get("portfolio"), dict) else {}
@@ -37,26 +53,66 @@ class MetaPortfolioProvider:
             return 0.0
 
     @staticmethod
-    def _pos_price(pos: Dict[str, Any], fallback_price: float) -> float:
-        v = pos.get("price", pos.get("avg_price", pos.get("mark", fallback_price)))
+    def _pos_price(pos: Dict[str, Any]) -> Optional[float]:
+        """Row price, or None when the row must be valued at the caller's fallback price."""
+        v = pos.get("price", pos.get("avg_price", pos.get("mark")))
+        if v is None:
+            return None
         try:
             return float(v)
         except Exception:
-            return float(fallback_price)
+            return None
+
+    @classmethod
+    def _normalize(cls, positions: Any) -> List[PositionRow]:
+        """One guarded pass resolving the symbol/qty/price key fallbacks per row."""
+        return [PositionRow(cls._pos_symbol(p), cls._pos_qty(p), cls._pos_price(p)) for p in positions]
+
+    def _build_index(self, positions: Any) -> _ExposureIndex:
+        by_symbol: Dict[str, Tuple[float, float]] = {}
+        priced_total = 0.0
+        unpriced_qty_total = 0.0
+        for sym, qty, px in self._normalize(positions):
+            priced, unpriced_qty = by_symbol.get(sym, (0.0, 0.0))
+            if px is None:
+                unpriced_qty += abs(qty)
+                unpriced_qty_total += abs(qty)
+            else:
+                exp = abs(qty * px)
+                priced += exp
+                priced_total += exp
+            by_symbol[sym] = (priced, unpriced_qty)
+        return by_symbol, priced_total, unpriced_qty_total
+
+    def _index(self, meta: Dict[str, Any]) -> _ExposureIndex:
+        """Per-symbol and gross exposure from one scan of the current positions."""
+        return self._build_index(self._raw_positions(meta))
+
+    @staticmethod
+    def _exposure(priced: float, unpriced_qty: float, fallback_price: float) -> float:
+        return priced + unpriced_qty * abs(float(fallback_price))
 
     def symbol_exposure(self, meta: Dict[str, Any], symbol: str, fallback_price: float) -> float:
-        exp = 0.0
-        for p in self.positions(meta):
-            if self._pos_symbol(p) != symbol:
-                continue
-            exp += abs(self._pos_qty(p) * self._pos_price(p, fallback_price))
-        return exp
+        return self._exposure(*self._index(meta)[0].get(symbol, (0.0, 0.0)), fallback_price)
 
     def gross_exposure(self, meta: Dict[str, Any], fallback_price: float) -> float:
-        exp = 0.0
-        for p in self.positions(meta):
-            exp += abs(self._pos_qty(p) * self._pos_price(p, fallback_price))
-        return exp
+        _, priced, unpriced_qty = self._index(meta)
+        return self._exposure(priced, unpriced_qty, fallback_price)
+
+    def exposures(self, meta: Dict[str, Any], symbol: str, fallback_price: float) -> Tuple[float, float]:
+        """(symbol_exposure, gross_exposure) from a single scan of the positions."""
+        by_symbol, priced, unpriced_qty = self._index(meta)
+        sym_priced, sym_unpriced = by_symbol.get(symbol, (0.0, 0.0))
+        return (
+            self._exposure(sym_priced, sym_unpriced, fallback_price),
+            self._exposure(priced, unpriced_qty, fallback_price),
+        )
+
+
+def _flush_at_exit(ref: "weakref.ref[PortfolioConstraintsGate]") -> None:
+    gate = ref()
+    if gate is not None:
+        gate.flush()
 
 
 class PortfolioConstraintsGate:
@@ -76,6 +132,16 @@ class PortfolioConstraintsGate:
         self._state: Dict[str, Any] = {}
         self._load_state()
 
+        # Persist every Nth state change; 0 defers writes until flush().
+        # Default 1 keeps peak_nav durable across restarts; backtests raise it.
+        # Deferred writes are flushed at interpreter exit; call flush() (or
+        # close()) sooner if the process may be killed without running atexit.
+        self._save_interval = max(0, int(self.config.get("save_interval", 1)))
+        self._pending_saves = 0
+        self._dirty = False
+        if state_path and self._save_interval != 1:
+            atexit.register(_flush_at_exit, weakref.ref(self))
+
         # Ensure expected sections exist
         self.config.setdefault("concentration", {})
         self.config.setdefault("leverage", {})
@@ -87,8 +153,7 @@ class PortfolioConstraintsGate:
         cls, cfg_path: str | Path, meta_provider: Optional[MetaPortfolioProvider] = None
     ) -> "PortfolioConstraintsGate":
         cfg_path = Path(cfg_path)
-        with cfg_path.open("r", encoding="utf-8") as f:
-            config = yaml.safe_load(f) or {}
+        config = load_yaml_cached(cfg_path)
         state_path = cfg_path.with_suffix(".state.json")
         return cls(config=config, meta_provider=meta_provider, state_path=state_path)
 
@@ -108,10 +173,29 @@ class PortfolioConstraintsGate:
         if not self._state_path:
             return
         try:
-            self._state_path.write_text(json.dumps(self._state, indent=2), encoding="utf-8")
+            self._state_path.write_text(json.dumps(self._state, separators=(",", ":")), encoding="utf-8")
         except Exception:
             pass
 
+    def _mark_dirty(self) -> None:
+        if not self._state_path:
+            return
+        self._dirty = True
+        self._pending_saves += 1
+        if self._save_interval and self._pending_saves >= self._save_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write state if it changed since the last write."""
+        if self._dirty:
+            self._save_state()
+            self._dirty = False
+            self._pending_saves = 0
+
+    def close(self) -> None:
+        """Persist any deferred state changes (on shutdown or end of a backtest)."""
+        self.flush()
+
     @staticmethod
     def _floor_qty(x: float) -> int:
         if x <= 0:
@@ -139,7 +223,7 @@ class PortfolioConstraintsGate:
         if nav > peak_nav:
             peak_nav = nav
             self._state["peak_nav"] = peak_nav
-            self._save_state()
+            self._mark_dirty()
 
         drawdown = (peak_nav - nav) / peak_nav if peak_nav > 0 else 0.0
         if drawdown >= hard_dd:
@@ -151,7 +235,10 @@ class PortfolioConstraintsGate:
                 action="HALT",
             )
 
-        candidates: list[tuple[int, str, Dict[str, Any]]] = []
+        # Tightest cap so far (min qty; first one wins ties)
+        best_qty: Optional[int] = None
+        best_reason = ""
+        best_details: Dict[str, Any] = {}
 
         # -----------------------
         # SYMBOL CONCENTRATION
@@ -159,26 +246,23 @@ class PortfolioConstraintsGate:
         conc = self.config.get("concentration", {}) or {}
         max_symbol_pct_nav = float(conc.get("max_symbol_pct_nav", 1.0))
         cap_dollars = nav * max_symbol_pct_nav
-        current_symbol_exposure = self.meta_provider.symbol_exposure(meta, symbol, price)
+        # positions are scanned once per check, so in-place edits between checks are seen
+        current_symbol_exposure, current_gross = self.meta_provider.exposures(meta, symbol, price)
 
         if side == "BUY":
             headroom = max(cap_dollars - current_symbol_exposure, 0.0)
             max_qty = self._floor_qty(headroom / price)
             if max_qty < requested_qty:
-                candidates.append(
-                    (
-                        max_qty,
-                        "SYMBOL_CONCENTRATION_RESIZE",
-                        {
-                            "symbol": symbol,
-                            "nav": nav,
-                            "cap_dollars": cap_dollars,
-                            "current_symbol_exposure": current_symbol_exposure,
-                            "requested_qty": requested_qty,
-                            "price": price,
-                        },
-                    )
-                )
+                best_qty = max_qty
+                best_reason = "SYMBOL_CONCENTRATION_RESIZE"
+                best_details = {
+                    "symbol": symbol,
+                    "nav": nav,
+                    "cap_dollars": cap_dollars,
+                    "current_symbol_exposure": current_symbol_exposure,
+                    "requested_qty": requested_qty,
+                    "price": price,
+                }
 
         # -----------------------
         # GROSS LEVERAGE
@@ -189,27 +273,22 @@ class PortfolioConstraintsGate:
         max_gross = float(gross_by_bucket.get(regime, gross_by_bucket.get("NORMAL", 999.0)))
 
         gross_cap = nav * max_gross
-        current_gross = self.meta_provider.gross_exposure(meta, price)
 
         if side == "BUY":
             gross_headroom = max(gross_cap - current_gross, 0.0)
             max_qty = self._floor_qty(gross_headroom / price)
-            if max_qty < requested_qty:
-                candidates.append(
-                    (
-                        max_qty,
-                        "GROSS_LEVERAGE_RESIZE",
-                        {
-                            "regime": regime,
-                            "nav": nav,
-                            "max_gross": max_gross,
-                            "gross_cap": gross_cap,
-                            "current_gross": current_gross,
-                            "requested_qty": requested_qty,
-                            "price": price,
-                        },
-                    )
-                )
+            if max_qty < requested_qty and (best_qty is None or max_qty < best_qty):
+                best_qty = max_qty
+                best_reason = "GROSS_LEVERAGE_RESIZE"
+                best_details = {
+                    "regime": regime,
+                    "nav": nav,
+                    "max_gross": max_gross,
+                    "gross_cap": gross_cap,
+                    "current_gross": current_gross,
+                    "requested_qty": requested_qty,
+                    "price": price,
+                }
 
         # -----------------------
         # VAR LIMIT (VaR95)
@@ -235,36 +314,34 @@ class PortfolioConstraintsGate:
             headroom = var_95_max - current_var_95
 
             if headroom <= 0:
-                candidates.append((0, "VAR_95_BLOCK", {"var_95_max": var_95_max, "current_var_95": current_var_95}))
+                if best_qty is None or 0 < best_qty:
+                    best_qty = 0
+                    best_reason = "VAR_95_BLOCK"
+                    best_details = {"var_95_max": var_95_max, "current_var_95": current_var_95}
             else:
                 max_qty = self._floor_qty(headroom / per_unit_inc)
-                if max_qty < requested_qty:
-                    candidates.append(
-                        (
-                            max_qty,
-                            "VAR_95_RESIZE",
-                            {
-                                "var_95_max": var_95_max,
-                                "current_var_95": current_var_95,
-                                "headroom": headroom,
-                                "var_95_increment_full": inc_full_f,
-                                "per_unit_inc": per_unit_inc,
-                                "requested_qty": requested_qty,
-                            },
-                        )
-                    )
+                if max_qty < requested_qty and (best_qty is None or max_qty < best_qty):
+                    best_qty = max_qty
+                    best_reason = "VAR_95_RESIZE"
+                    best_details = {
+                        "var_95_max": var_95_max,
+                        "current_var_95": current_var_95,
+                        "headroom": headroom,
+                        "var_95_increment_full": inc_full_f,
+                        "per_unit_inc": per_unit_inc,
+                        "requested_qty": requested_qty,
+                    }
 
         # -----------------------
         # Apply tightest (min qty)
         # -----------------------
-        if candidates:
-            max_qty, reason, details = min(candidates, key=lambda t: t[0])
-            max_qty = int(max(0, max_qty))
+        if best_qty is not None:
+            max_qty = int(max(0, best_qty))
 
             if max_qty <= 0:
-                return Decision(allowed=False, qty=0, reason=reason, details=details, action="BLOCK")
+                return Decision(allowed=False, qty=0, reason=best_reason, details=best_details, action="BLOCK")
 
-            return Decision(allowed=True, qty=max_qty, reason=reason, details=details, action="RESIZE")
+            return Decision(allowed=True, qty=max_qty, reason=best_reason, details=best_details, action="RESIZE")
 
         return Decision(allowed=True, qty=requested_qty, reason="OK", details={"requested_qty": requested_qty}, action="ALLOW")
 # ----------------------------
@@ -2,22 +2,20 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Sequence, Tuple
 
-import yaml
+import numpy as np
 
+from Core.config_cache import load_yaml_cached
 
-def _clamp(x: float, lo: float, hi: float) -> float:
-    return max(lo, min(hi, x))
 
+def _np_clamp(x: np.ndarray, lo: float, hi: float) -> np.ndarray:
+    """Elementwise max(lo, min(hi, x)) with the builtins' NaN handling (NaN -> hi)."""
+    x = np.where(x < hi, x, hi)
+    return np.where(x > lo, x, lo)
 
-def _round_to_step(x: float, step: float) -> float:
-    if step <= 0:
-        return x
-    return round(x / step) * step
 
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SizeInputs:
     equity_usd: float
     price: float
@@ -27,7 +25,7 @@ class SizeInputs:
     confidence: Optional[float] = None  # 0..1
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SizeResult:
     qty: float
     notional_usd: float
@@ -45,6 +43,15 @@ class SizeResult:
     reason: str
 
 
+@dataclass(frozen=True)
+class SizeBatch:
+    """Column-wise size() results for a batch; blocked rows have qty 0."""
+    qty: np.ndarray
+    notional_usd: np.ndarray
+    risk_usd: np.ndarray
+    blocked: np.ndarray
+
+
 class PositionSizer:
     """
     Risk-based sizing with regime + confidence multipliers and hard clamps.
@@ -60,43 +67,95 @@ class PositionSizer:
     def reload(self) -> None:
         if not self.config_path.exists():
             raise FileNotFoundError(f"Position sizing config not found: {self.config_path}")
-        with self.config_path.open("r", encoding="utf-8") as f:
-            self._cfg = yaml.safe_load(f) or {}
+        self._cfg = load_yaml_cached(self.config_path)
+        self._compile()
+
+    def _compile(self) -> None:
+        """
+        Resolve every config value size() needs into plain attributes once per
+        reload, so the per-call path does no dict .get chains or float() casts.
+        """
+        base = self._cfg.get("base", {}) or {}
+        clamps = self._cfg.get("clamps", {}) or {}
+        reg_mults = self._cfg.get("regime_multipliers", {}) or {}
+        c_cfg = self._cfg.get("confidence", {}) or {}
+        inf = float("inf")
+
+        self._base_risk = float(base.get("risk_per_trade_pct", 0.0025))
+        self._min_stop_pct = max(float(base.get("min_stop_distance_pct", 0.001)), 0.0)
+        self._qty_step = float(base.get("qty_step", 1))
+
+        # (min_notional, max_notional, min_qty, max_qty, max_risk_usd)
+        self._clamp_tuple = (
+            float(clamps.get("min_notional_usd", 0.0)),
+            float(clamps.get("max_notional_usd", inf)),
+            float(clamps.get("min_qty", 0.0)),
+            float(clamps.get("max_qty", inf)),
+            float(clamps.get("max_risk_usd", inf)),
+        )
+
+        self._reg_mults = {k: float(v) for k, v in reg_mults.items()}
+        self._reg_default = self._reg_mults.get("UNKNOWN", 0.0)
+
+        self._strats: Dict[str, Tuple[Optional[float], float]] = {}
+        for sid, s in (self._cfg.get("strategies", {}) or {}).items():
+            s = s or {}
+            risk_pct = s.get("risk_per_trade_pct", None)
+            self._strats[sid] = (
+                float(risk_pct) if risk_pct is not None else None,
+                float(s.get("strategy_mult", 1.0)),
+            )
+
+        # Int-coded tables for size_batch(); the last slot is the fallback row.
+        self._regime_idx = {k: i for i, k in enumerate(self._reg_mults)}
+        self._regime_mult_arr = np.array(list(self._reg_mults.values()) + [self._reg_default])
+        self._strat_idx = {k: i for i, k in enumerate(self._strats)}
+        self._strat_risk_arr = np.array(
+            [self._base_risk if r is None else r for r, _ in self._strats.values()] + [self._base_risk]
+        )
+        self._strat_mult_arr = np.array([m for _, m in self._strats.values()] + [1.0])
+
+        # (min_conf, max_conf, floor_mult, ceil_mult), or None when disabled
+        self._conf_params: Optional[Tuple[float, float, float, float]] = None
+        if bool(c_cfg.get("enabled", True)):
+            self._conf_params = (
+                float(c_cfg.get("min_conf", 0.2)),
+                float(c_cfg.get("max_conf", 0.8)),
+                float(c_cfg.get("floor_mult", 0.5)),
+                float(c_cfg.get("ceil_mult", 1.25)),
+            )
 
     def _get_strategy_overrides(self, strategy_id: str) -> Tuple[Optional[float], float]:
-        strategies = self._cfg.get("strategies", {}) or {}
-        s = strategies.get(strategy_id, {}) or {}
-        risk_pct = s.get("risk_per_trade_pct", None)
-        strat_mult = float(s.get("strategy_mult", 1.0))
-        return (risk_pct, strat_mult)
+        return self._strats.get(strategy_id, (None, 1.0))
 
     def _confidence_multiplier(self, conf: Optional[float]) -> float:
-        c_cfg = self._cfg.get("confidence", {}) or {}
-        if not bool(c_cfg.get("enabled", True)):
+        params = self._conf_params
+        if params is None:
             return 1.0
 
         if conf is None:
             return 1.0  # neutral if missing
 
-        conf = _clamp(float(conf), 0.0, 1.0)
-
-        min_conf = float(c_cfg.get("min_conf", 0.2))
-        max_conf = float(c_cfg.get("max_conf", 0.8))
-        floor_mult = float(c_cfg.get("floor_mult", 0.5))
-        ceil_mult = float(c_cfg.get("ceil_mult", 1.25))
+        min_conf, max_conf, floor_mult, ceil_mult = params
 
         if max_conf <= min_conf:
             return 1.0
 
-        conf_clip = _clamp(conf, min_conf, max_conf)
+        # max(lo, min(hi, x)) twice: [0, 1] then [min_conf, max_conf]. Comparisons
+        # are negated to match the builtins, so NaN lands on the upper bound.
+        conf_clip = float(conf)
+        if not conf_clip < 1.0:
+            conf_clip = 1.0
+        if not conf_clip > 0.0:
+            conf_clip = 0.0
+        if not conf_clip < max_conf:
+            conf_clip = max_conf
+        if not conf_clip > min_conf:
+            conf_clip = min_conf
         t = (conf_clip - min_conf) / (max_conf - min_conf)  # 0..1
         return floor_mult + t * (ceil_mult - floor_mult)
 
     def size(self, inp: SizeInputs) -> SizeResult:
-        base = self._cfg.get("base", {}) or {}
-        clamps = self._cfg.get("clamps", {}) or {}
-        reg_mults = self._cfg.get("regime_multipliers", {}) or {}
-
         regime = (inp.regime or "UNKNOWN").strip().upper()
         strategy_id = (inp.strategy_id or "").strip().upper()
 
@@ -117,18 +176,17 @@ class PositionSizer:
             )
 
         # ---- base risk pct + optional strategy override ----
-        default_risk_pct = float(base.get("risk_per_trade_pct", 0.0025))
         override_risk_pct, strategy_mult = self._get_strategy_overrides(strategy_id)
-        risk_pct = float(override_risk_pct) if override_risk_pct is not None else default_risk_pct
+        risk_pct = override_risk_pct if override_risk_pct is not None else self._base_risk
 
         # ---- regime multiplier ----
-        regime_mult = float(reg_mults.get(regime, reg_mults.get("UNKNOWN", 0.0)))
+        regime_mult = self._reg_mults.get(regime, self._reg_default)
         if regime_mult <= 0.0:
             return SizeResult(
                 qty=0, notional_usd=0, risk_usd=0,
                 regime=regime, strategy_id=strategy_id,
                 base_risk_pct=risk_pct, regime_mult=regime_mult,
-                confidence_mult=0.0, strategy_mult=float(strategy_mult),
+                confidence_mult=0.0, strategy_mult=strategy_mult,
                 blocked=True, reason="BLOCK: regime multiplier <= 0",
             )
 
@@ -138,8 +196,7 @@ class PositionSizer:
         # ---- stop distance ----
         stop_distance = inp.stop_distance_usd
         if stop_distance is None:
-            min_stop_pct = float(base.get("min_stop_distance_pct", 0.001))
-            stop_distance = inp.price * max(min_stop_pct, 0.0)
+            stop_distance = inp.price * self._min_stop_pct
 
         stop_distance = float(stop_distance)
         if stop_distance <= 0:
@@ -147,7 +204,7 @@ class PositionSizer:
                 qty=0, notional_usd=0, risk_usd=0,
                 regime=regime, strategy_id=strategy_id,
                 base_risk_pct=risk_pct, regime_mult=regime_mult,
-                confidence_mult=conf_mult, strategy_mult=float(strategy_mult),
+                confidence_mult=conf_mult, strategy_mult=strategy_mult,
                 blocked=True, reason="BLOCK: stop_distance_usd must be > 0",
             )
 
@@ -155,10 +212,11 @@ class PositionSizer:
         risk_usd = inp.equity_usd * risk_pct
         risk_usd *= regime_mult
         risk_usd *= conf_mult
-        risk_usd *= float(strategy_mult)
+        risk_usd *= strategy_mult
+
+        min_notional, max_notional, min_qty, max_qty, max_risk_usd = self._clamp_tuple
 
         # hard cap risk
-        max_risk_usd = float(clamps.get("max_risk_usd", risk_usd))
         risk_usd = min(risk_usd, max_risk_usd)
 
         # ---- raw qty ----
@@ -166,22 +224,26 @@ class PositionSizer:
 
         # ---- notional clamps ----
         notional = qty * inp.price
-        min_notional = float(clamps.get("min_notional_usd", 0.0))
-        max_notional = float(clamps.get("max_notional_usd", float("inf")))
 
         if max_notional > 0:
-            notional = _clamp(notional, min_notional, max_notional)
+            if not notional < max_notional:
+                notional = max_notional
+            if not notional > min_notional:
+                notional = min_notional
             qty = notional / inp.price
 
-        # ---- qty clamps ----
-        min_qty = float(clamps.get("min_qty", 0.0))
-        max_qty = float(clamps.get("max_qty", float("inf")))
-        qty = _clamp(qty, min_qty, max_qty)
+        # ---- qty clamps (max(lo, min(hi, x)): min wins over max) ----
+        if not qty < max_qty:
+            qty = max_qty
+        if not qty > min_qty:
+            qty = min_qty
 
         # ---- rounding ----
-        step = float(base.get("qty_step", 1))
-        qty = _round_to_step(qty, step)
-        qty = max(0.0, qty)
+        step = self._qty_step
+        if step > 0:
+            qty = round(qty / step) * step
+        if not qty > 0.0:
+            qty = 0.0
 
         notional = qty * inp.price
         realized_risk = qty * stop_distance
@@ -198,7 +260,89 @@ class PositionSizer:
             base_risk_pct=risk_pct,
             regime_mult=regime_mult,
             confidence_mult=conf_mult,
-            strategy_mult=float(strategy_mult),
+            strategy_mult=strategy_mult,
             blocked=blocked,
             reason=reason,
         )
+
+    def size_batch(
+        self,
+        equity_usd: Sequence[float],
+        price: Sequence[float],
+        stop_distance_usd: Sequence[float],
+        regime: Sequence[Optional[str]],
+        strategy_id: Sequence[Optional[str]],
+        confidence: Optional[Sequence[float]] = None,
+    ) -> SizeBatch:
+        """
+        Vectorized size() over parallel columns. NaN in stop_distance_usd and
+        None in confidence mean "not provided" (None in SizeInputs); a NaN
+        confidence is clamped exactly as size() clamps it. Same arithmetic and
+        clamp order as size(), so each row matches the scalar result.
+        """
+        eq = np.asarray(equity_usd, dtype=np.float64)
+        px = np.asarray(price, dtype=np.float64)
+        stop = np.asarray(stop_distance_usd, dtype=np.float64)
+        n = eq.shape[0]
+
+        r_default = len(self._regime_idx)
+        s_default = len(self._strat_idx)
+        reg_i = np.fromiter(
+            (self._regime_idx.get((r or "UNKNOWN").strip().upper(), r_default) for r in regime),
+            dtype=np.intp, count=n,
+        )
+        strat_i = np.fromiter(
+            (self._strat_idx.get((s or "").strip().upper(), s_default) for s in strategy_id),
+            dtype=np.intp, count=n,
+        )
+        regime_mult = self._regime_mult_arr[reg_i]
+        risk_pct = self._strat_risk_arr[strat_i]
+        strategy_mult = self._strat_mult_arr[strat_i]
+
+        conf_mult = np.ones(n)
+        params = self._conf_params
+        if confidence is not None and params is not None:
+            min_conf, max_conf, floor_mult, ceil_mult = params
+            if isinstance(confidence, np.ndarray):
+                missing = np.zeros(n, dtype=bool)
+                conf = confidence.astype(np.float64, copy=False)
+            else:
+                missing = np.fromiter((c is None for c in confidence), dtype=bool, count=n)
+                conf = np.array([0.0 if c is None else c for c in confidence], dtype=np.float64)
+            if max_conf > min_conf:
+                c = _np_clamp(_np_clamp(conf, 0.0, 1.0), min_conf, max_conf)
+                t = (c - min_conf) / (max_conf - min_conf)
+                conf_mult = np.where(missing, 1.0, floor_mult + t * (ceil_mult - floor_mult))
+
+        stop = np.where(np.isnan(stop), px * self._min_stop_pct, stop)
+        blocked = (eq <= 0) | (px <= 0) | (regime_mult <= 0.0) | (stop <= 0)
+        # keep blocked rows finite; they are zeroed below
+        px_safe = np.where(blocked, 1.0, px)
+        stop_safe = np.where(blocked, 1.0, stop)
+
+        min_notional, max_notional, min_qty, max_qty, max_risk_usd = self._clamp_tuple
+
+        risk_usd = eq * risk_pct
+        risk_usd *= regime_mult
+        risk_usd *= conf_mult
+        risk_usd *= strategy_mult
+        risk_usd = np.minimum(risk_usd, max_risk_usd)
+
+        qty = risk_usd / stop_safe
+        if max_notional > 0:
+            notional = _np_clamp(qty * px_safe, min_notional, max_notional)
+            qty = notional / px_safe
+        qty = _np_clamp(qty, min_qty, max_qty)
+
+        step = self._qty_step
+        if step > 0:
+            qty = np.round(qty / step) * step
+        qty = np.where(qty > 0.0, qty, 0.0)
+        qty[blocked] = 0.0
+
+        return SizeBatch(
+            qty=qty,
+            notional_usd=qty * px_safe,
+            risk_usd=qty * stop_safe,
+            blocked=blocked | (qty <= 0.0),
+        )
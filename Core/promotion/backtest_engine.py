@@ -2,9 +2,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Callable, List, Optional, Tuple
+from typing import Callable, List, Optional, Tuple, Union
 
-@dataclass(frozen=True)
+import numpy as np
+
+@dataclass(frozen=True, slots=True)
 class Bar:
     ts: datetime
     open: float
@@ -13,6 +15,50 @@ class Bar:
     close: float
     volume: float = 0.0
 
+@dataclass
+class BarArrays:
+    """
+    Struct-of-arrays view of a bar series: one contiguous float64 column per
+    field. Build once at ingestion with from_bars(); `ts` stays a list of
+    datetimes because results and month bucketing are keyed on them.
+    """
+    ts: List[datetime]
+    open_: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    @classmethod
+    def from_bars(cls, bars: List[Bar]) -> "BarArrays":
+        n = len(bars)
+
+        def col(field: str) -> np.ndarray:
+            return np.fromiter((getattr(b, field) for b in bars), dtype=np.float64, count=n)
+
+        return cls(
+            ts=[b.ts for b in bars],
+            open_=col("open"),
+            high=col("high"),
+            low=col("low"),
+            close=col("close"),
+            volume=col("volume"),
+        )
+
+    def window(self, lo: int, hi: int) -> "BarArrays":
+        """Bars [lo, hi) as NumPy views (no column copies)."""
+        return BarArrays(
+            ts=self.ts[lo:hi],
+            open_=self.open_[lo:hi],
+            high=self.high[lo:hi],
+            low=self.low[lo:hi],
+            close=self.close[lo:hi],
+            volume=self.volume[lo:hi],
+        )
+
 @dataclass
 class BacktestConfig:
     slippage_bps: float = 1.0
@@ -31,16 +77,27 @@ class BacktestResult:
 SignalFunc = Callable[[List[Bar]], List[int]]
 # returns target position per bar: -1, 0, +1
 
+def _bars_to_soa(bars: Union[List[Bar], BarArrays]) -> Tuple[List[datetime], np.ndarray]:
+    """Timestamps plus a contiguous float64 close array; free for BarArrays."""
+    if isinstance(bars, BarArrays):
+        return bars.ts, bars.close
+    close = np.fromiter((b.close for b in bars), dtype=np.float64, count=len(bars))
+    return [b.ts for b in bars], close
+
 def run_simple_backtest(
-    bars: List[Bar],
+    bars: Union[List[Bar], BarArrays],
     signal_fn: SignalFunc,
     cfg: BacktestConfig,
 ) -> BacktestResult:
     """
     Simple, auditable backtest:
-    - signal_fn returns target position per bar (-1/0/+1)
+    - bars is a Bar list or a BarArrays; signal_fn receives it unchanged
+    - signal_fn returns target position per bar (-1/0/+1), as a list or ndarray
     - fills assumed at close with slippage applied
     - equity is normalized; we output per-bar returns
+
+    Vectorized over the whole series; results are converted back to lists
+    at the return boundary.
     """
     if not bars:
         return BacktestResult([], [], [], None, None)
@@ -49,46 +106,35 @@ def run_simple_backtest(
     if len(targets) != len(bars):
         raise ValueError("signal_fn must return one target per bar")
 
-    pos = 0
-    eq = 1.0
-    rets: List[float] = []
-    slip_real: List[float] = []
-    timestamps: List[datetime] = []
+    ts, close = _bars_to_soa(bars)
+    if len(ts) < 2:
+        return BacktestResult([], [], [], ts[0], ts[-1])
+    tgt = np.asarray(targets).astype(np.int64)
+
+    # Position held over bar i is the target at bar i; we start flat.
+    pos = tgt[1:]
+    prev_pos = np.empty_like(pos)
+    prev_pos[0] = 0
+    prev_pos[1:] = tgt[1:-1]
 
     # slippage model: when we change position, we pay slippage once on entry
     # (kept simple; refine later if you want microstructure detail)
-    slip = float(cfg.slippage_bps) / 10000.0
-
-    for i in range(1, len(bars)):
-        prev = bars[i - 1]
-        cur = bars[i]
-        target = int(targets[i])
-
-        # if position changes, apply slippage “hit”
-        if target != pos:
-            # approximate realized slippage bps as configured (could be dynamic later)
-            slip_real.append(float(cfg.slippage_bps))
-            # apply slippage cost as a negative return impulse
-            eq *= (1.0 - slip)
-            pos = target
-        else:
-            slip_real.append(0.0)
-
-        # PnL from holding pos from prev close to cur close
-        px0 = prev.close
-        px1 = cur.close
-        if px0 <= 0:
-            rets.append(0.0)
-        else:
-            raw_r = (px1 - px0) / px0
-            rets.append(float(pos) * raw_r)
-
-        timestamps.append(cur.ts)
+    # approximate realized slippage bps as configured (could be dynamic later)
+    # branch-free: the change mask scales the configured bps directly
+    slip_real = (pos != prev_pos).astype(np.float64) * float(cfg.slippage_bps)
+
+    # PnL from holding pos from prev close to cur close (0 if prev close <= 0)
+    px0 = close[:-1]
+    px1 = close[1:]
+    valid = px0 > 0
+    rets = np.zeros_like(px0)
+    np.divide(px1 - px0, px0, out=rets, where=valid)
+    rets *= pos  # in place: one output buffer for the whole series
 
     return BacktestResult(
-        timestamps=timestamps,
-        returns=rets,
-        slippage_bps_realized=slip_real,
-        start_ts=bars[0].ts,
-        end_ts=bars[-1].ts,
+        timestamps=ts[1:],
+        returns=rets.tolist(),
+        slippage_bps_realized=slip_real.tolist(),
+        start_ts=ts[0],
+        end_ts=ts[-1],
     )
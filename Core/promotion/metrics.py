@@ -3,7 +3,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 from math import sqrt
-from typing import Iterable, List, Tuple, Dict
+from typing import Iterable, List, Optional, Tuple, Union
+
+import numpy as np
 
 def _mean(xs: List[float]) -> float:
     return sum(xs) / len(xs) if xs else 0.0
@@ -21,6 +23,16 @@ def equity_curve_from_returns(returns: List[float], start_equity: float = 1.0) -
         eq.append(eq[-1] * (1.0 + r))
     return eq
 
+def compound_equity(returns: np.ndarray, start_equity: float = 1.0) -> np.ndarray:
+    """
+    Array form of equity_curve_from_returns: [start, start*(1+r0), ...].
+    The start value seeds the cumprod so rounding matches the list version.
+    """
+    gross = np.empty(len(returns) + 1, dtype=np.float64)
+    gross[0] = start_equity
+    np.add(1.0, returns, out=gross[1:])
+    return np.cumprod(gross, out=gross)
+
 def max_drawdown(equity: List[float]) -> float:
     peak = equity[0] if equity else 1.0
     mdd = 0.0
@@ -41,9 +53,68 @@ def annualized_sharpe(returns: List[float], periods_per_year: int = 252) -> floa
         return 0.0
     return (mu / sd) * sqrt(periods_per_year)
 
-def month_key(ts: datetime) -> str:
+def max_drawdown_np(equity: np.ndarray) -> float:
+    """max_drawdown() over a float64 equity array (running peak via maximum.accumulate)."""
+    if equity.size == 0:
+        return 0.0
+    peak = np.maximum.accumulate(equity)
+    dd = np.zeros_like(equity)
+    np.divide(peak - equity, peak, out=dd, where=peak > 0)
+    return max(0.0, float(dd.max()))
+
+def annualized_sharpe_np(returns: np.ndarray, periods_per_year: int = 252) -> float:
+    """annualized_sharpe() over a float64 array (sample std, ddof=1)."""
+    if returns.size < 2:
+        return 0.0
+    mu = float(returns.mean())
+    sd = float(returns.std(ddof=1))
+    if sd == 0:
+        return 0.0
+    return (mu / sd) * sqrt(periods_per_year)
+
+def month_key(ts: datetime) -> int:
+    """Months since year 0 (year*12 + month-1): cheap to hash, sorts chronologically."""
+    return ts.year * 12 + ts.month - 1
+
+def month_key_str(ts: datetime) -> str:
+    """'YYYY-MM' label for display/logging."""
     return f"{ts.year:04d}-{ts.month:02d}"
 
+MonthGroups = Tuple[Optional[np.ndarray], np.ndarray]
+
+def month_groups(timestamps: List[datetime]) -> MonthGroups:
+    """
+    Grouping of `timestamps` by calendar month, for compound_monthly():
+    (order, starts) where `order` re-sorts samples into month order (None if
+    they already are) and `starts` is the first index of each month.
+    Depends only on the timestamps, so callers can reuse it across series.
+    """
+    # month_key() inlined
+    months = np.fromiter(
+        (ts.year * 12 + ts.month - 1 for ts in timestamps),
+        dtype=np.int64,
+        count=len(timestamps),
+    )
+    order = None
+    if months.size > 1 and (np.diff(months) < 0).any():
+        order = np.argsort(months, kind="stable")
+        months = months[order]
+    starts = np.flatnonzero(np.diff(months)) + 1
+    return order, np.concatenate(([0], starts)) if months.size else starts
+
+def compound_monthly(returns: np.ndarray, groups: MonthGroups) -> np.ndarray:
+    """
+    Compounded return per month (ascending month order) along the last axis:
+    one series -> (months,), a (paths, n) matrix -> (paths, months).
+    """
+    order, starts = groups
+    gross = 1.0 + np.asarray(returns, dtype=np.float64)
+    if starts.size == 0:
+        return np.empty(gross.shape[:-1] + (0,), dtype=np.float64)
+    if order is not None:
+        gross = gross[..., order]
+    return np.multiply.reduceat(gross, starts, axis=-1) - 1.0
+
 def monthly_returns(timestamps: List[datetime], returns: List[float]) -> List[float]:
     """
     Compounded monthly returns from (timestamp, per-period return).
@@ -51,25 +122,19 @@ def monthly_returns(timestamps: List[datetime], returns: List[float]) -> List[fl
     """
     if len(timestamps) != len(returns):
         raise ValueError("timestamps and returns must be the same length")
+    return compound_monthly(returns, month_groups(timestamps)).tolist()
 
-    buckets: Dict[str, float] = {}
-    for ts, r in zip(timestamps, returns):
-        k = month_key(ts)
-        # compound within the month
-        buckets[k] = buckets.get(k, 1.0) * (1.0 + r)
-
-    out = []
-    for k in sorted(buckets.keys()):
-        out.append(buckets[k] - 1.0)
-    return out
-
-def percentile(xs: List[float], q: float) -> float:
+def percentile(xs: Union[List[float], np.ndarray], q: float) -> float:
     """
     q in [0,1]. Simple nearest-rank percentile.
+    Accepts a list or float64 ndarray; selection is an O(N) partition.
     """
-    if not xs:
+    if isinstance(xs, np.ndarray):
+        arr = xs
+    else:
+        arr = np.fromiter(xs, dtype=np.float64, count=len(xs))
+    if arr.size == 0:
         return 0.0
-    ys = sorted(xs)
-    idx = int(round((len(ys) - 1) * q))
-    idx = max(0, min(len(ys) - 1, idx))
-    return ys[idx]
+    q = max(0.0, min(1.0, q))
+    # 'nearest' picks index round((N-1)*q) with half-to-even, same as round()
+    return float(np.quantile(arr, q, method="nearest"))
@@ -2,17 +2,18 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-import random
-from typing import List, Tuple
+from typing import List, Optional, Tuple, Union
 
-from .metrics import equity_curve_from_returns, max_drawdown, monthly_returns, percentile
+import numpy as np
+
+from .metrics import compound_monthly, month_groups, percentile
 
 @dataclass
 class MonteCarloConfig:
     paths: int = 10000
     block_size_days: int = 5
     ruin_floor_nav: float = 0.50
-    monthly_tail_alpha: float = 0.05  # 5th percentile
+    monthly_tail_alpha: Optional[float] = 0.05  # 5th percentile; None skips the monthly tail
 
 @dataclass
 class MonteCarloResult:
@@ -21,49 +22,94 @@ class MonteCarloResult:
     prob_ruin: float
     worst_case_monthly_return_95: float  # “worst-case at 95% confidence” => 5th percentile
 
-def _block_bootstrap(returns: List[float], n: int, block: int) -> List[float]:
-    if not returns:
-        return [0.0] * n
-    out: List[float] = []
-    L = len(returns)
-    block = max(1, int(block))
-    while len(out) < n:
-        start = random.randint(0, max(0, L - block))
-        out.extend(returns[start:start + block])
-    return out[:n]
+# Paths simulated per vectorized chunk; bounds the (chunk, n) scratch matrices.
+_PATH_CHUNK = 256
+
+def _block_bootstrap(
+    base: np.ndarray, rows: int, n: int, block: int, rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Moving-block bootstrap for `rows` paths at once: each row concatenates
+    random contiguous blocks of `base` until n samples. All block starts
+    are drawn in one call and gathered with a single fancy-index.
+    """
+    L = len(base)
+    if L == 0:
+        return np.zeros((rows, n), dtype=np.float64)
+    # A block longer than the series degenerates to repeating the whole series.
+    block = min(max(1, int(block)), L)
+    num_blocks = (n + block - 1) // block
+    starts = rng.integers(0, L - block + 1, size=(rows, num_blocks), dtype=np.int64)
+    idx = starts[:, :, None] + np.arange(block)
+    return base[idx].reshape(rows, num_blocks * block)[:, :n]
+
+def _path_stats(sim_rets: np.ndarray, floor: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Max drawdown and ruin flag per simulated path (one path per row).
+    Same conventions as metrics.equity_curve_from_returns/max_drawdown:
+    each curve starts at 1.0 and that starting point counts for peak and min.
+    """
+    rows, n = sim_rets.shape
+    eq = np.empty((rows, n + 1), dtype=np.float64)
+    eq[:, 0] = 1.0
+    np.cumprod(1.0 + sim_rets, axis=1, out=eq[:, 1:])
+    peak = np.maximum.accumulate(eq, axis=1)
+    dd = np.zeros_like(eq)
+    np.divide(peak - eq, peak, out=dd, where=peak > 0)
+    return dd.max(axis=1), eq.min(axis=1) <= floor
 
 def run_monte_carlo(
     timestamps: List[datetime],
-    base_returns: List[float],
+    base_returns: Union[List[float], np.ndarray],
     cfg: MonteCarloConfig,
+    rng: Optional[np.random.Generator] = None,
 ) -> MonteCarloResult:
-    if not base_returns or len(base_returns) < 10:
+    """
+    Block-bootstrap `base_returns` into cfg.paths simulated paths. Pass `rng`
+    (e.g. np.random.default_rng(seed)) for reproducible runs; by default a
+    fresh OS-seeded PCG64DXSM generator is used per call.
+    """
+    n = len(base_returns)
+    if n < 10:
         return MonteCarloResult(cfg.paths, 0.0, 0.0, 0.0)
 
-    n = len(base_returns)
-    mdds: List[float] = []
+    # one contiguous float64 copy shared (read-only) by every path
+    if isinstance(base_returns, np.ndarray):
+        base = np.ascontiguousarray(base_returns, dtype=np.float64)
+    else:
+        base = np.fromiter(base_returns, dtype=np.float64, count=n)
+    if rng is None:
+        rng = np.random.Generator(np.random.PCG64DXSM())
+    paths = int(cfg.paths)
+    floor = float(cfg.ruin_floor_nav)
+    mdds = np.empty(paths, dtype=np.float64)
     ruins = 0
-    all_monthly: List[float] = []
-
-    for _ in range(int(cfg.paths)):
-        sim_rets = _block_bootstrap(base_returns, n=n, block=cfg.block_size_days)
-        eq = equity_curve_from_returns(sim_rets, 1.0)
-        mdd = max_drawdown(eq)
-        mdds.append(mdd)
+    if len(timestamps) != n:
+        raise ValueError("timestamps and returns must be the same length")
+    want_tail = cfg.monthly_tail_alpha is not None
+    if want_tail:
+        # every path reuses `timestamps`: derive the month grouping once
+        groups = month_groups(timestamps)
+        monthly_mat = np.empty((paths, len(groups[1])), dtype=np.float64)
 
-        if min(eq) <= float(cfg.ruin_floor_nav):
-            ruins += 1
+    for lo in range(0, paths, _PATH_CHUNK):
+        hi = min(lo + _PATH_CHUNK, paths)
+        sims = _block_bootstrap(base, rows=hi - lo, n=n, block=cfg.block_size_days, rng=rng)
+        mdds[lo:hi], ruined = _path_stats(sims, floor)
+        ruins += int(ruined.sum())
 
-        # monthly tail metric from this path
-        # reuse the *same timestamps* shape as base (good enough for a tail test)
-        mr = monthly_returns(timestamps, sim_rets)
-        all_monthly.extend(mr)
+        if want_tail:
+            # monthly tail metric from each path (one reduceat for the whole chunk)
+            # reuse the *same timestamps* shape as base (good enough for a tail test)
+            monthly_mat[lo:hi] = compound_monthly(sims, groups)
 
     sim_mdd_p95 = percentile(mdds, 0.95)
     prob_ruin = ruins / float(cfg.paths)
 
     # “95% worst-case monthly return” => 5th percentile
-    worst_case_95 = percentile(all_monthly, float(cfg.monthly_tail_alpha))
+    worst_case_95 = 0.0
+    if want_tail:
+        worst_case_95 = percentile(monthly_mat.ravel(), float(cfg.monthly_tail_alpha))
 
     return MonteCarloResult(
         paths=int(cfg.paths),
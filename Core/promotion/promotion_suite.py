@@ -1,18 +1,24 @@
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from types import ModuleType
+from typing import Any, Dict, List, Tuple
 import importlib.util
 import sys
 import time
 
+import numpy as np
 import yaml
 
+from Core.config_cache import load_yaml_cached
+
 from .pathing import config_dir, strategies_dir
-from .backtest_engine import BacktestConfig, Bar, run_simple_backtest
-from .metrics import annualized_sharpe, equity_curve_from_returns, max_drawdown
+from .backtest_engine import BacktestConfig, Bar, BarArrays, run_simple_backtest
+from .metrics import annualized_sharpe_np, compound_equity, max_drawdown_np
 from .walk_forward import WalkForwardConfig, run_walk_forward
 from .monte_carlo import MonteCarloConfig, run_monte_carlo
 
@@ -27,26 +33,56 @@ class PromotionSuiteResult:
 def _load_yaml(path: Path) -> Dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"Missing file: {path}")
-    with path.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+    data = load_yaml_cached(path)
     if not isinstance(data, dict):
         raise ValueError(f"YAML must be a mapping at top-level: {path}")
     return data
 
 
+@lru_cache(maxsize=1024)
 def _parse_dt(s: str) -> datetime:
+    # crisis window strings repeat across runs; datetimes are immutable, so sharing is safe
     return datetime.fromisoformat(s)
 
 
-def _overlaps(a0: datetime, a1: datetime, b0: datetime, b1: datetime) -> bool:
-    return (a0 <= b1) and (b0 <= a1)
+# (window starts ascending, running max of their ends)
+CrisisIndex = Tuple[List[datetime], List[datetime]]
+
+
+def _crisis_index(periods: List[Dict[str, Any]]) -> CrisisIndex:
+    """Parse crisis windows once and sort them for _overlaps_any."""
+    windows = sorted((_parse_dt(w["start"]), _parse_dt(w["end"])) for w in periods)
+    starts = [b0 for b0, _ in windows]
+    max_ends: List[datetime] = []
+    for _, b1 in windows:
+        max_ends.append(b1 if not max_ends or b1 > max_ends[-1] else max_ends[-1])
+    return starts, max_ends
+
+
+def _overlaps_any(index: CrisisIndex, a0: datetime, a1: datetime) -> bool:
+    """True if [a0, a1] overlaps any indexed window [b0, b1] (a0 <= b1 and b0 <= a1)."""
+    starts, max_ends = index
+    # windows starting on/before a1; the latest-ending of them decides
+    i = bisect_right(starts, a1)
+    return i > 0 and a0 <= max_ends[i - 1]
+
+
+# (resolved adapter path, st_mtime_ns) -> loaded module
+_ADAPTER_CACHE: Dict[Tuple[Path, int], ModuleType] = {}
 
 
 def _import_adapter(adapter_path: Path, strategy_id: str):
     """
-    Robust adapter loader that avoids Python module caching.
-    Each run uses a unique module name so edits to backtest_adapter.py take effect immediately.
+    Load a strategy adapter, cached by (resolved path, mtime) in _ADAPTER_CACHE.
+    The loaded module is reused while the file's mtime is unchanged; an edit
+    to backtest_adapter.py is loaded under a fresh unique module name so it
+    takes effect immediately, and modules from older versions are dropped.
     """
+    key = (adapter_path.resolve(), adapter_path.stat().st_mtime_ns)
+    cached = _ADAPTER_CACHE.get(key)
+    if cached is not None:
+        return cached
+
     unique_name = f"strategy_backtest_adapter_{strategy_id}_{int(time.time()*1000)}"
 
     spec = importlib.util.spec_from_file_location(unique_name, str(adapter_path))
@@ -57,6 +93,11 @@ def _import_adapter(adapter_path: Path, strategy_id: str):
     # Ensure no stale caching under this unique name
     sys.modules[unique_name] = mod
     spec.loader.exec_module(mod)  # type: ignore
+
+    # drop modules loaded from older versions of this file
+    for old_key in [k for k in _ADAPTER_CACHE if k[0] == key[0]]:
+        sys.modules.pop(_ADAPTER_CACHE.pop(old_key).__name__, None)
+    _ADAPTER_CACHE[key] = mod
     return mod
 
 
@@ -75,6 +116,7 @@ def run_promotion_suite(repo_root: Path, strategy_id: str) -> PromotionSuiteResu
         train_years=int(cfg["walk_forward"]["train_years"]),
         test_months=int(cfg["walk_forward"]["test_months"]),
         overlap=bool(cfg["walk_forward"].get("overlap", True)),
+        workers=int(cfg["walk_forward"].get("workers", 1)),
     )
 
     mc_cfg = MonteCarloConfig(
@@ -91,113 +133,127 @@ def run_promotion_suite(repo_root: Path, strategy_id: str) -> PromotionSuiteResu
 
     adapter = _import_adapter(adapter_path, strategy_id)
 
-    # --- Validate required adapter API ---
-    for fn in ("fit", "signal"):
-        if not hasattr(adapter, fn) or not callable(getattr(adapter, fn)):
-            raise AttributeError(f"Strategy adapter missing required function: {fn}()")
+    # --- Validate required adapter API; bind each entry point once ---
+    fns = {name: getattr(adapter, name, None) for name in ("fit", "signal", "load_bars")}
+    for name, fn in fns.items():
+        if not callable(fn):
+            raise AttributeError(f"Strategy adapter missing required function: {name}()")
+    fit_fn, signal_fn, load_bars = fns["fit"], fns["signal"], fns["load_bars"]
+
+    bars: List[Bar] = load_bars()
+    # Columnar copy built once; backtests read views of it, adapters keep Bar lists.
+    bars_soa = BarArrays.from_bars(bars)
 
-    # Accept either load_bars() or load_bars() (some earlier versions used different name)
-    bars_fn = None
-    if hasattr(adapter, "load_bars") and callable(getattr(adapter, "load_bars")):
-        bars_fn = getattr(adapter, "load_bars")
-    elif hasattr(adapter, "load_bars") and callable(getattr(adapter, "load_bars")):
-        bars_fn = getattr(adapter, "load_bars")
+    # fail_fast: stop at the first stage whose gates already failed
+    fail_fast = bool(cfg.get("fail_fast", False))
+    reasons: List[str] = []
+    metrics: Dict[str, Any] = {}
+
+    # -----------------------
+    # Backtest span checks (bar timestamps only; the backtest covers the same span)
+    # -----------------------
+    backtest_years = 0.0
+    includes_crisis = False
+    if bars:
+        start, end = bars[0].ts, bars[-1].ts
+        backtest_years = (end - start).days / 365.25
+        crisis = _crisis_index(cfg["backtest"]["crisis_periods"])
+        includes_crisis = _overlaps_any(crisis, start, end)
+
+    min_years = float(cfg["backtest"]["min_years"])
+    if backtest_years < min_years:
+        reasons.append(f"Backtest horizon too short: {backtest_years:.2f}y < {min_years:.2f}y")
 
-    if bars_fn is None:
-        raise AttributeError("Strategy adapter missing required function: load_bars()")
+    if not includes_crisis:
+        reasons.append("Backtest does not include a required crisis window (e.g., 2008 or 2020).")
 
-    bars: List[Bar] = bars_fn()
+    if fail_fast and reasons:
+        metrics["backtest_years"] = float(backtest_years)
+        metrics["backtest_includes_crisis"] = bool(includes_crisis)
+        return PromotionSuiteResult(metrics=metrics, passed=False, reasons=reasons)
 
     # -----------------------
     # Backtest
     # -----------------------
+    params = fit_fn(bars)
     bt_res = run_simple_backtest(
-        bars,
-        signal_fn=lambda bs: adapter.signal(bs, adapter.fit(bs)),
+        bars_soa,
+        signal_fn=lambda _: signal_fn(bars, params),
         cfg=bt_cfg,
     )
-    bt_sharpe = annualized_sharpe(bt_res.returns, bt_cfg.periods_per_year)
-    bt_eq = equity_curve_from_returns(bt_res.returns, 1.0)
-    bt_mdd = max_drawdown(bt_eq)
-
-    # Backtest span checks
-    start = bt_res.start_ts
-    end = bt_res.end_ts
-    backtest_years = 0.0
-    includes_crisis = False
-    if start and end:
-        backtest_years = (end - start).days / 365.25
-        for w in cfg["backtest"]["crisis_periods"]:
-            b0 = _parse_dt(w["start"])
-            b1 = _parse_dt(w["end"])
-            if _overlaps(start, end, b0, b1):
-                includes_crisis = True
-                break
+    # one float64 view of the returns for every metric below
+    ret_arr = np.asarray(bt_res.returns, dtype=np.float64)
+    bt_sharpe = annualized_sharpe_np(ret_arr, bt_cfg.periods_per_year)
+    bt_mdd = max_drawdown_np(compound_equity(ret_arr, 1.0))
 
     # Slippage variation ratio (approx)
     expected_slip = float(cfg["backtest"]["costs"]["slippage_bps"])
-    realized_abs = [abs(x) for x in bt_res.slippage_bps_realized if x != 0.0]
-    realized_mean = (sum(realized_abs) / len(realized_abs)) if realized_abs else 0.0
+    slip = np.asarray(bt_res.slippage_bps_realized, dtype=np.float64)
+    realized_abs = np.abs(slip[slip != 0.0])
+    realized_mean = float(realized_abs.mean()) if realized_abs.size else 0.0
     slip_var_ratio = (realized_mean / expected_slip) if expected_slip > 0 else 0.0
 
+    metrics.update({
+        "backtest_sharpe": float(bt_sharpe),
+        "backtest_max_drawdown": float(bt_mdd),
+        "backtest_years": float(backtest_years),
+        "backtest_includes_crisis": bool(includes_crisis),
+        "backtest_slippage_variation_ratio": float(slip_var_ratio),
+    })
+
+    max_slip_ratio = float(cfg["backtest"]["slippage_variation_max_ratio"])
+    if slip_var_ratio > max_slip_ratio:
+        reasons.append(f"Slippage variation ratio too high: {slip_var_ratio:.2f} > {max_slip_ratio:.2f}")
+
+    if fail_fast and reasons:
+        return PromotionSuiteResult(metrics=metrics, passed=False, reasons=reasons)
+
     # -----------------------
     # Walk-forward
     # -----------------------
     wf_res = run_walk_forward(
         bars=bars,
-        fit_fn=lambda train_bars: adapter.fit(train_bars),
-        signal_fn=lambda bs, p: adapter.signal(bs, p),
+        fit_fn=fit_fn,
+        signal_fn=signal_fn,
         bt_cfg=bt_cfg,
         wf_cfg=wf_cfg,
+        bars_soa=bars_soa,
+        causal_signal=bool(getattr(adapter, "CAUSAL_SIGNAL", False)),
+        signal_range_fn=getattr(adapter, "signal_range", None),
+        adapter_path=adapter_path,
+        adapter_attrs=("fit", "signal", "signal_range"),
     )
 
+    metrics.update({
+        "walkforward_oos_sharpe": float(wf_res.out_of_sample_sharpe),
+        "walkforward_oos_over_is_ratio": float(wf_res.oos_over_is_ratio),
+        "walkforward_oos_max_drawdown": float(wf_res.out_of_sample_max_drawdown),
+    })
+
+    min_ratio = float(cfg["walk_forward"]["min_oos_over_is_ratio"])
+    if wf_res.oos_over_is_ratio < min_ratio:
+        reasons.append(
+            f"Walk-forward OOS/IS ratio too low: {wf_res.oos_over_is_ratio:.2f} < {min_ratio:.2f}"
+        )
+
+    if fail_fast and reasons:
+        return PromotionSuiteResult(metrics=metrics, passed=False, reasons=reasons)
+
     # -----------------------
     # Monte Carlo
     # -----------------------
     mc_res = run_monte_carlo(
         timestamps=bt_res.timestamps,
-        base_returns=bt_res.returns,
+        base_returns=ret_arr,
         cfg=mc_cfg,
     )
 
-    metrics: Dict[str, Any] = {
-        "backtest_sharpe": float(bt_sharpe),
-        "backtest_max_drawdown": float(bt_mdd),
-        "backtest_years": float(backtest_years),
-        "backtest_includes_crisis": bool(includes_crisis),
-        "backtest_slippage_variation_ratio": float(slip_var_ratio),
-
-        "walkforward_oos_sharpe": float(wf_res.out_of_sample_sharpe),
-        "walkforward_oos_over_is_ratio": float(wf_res.oos_over_is_ratio),
-        "walkforward_oos_max_drawdown": float(wf_res.out_of_sample_max_drawdown),
-
+    metrics.update({
         "mc_paths": int(mc_res.paths),
         "mc_sim_max_drawdown": float(mc_res.sim_max_drawdown_p95),
         "mc_prob_ruin": float(mc_res.prob_ruin),
         "mc_worst_case_monthly_return_p95": float(mc_res.worst_case_monthly_return_95),
-    }
-
-    # -----------------------
-    # Promotion gates (STRICT)
-    # -----------------------
-    reasons: List[str] = []
-
-    min_years = float(cfg["backtest"]["min_years"])
-    if backtest_years < min_years:
-        reasons.append(f"Backtest horizon too short: {backtest_years:.2f}y < {min_years:.2f}y")
-
-    if not includes_crisis:
-        reasons.append("Backtest does not include a required crisis window (e.g., 2008 or 2020).")
-
-    max_slip_ratio = float(cfg["backtest"]["slippage_variation_max_ratio"])
-    if slip_var_ratio > max_slip_ratio:
-        reasons.append(f"Slippage variation ratio too high: {slip_var_ratio:.2f} > {max_slip_ratio:.2f}")
-
-    min_ratio = float(cfg["walk_forward"]["min_oos_over_is_ratio"])
-    if wf_res.oos_over_is_ratio < min_ratio:
-        reasons.append(
-            f"Walk-forward OOS/IS ratio too low: {wf_res.oos_over_is_ratio:.2f} < {min_ratio:.2f}"
-        )
+    })
 
     passed = (len(reasons) == 0)
     return PromotionSuiteResult(metrics=metrics, passed=passed, reasons=reasons)
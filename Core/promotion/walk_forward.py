@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Callable, List, Any
+from pathlib import Path
+from typing import Callable, List, Any, Optional, Sequence, Tuple, Union
+import os
 
-from .backtest_engine import Bar, BacktestConfig, run_simple_backtest
-from .metrics import annualized_sharpe, equity_curve_from_returns, max_drawdown
+import numpy as np
+
+from .backtest_engine import Bar, BarArrays, BacktestConfig, run_simple_backtest
+from .metrics import annualized_sharpe_np, compound_equity
 
 
 @dataclass
@@ -13,6 +18,10 @@ class WalkForwardConfig:
     train_years: int = 3
     test_months: int = 6
     overlap: bool = True
+    # >1 runs windows in a process pool (fit_fn/signal_fn must then be
+    # importable module-level functions, or come from `adapter_path`);
+    # 0 means os.cpu_count().
+    workers: int = 1
 
 
 @dataclass
@@ -24,12 +33,121 @@ class WalkForwardResult:
     windows: int
 
 
+# (bars, bars_soa, fit_fn, signal_fn, signal_range_fn, bt_cfg, causal_signal)
+_WindowCtx = Tuple[List[Bar], BarArrays, Callable, Callable, Optional[Callable], BacktestConfig, bool]
+
+# Set once per pool worker by _init_worker so tasks only carry window bounds.
+_WORKER_CTX: Optional[_WindowCtx] = None
+
+
+def _init_worker(ctx: _WindowCtx, adapter_path: Optional[str] = None) -> None:
+    """
+    With `adapter_path`, the ctx callables arrive as attribute names: adapter
+    modules are loaded under a per-load unique name that a spawned worker
+    cannot import, so the worker loads the file itself and binds them here.
+    """
+    global _WORKER_CTX
+    if adapter_path is not None:
+        # deferred: promotion_suite imports this module
+        from .promotion_suite import _import_adapter
+
+        adapter = _import_adapter(Path(adapter_path), "wf_worker")
+        bars, bars_soa, fit_name, signal_name, range_name, bt_cfg, causal_signal = ctx
+        ctx = (
+            bars,
+            bars_soa,
+            getattr(adapter, fit_name),
+            getattr(adapter, signal_name),
+            getattr(adapter, range_name) if range_name is not None else None,
+            bt_cfg,
+            causal_signal,
+        )
+    _WORKER_CTX = ctx
+
+
+def _pool_window(bounds: Tuple[int, int, int]) -> Tuple[np.ndarray, np.ndarray]:
+    return _run_one_window(_WORKER_CTX, *bounds)
+
+
+def _run_one_window(
+    ctx: _WindowCtx, train_start: int, train_end: int, test_end: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """IS and OOS backtest returns for one (train, test) fold."""
+    bars, bars_soa, fit_fn, signal_fn, signal_range_fn, bt_cfg, causal_signal = ctx
+    train_len = train_end - train_start
+    test_len = test_end - train_end
+    context_len = test_end - train_start
+
+    train_bars = bars[train_start:train_end]
+
+    # Fit only on train window (no leakage)
+    params = fit_fn(train_bars)
+
+    # TRAIN+TEST context run (needed for OOS; also covers IS when causal)
+    if signal_range_fn is not None:
+        context_targets = signal_range_fn(bars_soa, train_start, test_end, params)
+    else:
+        context_targets = signal_fn(bars[train_start:test_end], params)
+
+    if len(context_targets) != context_len:
+        # Hard fail: strategy adapter is invalid
+        raise ValueError(
+            f"signal_fn returned {len(context_targets)} targets for {context_len} bars"
+        )
+
+    # --- In-sample backtest (train only) ---
+    if causal_signal:
+        is_targets = context_targets[:train_len]
+    else:
+        is_targets = signal_fn(train_bars, params)
+    is_bt = run_simple_backtest(
+        bars_soa.window(train_start, train_end),
+        signal_fn=lambda _, tt=is_targets: tt,
+        cfg=bt_cfg,
+    )
+
+    # --- Out-of-sample backtest (test only) with TRAIN+TEST context ---
+    test_targets = context_targets[-test_len:]
+
+    oos_bt = run_simple_backtest(
+        bars_soa.window(train_end, test_end),
+        signal_fn=lambda bs, tt=test_targets: tt,
+        cfg=bt_cfg,
+    )
+    return (
+        np.asarray(is_bt.returns, dtype=np.float64),
+        np.asarray(oos_bt.returns, dtype=np.float64),
+    )
+
+
+def _carry_drawdown(
+    returns: np.ndarray, eq: float, peak: float, mdd: float
+) -> Tuple[float, float, float]:
+    """
+    Extend a running (equity, peak, max drawdown) over one chunk of returns.
+    Chaining chunks gives the same result as max_drawdown on the stitched curve.
+    """
+    if returns.size == 0:
+        return eq, peak, mdd
+    curve = compound_equity(returns, eq)[1:]
+    run_peak = np.maximum.accumulate(curve)
+    np.maximum(run_peak, peak, out=run_peak)
+    dd = np.zeros_like(curve)
+    np.divide(run_peak - curve, run_peak, out=dd, where=run_peak > 0)
+    return float(curve[-1]), float(run_peak[-1]), max(mdd, float(dd.max()))
+
+
 def run_walk_forward(
     bars: List[Bar],
     fit_fn: Callable[[List[Bar]], Any],
     signal_fn: Callable[[List[Bar], Any], List[int]],
     bt_cfg: BacktestConfig,
     wf_cfg: WalkForwardConfig,
+    bars_soa: Optional[BarArrays] = None,
+    causal_signal: bool = False,
+    signal_range_fn: Optional[Callable[[BarArrays, int, int, Any], Sequence[int]]] = None,
+    adapter_path: Optional[Union[str, Path]] = None,
+    adapter_attrs: Tuple[str, str, str] = ("fit", "signal", "signal_range"),
 ) -> WalkForwardResult:
     """
     Walk-forward engine with correct signal-context handling:
@@ -40,6 +158,25 @@ def run_walk_forward(
       This prevents "lookback > test_len => all zeros" failures.
 
     If no valid windows, returns zeros (but that should not happen with 2015+ SPY data).
+
+    Windows are independent; `wf_cfg.workers > 1` fans them out over a
+    process pool and stitches the results back in window order.
+
+    `bars_soa` (BarArrays.from_bars(bars)) is built here if not supplied; each
+    window backtests on views of it while fit_fn/signal_fn still get Bar lists.
+
+    `causal_signal=True` declares that the target at bar i depends only on
+    bars <= i; the IS targets are then the TRAIN prefix of the TRAIN+TEST
+    signal run, saving one signal_fn call per window.
+
+    `signal_range_fn(bars_soa, start, end, params)`, when given, replaces the
+    TRAIN+TEST signal_fn call and reads the arrays directly instead of a
+    copied Bar list.
+
+    `adapter_path` names the file fit_fn/signal_fn/signal_range_fn were loaded
+    from (a strategy backtest_adapter.py) and `adapter_attrs` the attributes
+    they were read from, in that order. Pool workers then re-import the file
+    and repeat the same lookups, which works under spawn as well as fork.
     """
     if not bars or len(bars) < 500:
         return WalkForwardResult(
@@ -61,63 +198,39 @@ def run_walk_forward(
     # Step size
     step = test_len if wf_cfg.overlap else (train_len + test_len)
 
-    is_returns_all: List[float] = []
-    oos_returns_all: List[float] = []
-    oos_equity_all: List[float] = [1.0]  # for overall OOS drawdown tracking
-    windows = 0
-
     n = len(bars)
-    start = 0
-
-    while True:
-        train_start = start
-        train_end = train_start + train_len
-        test_end = train_end + test_len
+    if bars_soa is None:
+        bars_soa = BarArrays.from_bars(bars)
 
-        if test_end > n:
-            break
-
-        train_bars = bars[train_start:train_end]
-        test_bars = bars[train_end:test_end]
-
-        # Fit only on train window (no leakage)
-        params = fit_fn(train_bars)
-
-        # --- In-sample backtest (train only) ---
-        is_bt = run_simple_backtest(
-            train_bars,
-            signal_fn=lambda bs: signal_fn(bs, params),
-            cfg=bt_cfg,
-        )
-        is_returns_all.extend(is_bt.returns)
-
-        # --- Out-of-sample backtest (test only) with TRAIN+TEST context ---
-        context_bars = train_bars + test_bars
-        context_targets = signal_fn(context_bars, params)
-
-        if len(context_targets) != len(context_bars):
-            # Hard fail: strategy adapter is invalid
-            raise ValueError(
-                f"signal_fn returned {len(context_targets)} targets for {len(context_bars)} bars"
-            )
-
-        test_targets = context_targets[-len(test_bars):]
+    # (train_start, train_end, test_end) per window, in order
+    bounds: List[Tuple[int, int, int]] = []
+    start = 0
+    while start + train_len + test_len <= n:
+        bounds.append((start, start + train_len, start + train_len + test_len))
+        start += step
+    windows = len(bounds)
 
-        oos_bt = run_simple_backtest(
-            test_bars,
-            signal_fn=lambda bs, tt=test_targets: tt,
-            cfg=bt_cfg,
-        )
-        oos_returns_all.extend(oos_bt.returns)
+    ctx: _WindowCtx = (bars, bars_soa, fit_fn, signal_fn, signal_range_fn, bt_cfg, causal_signal)
+    workers = int(wf_cfg.workers) or (os.cpu_count() or 1)
+    if workers > 1 and windows > 1:
+        initargs: Tuple[Any, ...] = (ctx,)
+        if adapter_path is not None:
+            fit_attr, signal_attr, range_attr = adapter_attrs
+            names = (fit_attr, signal_attr, range_attr if signal_range_fn is not None else None)
+            initargs = ((bars, bars_soa, *names, bt_cfg, causal_signal), str(adapter_path))
+        with ProcessPoolExecutor(
+            max_workers=min(workers, windows), initializer=_init_worker, initargs=initargs
+        ) as ex:
+            results = list(ex.map(_pool_window, bounds))
+    else:
+        results = [_run_one_window(ctx, *b) for b in bounds]
 
-        # Track OOS equity for drawdown
-        eq = oos_equity_all[-1]
-        for r in oos_bt.returns:
-            eq *= (1.0 + r)
-            oos_equity_all.append(eq)
+    # per-window return arrays, concatenated in window order
+    is_chunks = [r[0] for r in results]
+    oos_chunks = [r[1] for r in results]
 
-        windows += 1
-        start += step
+    is_returns_all = np.concatenate(is_chunks) if is_chunks else np.empty(0)
+    oos_returns_all = np.concatenate(oos_chunks) if oos_chunks else np.empty(0)
 
     if windows == 0 or len(oos_returns_all) == 0 or len(is_returns_all) == 0:
         return WalkForwardResult(
@@ -128,8 +241,8 @@ def run_walk_forward(
             windows=windows,
         )
 
-    is_sharpe = float(annualized_sharpe(is_returns_all, periods_per_year))
-    oos_sharpe = float(annualized_sharpe(oos_returns_all, periods_per_year))
+    is_sharpe = annualized_sharpe_np(is_returns_all, periods_per_year)
+    oos_sharpe = annualized_sharpe_np(oos_returns_all, periods_per_year)
 
     # Ratio gate: OOS / IS (protect against divide-by-zero / negative IS sharpe)
     if is_sharpe <= 0:
@@ -137,7 +250,11 @@ def run_walk_forward(
     else:
         ratio = float(oos_sharpe / is_sharpe)
 
-    oos_mdd = float(max_drawdown(oos_equity_all))
+    # Stitched OOS drawdown, carried window to window: only one window's
+    # equity curve is alive at a time.
+    eq, peak, oos_mdd = 1.0, 1.0, 0.0
+    for chunk in oos_chunks:
+        eq, peak, oos_mdd = _carry_drawdown(chunk, eq, peak, oos_mdd)
 
     return WalkForwardResult(
         in_sample_sharpe=is_sharpe,
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any
 import time
 
 try:
@@ -21,7 +21,7 @@ class RegimeLabel(str, Enum):
     EVENT_DOMINATED = "EVENT_DOMINATED"
 
 
-@dataclass
+@dataclass(slots=True)
 class RegimeFeatures:
     # --- Vol ---
     rv_iv_z: Optional[float] = None
@@ -46,7 +46,7 @@ class RegimeFeatures:
     cross_asset_risk_flag: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class RegimeOutput:
     label: RegimeLabel
     confidence: float  # 0..100
@@ -58,21 +58,108 @@ class RegimeOutput:
     ts: float = field(default_factory=lambda: time.time())
 
 
-@dataclass
+@dataclass(slots=True)
 class _State:
     current: RegimeLabel = RegimeLabel.VOLATILITY_COMPRESSION
-    since_ts: float = field(default_factory=lambda: time.time())
+    since_ts: float = 0.0  # set by RegimeEngine.__init__
     candidate: Optional[RegimeLabel] = None
     candidate_streak: int = 0
     switch_count_window: int = 0
-    last_switch_ts: float = field(default_factory=lambda: time.time())
+    last_switch_ts: float = 0.0
+
+
+# Fixed vote order; the vote kernel returns a tuple aligned with this.
+_VOTE_KEYS: Tuple[str, ...] = (
+    "rv_iv_divergence",
+    "trend_persistence",
+    "range_expansion",
+    "liquidity",
+    "event",
+    "cross_asset",
+)
+_VOTE_STRENGTH_FIXED = {"liquidity": 1.5, "event": 1.5}
+
+# Regime scores are a list indexed by enum position; the dict form is built
+# only for RegimeOutput.
+_LABELS: Tuple[RegimeLabel, ...] = tuple(RegimeLabel)
+_LABEL_IDX: Dict[RegimeLabel, int] = {r: i for i, r in enumerate(_LABELS)}
+
+
+def _make_vote_kernel(
+    rv_hi: float, rv_lo: float,
+    align_exp: int, align_comp: int, persist_exp: float, persist_comp: float, align_amb: int,
+    rr_hi: float, rr_lo: float, rp_hi: float, rp_lo: float,
+    spread_max: float, depth_min: float,
+):
+    """
+    Vote function specialized for one config: thresholds and labels are
+    closure constants, so a call does no attribute or dict lookups.
+    """
+    VOL_EXP = RegimeLabel.VOLATILITY_EXPANSION
+    VOL_COMP = RegimeLabel.VOLATILITY_COMPRESSION
+    DIR_EXP = RegimeLabel.DIRECTIONAL_EXPANSION
+    DIR_COMP = RegimeLabel.DIRECTIONAL_COMPRESSION
+    LIQ = RegimeLabel.LIQUIDITY_VACUUM
+    EVENT = RegimeLabel.EVENT_DOMINATED
+
+    def votes(f: RegimeFeatures) -> Tuple[Optional[RegimeLabel], ...]:
+        # 1) RV vs IV divergence
+        z = f.rv_iv_z
+        rv_vote = None
+        if z is not None:
+            if z >= rv_hi:
+                rv_vote = VOL_EXP
+            elif z <= rv_lo:
+                rv_vote = VOL_COMP
+
+        # 2) Trend persistence
+        align = f.trend_alignment
+        persist = f.trend_persistence
+        trend_vote = None
+        if align is not None and persist is not None:
+            if align >= align_exp and persist > persist_exp:
+                trend_vote = DIR_EXP
+            elif align >= align_comp and persist > persist_comp:
+                trend_vote = DIR_COMP
+
+        # 3) Range expansion / compression
+        rr = f.range_expansion_ratio
+        rp = f.range_percentile
+        range_vote = None
+        if rr is not None or rp is not None:
+            expanding = (rr is not None and rr >= rr_hi) or (rp is not None and rp >= rp_hi)
+            compressing = (rr is not None and rr <= rr_lo) or (rp is not None and rp <= rp_lo)
+
+            # If direction is ambiguous, treat expansion/compression as volatility regimes
+            ambiguous = align is not None and abs(int(align)) <= align_amb
+
+            if expanding:
+                range_vote = VOL_EXP if ambiguous else DIR_EXP
+            elif compressing:
+                range_vote = VOL_COMP if ambiguous else DIR_COMP
+
+        # 4) Liquidity
+        spread = f.spread_bps
+        depth = f.depth_usd
+        liq_vote = None
+        if (spread is not None and spread > spread_max) or (depth is not None and depth < depth_min):
+            liq_vote = LIQ
+
+        # 5) Event / 6) Cross asset (optional)
+        event_vote = EVENT if (f.event_risk_flag or f.shock_flag) else None
+        cross_vote = EVENT if f.cross_asset_risk_flag else None
+
+        return (rv_vote, trend_vote, range_vote, liq_vote, event_vote, cross_vote)
+
+    return votes
 
 
 def load_rce_config(path: str) -> dict:
     if yaml is None:
         raise RuntimeError("PyYAML not installed. Run: pip install pyyaml")
-    with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    from Core.config_cache import load_yaml_cached  # needs yaml; imported only once it is known present
+
+    return load_yaml_cached(path)
 
 
 class RegimeEngine:
@@ -85,7 +172,60 @@ class RegimeEngine:
 
     def __init__(self, cfg: dict):
         self.cfg = cfg
-        self.state = _State()
+        t0 = time.time()  # one clock read for both state timestamps
+        self.state = _State(since_ts=t0, last_switch_ts=t0)
+        self._compile()
+
+    def _compile(self) -> None:
+        """Flatten engine/threshold/weight config into float attributes once."""
+        eng = self.cfg["engine"]
+        self._confirm_periods = int(eng["confirm_periods"])
+        self._min_duration_seconds = float(eng["min_duration_seconds"])
+        self._enter_conf = float(eng["enter_confidence"])
+        self._hysteresis_delta = float(eng["hysteresis_delta"])
+
+        th = self.cfg["thresholds"]
+        self._rv_hi = float(th["rv_iv_z"]["high"])
+        self._rv_lo = float(th["rv_iv_z"]["low"])
+
+        t = th["trend"]
+        self._align_exp = int(t["alignment_expansion"])
+        self._align_comp = int(t["alignment_compression"])
+        self._persist_exp = float(t["persistence_expansion"])
+        self._persist_comp = float(t["persistence_compression"])
+        self._align_amb = int(t["alignment_ambiguous_max_abs"])
+
+        rth = th["range"]
+        self._rr_hi = float(rth["expansion_ratio_hi"])
+        self._rr_lo = float(rth["compression_ratio_lo"])
+        self._rp_hi = float(rth["range_pct_hi"])
+        self._rp_lo = float(rth["range_pct_lo"])
+
+        lth = th["liquidity"]
+        self._spread_max = float(lth["spread_bps_max"])
+        self._depth_min = float(lth["depth_usd_min"])
+
+        # _signal_clarity denominators, 1e-9 floors applied once
+        self._clar_rv_hi_den = max(self._rv_hi, 1e-9)
+        self._clar_rv_lo_den = max(abs(self._rv_lo), 1e-9)
+        self._clar_ac = float(self._align_comp)
+        self._clar_ac_den = max(self._clar_ac, 1e-9)
+        self._clar_pc_den = max(self._persist_comp, 1e-9)
+        self._clar_rr_hi_den = max(self._rr_hi, 1e-9)
+        self._clar_rr_lo_den = max(self._rr_lo, 1e-9)
+
+        self._vote_kernel = _make_vote_kernel(
+            self._rv_hi, self._rv_lo,
+            self._align_exp, self._align_comp, self._persist_exp, self._persist_comp, self._align_amb,
+            self._rr_hi, self._rr_lo, self._rp_hi, self._rp_lo,
+            self._spread_max, self._depth_min,
+        )
+
+        # per-vote weight * fixed strength, aligned with _VOTE_KEYS
+        w = self.cfg["votes"]["weights"]
+        self._vote_weights: Tuple[float, ...] = tuple(
+            float(w.get(k, 1.0)) * _VOTE_STRENGTH_FIXED.get(k, 1.0) for k in _VOTE_KEYS
+        )
 
     @classmethod
     def from_yaml(cls, path: str) -> "RegimeEngine":
@@ -94,29 +234,36 @@ class RegimeEngine:
     def update(self, feats: RegimeFeatures, now_ts: Optional[float] = None) -> RegimeOutput:
         now = now_ts if now_ts is not None else time.time()
 
-        votes = self._compute_votes(feats)
-        scores = self._aggregate_scores(votes, feats)
-
-        # Ensure every regime has a score key (even if 0)
-        for r in RegimeLabel:
-            scores.setdefault(r, 0.0)
-
-        candidate = max(scores, key=scores.get)
+        vote_tuple = self._vote_kernel(feats)
+        scores = self._aggregate_scores(vote_tuple, feats)
+
+        # Highest score wins; ties go to the earliest vote, then enum order
+        # (the order max() saw when scores was a vote-ordered dict).
+        best_i = -1
+        best_s = 0.0
+        for reg in vote_tuple:
+            if reg is not None:
+                i = _LABEL_IDX[reg]
+                if best_i < 0 or scores[i] > best_s:
+                    best_i, best_s = i, scores[i]
+        for i, sc in enumerate(scores):
+            if best_i < 0 or sc > best_s:
+                best_i, best_s = i, sc
+        candidate = _LABELS[best_i]
         current = self.state.current
 
-        confidence = self._confidence_score(votes=votes, feats=feats, now=now, chosen=candidate)
+        confidence = self._confidence_score(votes=vote_tuple, feats=feats, now=now, chosen=candidate)
         transition_zone = False
 
-        eng = self.cfg["engine"]
-        confirm_periods = int(eng["confirm_periods"])
-        min_duration_seconds = float(eng["min_duration_seconds"])
-        enter_conf = float(eng["enter_confidence"])
-        hysteresis_delta = float(eng["hysteresis_delta"])
+        confirm_periods = self._confirm_periods
+        min_duration_seconds = self._min_duration_seconds
+        enter_conf = self._enter_conf
+        hysteresis_delta = self._hysteresis_delta
 
         # Hysteresis: candidate must beat current by delta (if current != candidate)
         margin_ok = True
         if candidate != current:
-            margin_ok = (scores[candidate] - scores[current]) >= hysteresis_delta
+            margin_ok = (best_s - scores[_LABEL_IDX[current]]) >= hysteresis_delta
 
         # Minimum duration: can't switch too fast after last switch
         min_duration_ok = (now - self.state.since_ts) >= min_duration_seconds
@@ -153,8 +300,8 @@ class RegimeEngine:
             confidence=confidence,
             transition_zone=transition_zone,
             candidate_label=self.state.candidate if transition_zone else None,
-            scores=scores,
-            votes=votes,
+            scores=dict(zip(_LABELS, scores)),
+            votes=dict(zip(_VOTE_KEYS, vote_tuple)),
             controls=controls,
             ts=now,
         )
@@ -162,109 +309,29 @@ class RegimeEngine:
     # ----------------------------
     # Votes
     # ----------------------------
-    def _compute_votes(self, f: RegimeFeatures) -> Dict[str, Optional[RegimeLabel]]:
-        th = self.cfg["thresholds"]
-        out: Dict[str, Optional[RegimeLabel]] = {}
-
-        # 1) RV vs IV divergence
-        z = f.rv_iv_z
-        if z is None:
-            out["rv_iv_divergence"] = None
-        else:
-            if z >= float(th["rv_iv_z"]["high"]):
-                out["rv_iv_divergence"] = RegimeLabel.VOLATILITY_EXPANSION
-            elif z <= float(th["rv_iv_z"]["low"]):
-                out["rv_iv_divergence"] = RegimeLabel.VOLATILITY_COMPRESSION
-            else:
-                out["rv_iv_divergence"] = None
-
-        # 2) Trend persistence
-        align = f.trend_alignment
-        persist = f.trend_persistence
-        if align is None or persist is None:
-            out["trend_persistence"] = None
-        else:
-            t = th["trend"]
-            if align >= int(t["alignment_expansion"]) and persist > float(t["persistence_expansion"]):
-                out["trend_persistence"] = RegimeLabel.DIRECTIONAL_EXPANSION
-            elif align >= int(t["alignment_compression"]) and persist > float(t["persistence_compression"]):
-                out["trend_persistence"] = RegimeLabel.DIRECTIONAL_COMPRESSION
-            else:
-                out["trend_persistence"] = None
-
-        # 3) Range expansion / compression
-        rr = f.range_expansion_ratio
-        rp = f.range_percentile
-        if rr is None and rp is None:
-            out["range_expansion"] = None
-        else:
-            rth = th["range"]
-            expanding = (rr is not None and rr >= float(rth["expansion_ratio_hi"])) or \
-                        (rp is not None and rp >= float(rth["range_pct_hi"]))
-            compressing = (rr is not None and rr <= float(rth["compression_ratio_lo"])) or \
-                          (rp is not None and rp <= float(rth["range_pct_lo"]))
-
-            # If direction is ambiguous, treat expansion/compression as volatility regimes
-            ambiguous = False
-            if f.trend_alignment is not None:
-                ambiguous = abs(int(f.trend_alignment)) <= int(th["trend"]["alignment_ambiguous_max_abs"])
-
-            if expanding:
-                out["range_expansion"] = RegimeLabel.VOLATILITY_EXPANSION if ambiguous else RegimeLabel.DIRECTIONAL_EXPANSION
-            elif compressing:
-                out["range_expansion"] = RegimeLabel.VOLATILITY_COMPRESSION if ambiguous else RegimeLabel.DIRECTIONAL_COMPRESSION
-            else:
-                out["range_expansion"] = None
-
-        # 4) Liquidity
-        spread = f.spread_bps
-        depth = f.depth_usd
-        if spread is None and depth is None:
-            out["liquidity"] = None
-        else:
-            lth = th["liquidity"]
-            spread_bad = (spread is not None and spread > float(lth["spread_bps_max"]))
-            depth_bad = (depth is not None and depth < float(lth["depth_usd_min"]))
-            out["liquidity"] = RegimeLabel.LIQUIDITY_VACUUM if (spread_bad or depth_bad) else None
-
-        # 5) Event
-        out["event"] = RegimeLabel.EVENT_DOMINATED if (f.event_risk_flag or f.shock_flag) else None
-
-        # 6) Cross asset (optional)
-        out["cross_asset"] = RegimeLabel.EVENT_DOMINATED if f.cross_asset_risk_flag else None
-
-        return out
-
-    def _aggregate_scores(self, votes: Dict[str, Optional[RegimeLabel]], feats: RegimeFeatures) -> Dict[RegimeLabel, float]:
+    def _aggregate_scores(self, votes: Tuple[Optional[RegimeLabel], ...], feats: RegimeFeatures) -> List[float]:
+        """Per-regime scores indexed like _LABELS."""
         # Weighted vote count + small strength shaping when available
-        w = self.cfg["votes"]["weights"]
-        scores: Dict[RegimeLabel, float] = {}
-
-        def add(reg: RegimeLabel, amount: float):
-            scores[reg] = scores.get(reg, 0.0) + amount
+        scores = [0.0] * len(_LABELS)
+        weights = self._vote_weights
 
-        for k, reg in votes.items():
+        for i, reg in enumerate(votes):
             if reg is None:
                 continue
-            base = float(w.get(k, 1.0))
-            # Strength hints (optional)
-            strength = 1.0
-            if k == "rv_iv_divergence" and feats.rv_iv_z is not None:
-                strength = min(2.0, max(0.5, abs(feats.rv_iv_z) / 2.0))
-            if k == "liquidity":
-                strength = 1.5
-            if k == "event":
-                strength = 1.5
-            add(reg, base * strength)
+            amount = weights[i]
+            # Strength hint: rv_iv_divergence scales with |z| (liquidity/event are folded into weights)
+            if i == 0 and feats.rv_iv_z is not None:
+                amount *= min(2.0, max(0.5, abs(feats.rv_iv_z) / 2.0))
+            scores[_LABEL_IDX[reg]] += amount
 
         return scores
 
     # ----------------------------
     # Confidence
     # ----------------------------
-    def _confidence_score(self, votes: Dict[str, Optional[RegimeLabel]], feats: RegimeFeatures, now: float, chosen: RegimeLabel) -> float:
+    def _confidence_score(self, votes: Tuple[Optional[RegimeLabel], ...], feats: RegimeFeatures, now: float, chosen: RegimeLabel) -> float:
         # Agreement %
-        active_votes = [v for v in votes.values() if v is not None]
+        active_votes = [v for v in votes if v is not None]
         if not active_votes:
             agreement = 0.0
         else:
@@ -298,36 +365,38 @@ class RegimeEngine:
         return float(max(0.0, min(100.0, conf)))
 
     def _signal_clarity(self, f: RegimeFeatures) -> float:
-        th = self.cfg["thresholds"]
-        distances = []
+        # Running sum/count of distances (same left-to-right order as a list sum)
+        total = 0.0
+        count = 0
 
         # rv_iv_z clarity
-        if f.rv_iv_z is not None:
-            hi = float(th["rv_iv_z"]["high"])
-            lo = float(th["rv_iv_z"]["low"])
-            if f.rv_iv_z >= hi:
-                distances.append((f.rv_iv_z - hi) / max(hi, 1e-9))
-            elif f.rv_iv_z <= lo:
-                distances.append((lo - f.rv_iv_z) / max(abs(lo), 1e-9))
+        z = f.rv_iv_z
+        if z is not None:
+            if z >= self._rv_hi:
+                total += (z - self._rv_hi) / self._clar_rv_hi_den
+                count += 1
+            elif z <= self._rv_lo:
+                total += (self._rv_lo - z) / self._clar_rv_lo_den
+                count += 1
 
         # trend clarity
         if f.trend_alignment is not None and f.trend_persistence is not None:
-            t = th["trend"]
             a = float(f.trend_alignment)
             p = float(f.trend_persistence)
-            distances.append(max(0.0, (a - float(t["alignment_compression"])) / max(float(t["alignment_compression"]), 1e-9)))
-            distances.append(max(0.0, (p - float(t["persistence_compression"])) / max(float(t["persistence_compression"]), 1e-9)))
+            total += max(0.0, (a - self._clar_ac) / self._clar_ac_den)
+            total += max(0.0, (p - self._persist_comp) / self._clar_pc_den)
+            count += 2
 
         # range clarity
         if f.range_expansion_ratio is not None:
-            rth = th["range"]
             rr = float(f.range_expansion_ratio)
-            distances.append(max(0.0, (rr - float(rth["expansion_ratio_hi"])) / max(float(rth["expansion_ratio_hi"]), 1e-9)))
-            distances.append(max(0.0, (float(rth["compression_ratio_lo"]) - rr) / max(float(rth["compression_ratio_lo"]), 1e-9)))
+            total += max(0.0, (rr - self._rr_hi) / self._clar_rr_hi_den)
+            total += max(0.0, (self._rr_lo - rr) / self._clar_rr_lo_den)
+            count += 2
 
-        if not distances:
+        if not count:
             return 50.0  # neutral
-        avg = sum(distances) / len(distances)
+        avg = total / count
         return float(max(0.0, min(100.0, avg * 100.0)))
 
     # ----------------------------
@@ -1,4 +1,4 @@
-from .base import AlphaContext, SignalDecision, SignalModule
+from .base import AlphaContext, SignalBatch, SignalDecision, SignalModule
 from .structural import TrendPersistenceSignal, VolatilityExpansionSignal, LiquiditySeekingSignal, DealerGammaSignal
 from .statistical import MeanReversionSignal, LeadLagSignal, IntradaySeasonalitySignal
 from .execution import QueuePositionSignal, SpreadCaptureSignal, SlippageMinSignal, AdverseSelectionSignal
@@ -2,19 +2,29 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, Optional
+from functools import wraps
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Shared read-only default for decisions without outputs (no per-call dict).
+_EMPTY_OUTPUTS: Mapping[str, Any] = MappingProxyType({})
 
 
 def _sign(x: float) -> int:
-    if x > 0:
-        return 1
-    if x < 0:
-        return -1
-    return 0
+    return (x > 0) - (x < 0)
+
 
+# Two-float min/max without the builtins' variadic call overhead (~4x faster
+# on scalars). Same NaN behaviour as min()/max(): the first argument is kept
+# when the comparison is unordered, unlike C fmin/fmax.
+def _fmin(a: float, b: float) -> float:
+    return b if b < a else a
 
-def _clamp(x: float, lo: float, hi: float) -> float:
-    return lo if x < lo else hi if x > hi else x
+
+def _fmax(a: float, b: float) -> float:
+    return b if b > a else a
 
 
 def _to_float(x: Any, default: Optional[float] = None) -> Optional[float]:
@@ -26,7 +36,51 @@ def _to_float(x: Any, default: Optional[float] = None) -> Optional[float]:
         return default
 
 
-@dataclass(frozen=True)
+def _memo_decision(maxsize: int = 1024):
+    """
+    Memoize a module's decision step per instance. The wrapped method must be
+    a pure function of its (hashable, already coerced) arguments: feature
+    values plus the thresholds read from cfg, so a cfg change is a cache miss.
+    Hits share one SignalDecision, so its outputs are handed out read-only.
+    Calls with a NaN argument are not stored (NaN keys can never hit).
+    """
+
+    def deco(fn):
+        name = fn.__name__
+
+        @wraps(fn)
+        def method(self, *args):
+            memo = self._memo.get(name)
+            if memo is None:
+                memo = self._memo[name] = {}
+            d = memo.get(args)
+            if d is None:
+                d = fn(self, *args)
+                if d.outputs:
+                    # the outputs dict is fresh and private to d; just seal it
+                    d = SignalDecision(
+                        d.module, d.kind, d.active, d.direction, d.score, d.confidence, d.urgency, d.reason,
+                        MappingProxyType(d.outputs),
+                    )
+                if all(a == a for a in args):
+                    if len(memo) >= maxsize:
+                        memo.clear()
+                    memo[args] = d
+            return d
+
+        return method
+
+    return deco
+
+
+def _feature_column(ctxs: Sequence["AlphaContext"], key: str, default: float = np.nan) -> np.ndarray:
+    """ctx.f(key) coerced like _to_float for every context; missing -> default (NaN)."""
+    return np.fromiter(
+        (_to_float(c.features.get(key), default) for c in ctxs), dtype=np.float64, count=len(ctxs)
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class AlphaContext:
     symbol: str
     now: datetime
@@ -46,7 +100,7 @@ class AlphaContext:
         return self.meta.get(key, default)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SignalDecision:
     module: str
     kind: str  # structural | statistical | execution
@@ -56,7 +110,27 @@ class SignalDecision:
     confidence: float = 0.0
     urgency: float = 0.0
     reason: str = ""
-    outputs: Dict[str, Any] = field(default_factory=dict)
+    # dataclasses reject a mappingproxy default; the factory hands back the shared one.
+    outputs: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_OUTPUTS)
+
+    @classmethod
+    def build(
+        cls,
+        module: str,
+        kind: str,
+        active: bool,
+        direction: int,
+        score: float,
+        confidence: float,
+        urgency: float,
+        reason: str,
+        outputs: Optional[Mapping[str, Any]],
+    ) -> "SignalDecision":
+        """
+        Positional fast path for module code that already holds correctly
+        typed values; no coercion happens here.
+        """
+        return cls(module, kind, active, direction, score, confidence, urgency, reason, outputs or _EMPTY_OUTPUTS)
 
     def urgency_tier(self) -> str:
         u = float(self.urgency or 0.0)
@@ -69,27 +143,101 @@ class SignalDecision:
         return "LOW"
 
 
+@dataclass(frozen=True)
+class SignalBatch:
+    """
+    Column-wise compute() results for a batch of contexts, one row per
+    context, each matching what compute() reports for it. `state` indexes
+    `state_labels` for modules that report a categorical state.
+    """
+    active: np.ndarray
+    direction: np.ndarray
+    score: np.ndarray
+    confidence: np.ndarray
+    urgency: np.ndarray
+    state: Optional[np.ndarray] = None
+    state_labels: Tuple[str, ...] = ()
+
+
 class SignalModule:
+    __slots__ = ("_params_src", "_params_cached", "_memo")
+
     name: str = "base"
     kind: str = "structural"
     priority: str = "MEDIUM"
 
+    # Numeric settings as (cfg section, key, default); _params() casts them.
+    _PARAMS: Tuple[Tuple[str, str, float], ...] = ()
+
+    def __init__(self) -> None:
+        self._params_src: Optional[Tuple[Any, ...]] = None
+        self._params_cached: Optional[SimpleNamespace] = None
+        # per-instance _memo_decision caches, keyed by method name
+        self._memo: Dict[str, Dict[Tuple[Any, ...], SignalDecision]] = {}
+
     def compute(self, ctx: AlphaContext, cfg: Dict[str, Any]) -> SignalDecision:
         raise NotImplementedError
 
-    def _inactive(self, reason: str) -> SignalDecision:
-        return SignalDecision(
-            module=self.name,
-            kind=self.kind,
-            active=False,
-            direction=0,
-            score=0.0,
-            confidence=0.0,
-            urgency=0.0,
-            reason=reason,
-            outputs={},
+    def compute_batch(self, ctxs: Sequence[AlphaContext], cfg: Dict[str, Any]) -> SignalBatch:
+        """
+        compute() over many contexts. This fallback loops the scalar path;
+        modules with a vectorized kernel override it.
+        """
+        decs = [self.compute(c, cfg) for c in ctxs]
+        n = len(decs)
+        return SignalBatch(
+            active=np.fromiter((d.active for d in decs), dtype=bool, count=n),
+            direction=np.fromiter((d.direction for d in decs), dtype=np.int8, count=n),
+            score=np.fromiter((d.score for d in decs), dtype=np.float64, count=n),
+            confidence=np.fromiter((d.confidence for d in decs), dtype=np.float64, count=n),
+            urgency=np.fromiter((d.urgency for d in decs), dtype=np.float64, count=n),
         )
 
+    def _mk_batch(
+        self,
+        active: np.ndarray,
+        direction: np.ndarray,
+        score: np.ndarray,
+        confidence: np.ndarray,
+        urgency: np.ndarray,
+        state: Optional[np.ndarray] = None,
+        state_labels: Tuple[str, ...] = (),
+    ) -> SignalBatch:
+        """Batch counterpart of _mk: same [0, 1] clamps, int8 directions."""
+        return SignalBatch(
+            active=active,
+            direction=direction.astype(np.int8),
+            score=score,
+            confidence=np.clip(confidence, 0.0, 1.0, out=confidence),
+            urgency=np.clip(urgency, 0.0, 1.0, out=urgency),
+            state=state,
+            state_labels=state_labels,
+        )
+
+    def _param_source(self, cfg: Mapping[str, Any]) -> Tuple[Any, ...]:
+        """The raw cfg values _params() is built from, in _PARAMS order."""
+        return tuple([(cfg.get(section, {}) or {}).get(k, default) for section, k, default in self._PARAMS])
+
+    def _build_params(self, cfg: Mapping[str, Any], src: Tuple[Any, ...]) -> SimpleNamespace:
+        return SimpleNamespace(**{p[1]: float(v) for p, v in zip(self._PARAMS, src)})
+
+    def _params(self, cfg: Mapping[str, Any]) -> SimpleNamespace:
+        """
+        This module's _PARAMS read from cfg and cast to float. The casts are
+        kept until the raw values change, so a cfg edited in place (or a new
+        cfg with other values) is picked up on the next call.
+        """
+        src = self._param_source(cfg)
+        if src == self._params_src:
+            return self._params_cached
+        params = self._build_params(cfg, src)
+        self._params_src = src
+        self._params_cached = params
+        return params
+
+    def _inactive(self, reason: str) -> SignalDecision:
+        return SignalDecision.build(self.name, self.kind, False, 0, 0.0, 0.0, 0.0, reason, None)
+
     def _mk(
         self,
         *,
@@ -101,16 +249,17 @@ class SignalModule:
         reason: str = "",
         outputs: Optional[Dict[str, Any]] = None,
     ) -> SignalDecision:
-        return SignalDecision(
-            module=self.name,
-            kind=self.kind,
-            active=bool(active),
-            direction=int(direction),
-            score=float(score),
-            confidence=_clamp(float(confidence), 0.0, 1.0),
-            urgency=_clamp(float(urgency), 0.0, 1.0),
-            reason=reason or "",
-            outputs=outputs or {},
+        # Modules pass bool/int/float already; only the range clamps remain.
+        return SignalDecision.build(
+            self.name,
+            self.kind,
+            active,
+            direction,
+            score,
+            0.0 if confidence < 0.0 else 1.0 if confidence > 1.0 else confidence,
+            0.0 if urgency < 0.0 else 1.0 if urgency > 1.0 else urgency,
+            reason or "",
+            outputs,
         )
 
     def _sign(self, x: float) -> int:
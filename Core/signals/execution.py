@@ -1,31 +1,44 @@
 from __future__ import annotations
 
-from typing import Dict, Any
+from typing import Dict, Any, Sequence
 
-from .base import AlphaContext, SignalModule
+import numpy as np
+
+from .base import AlphaContext, SignalBatch, SignalModule, _feature_column, _fmax, _fmin, _to_float
+
+_EXEC_METHODS = ("market", "twap", "vwap")
+
+# signal_urgency tier names -> urgency value (QueuePositionSignal)
+_URGENCY_MAP = {"LOW": 0.1, "NORMAL": 0.4, "HIGH": 0.7, "CRITICAL": 0.9}
+
+
+def _urgency_value(urgency: Any) -> float:
+    """signal_urgency as a float: numbers pass through, tier names map, else NORMAL."""
+    if type(urgency) is float:
+        return urgency
+    if isinstance(urgency, (int, float)):
+        return float(urgency)
+    if isinstance(urgency, str):
+        return _URGENCY_MAP.get(urgency.strip().upper(), 0.4)
+    return 0.4
 
 
 class QueuePositionSignal(SignalModule):
     name = "queue_position"
     kind = "execution"
     priority = "CRITICAL"
+    _PARAMS = (
+        ("thresholds", "max_wait_time_s", 3.0),
+    )
 
     def compute(self, ctx: AlphaContext, cfg: Dict[str, Any]):
-        fp = self._to_float(ctx.f("fill_probability", None), None)
-        eft = self._to_float(ctx.f("expected_fill_time_s", None), None)
+        fp = _to_float(ctx.f("fill_probability", None), None)
+        eft = _to_float(ctx.f("expected_fill_time_s", None), None)
         if fp is None or eft is None:
             return self._inactive("missing:fill_probability|expected_fill_time_s")
 
-        max_wait = float((cfg.get("thresholds", {}) or {}).get("max_wait_time_s", 3.0))
-        urgency = ctx.m("signal_urgency", None)
-
-        if isinstance(urgency, (int, float)):
-            urg_f = float(urgency)
-        elif isinstance(urgency, str):
-            t = urgency.strip().upper()
-            urg_f = {"LOW": 0.1, "NORMAL": 0.4, "HIGH": 0.7, "CRITICAL": 0.9}.get(t, 0.4)
-        else:
-            urg_f = 0.4
+        max_wait = self._params(cfg).max_wait_time_s
+        urg_f = _urgency_value(ctx.m("signal_urgency", None))
 
         if fp < 0.3 or eft > max_wait:
             action = "aggressive"
@@ -34,13 +47,13 @@ class QueuePositionSignal(SignalModule):
         else:
             action = "repricing" if urg_f >= 0.6 else "passive"
 
-        conf = min(1.0, 0.5 + 0.5 * abs(fp - 0.5) * 2.0)
+        conf = _fmin(1.0, 0.5 + 0.5 * abs(fp - 0.5) * 2.0)
         return self._mk(
             active=True,
             direction=0,
             score=0.0,
             confidence=conf,
-            urgency=min(1.0, urg_f),
+            urgency=_fmin(1.0, urg_f),
             reason="ok",
             outputs={"order_action": action, "fill_probability": fp, "expected_fill_time_s": eft},
         )
@@ -50,42 +63,66 @@ class SpreadCaptureSignal(SignalModule):
     name = "spread_capture"
     kind = "execution"
     priority = "CRITICAL"
+    _PARAMS = (
+        ("thresholds", "min_profitable_spread_bps", 8.0),
+    )
 
     def compute(self, ctx: AlphaContext, cfg: Dict[str, Any]):
-        spread_bps = self._to_float(ctx.q("spread_bps", ctx.f("spread_bps", None)), None)
+        spread_bps = _to_float(ctx.q("spread_bps", ctx.f("spread_bps", None)), None)
         if spread_bps is None:
             return self._inactive("missing:spread_bps")
 
-        thr = float((cfg.get("thresholds", {}) or {}).get("min_profitable_spread_bps", 8.0))
-        active = float(spread_bps) >= thr
+        thr = self._params(cfg).min_profitable_spread_bps
+        active = spread_bps >= thr
 
         return self._mk(
             active=active,
             direction=0,
             score=0.0,
-            confidence=min(1.0, float(spread_bps) / max(thr, 1e-9)) if active else 0.0,
+            confidence=_fmin(1.0, spread_bps / _fmax(thr, 1e-9)) if active else 0.0,
             urgency=0.10 if active else 0.0,
             reason="ok" if active else "spread_too_tight",
             outputs={"spread_capture_active": bool(active), "spread_bps": spread_bps},
         )
 
 
+    def compute_batch(self, ctxs: Sequence[AlphaContext], cfg: Dict[str, Any]) -> SignalBatch:
+        thr = self._params(cfg).min_profitable_spread_bps
+        # quote first, features as the fallback (ctx.q(key, ctx.f(key)))
+        spread = np.fromiter(
+            (_to_float(c.quote.get("spread_bps", c.features.get("spread_bps")), np.nan) for c in ctxs),
+            dtype=np.float64,
+            count=len(ctxs),
+        )
+        active = spread >= thr
+        return self._mk_batch(
+            active,
+            np.zeros(len(ctxs)),
+            np.zeros(len(ctxs)),
+            np.where(active, np.minimum(1.0, spread / _fmax(thr, 1e-9)), 0.0),
+            np.where(active, 0.10, 0.0),
+        )
+
+
 class SlippageMinSignal(SignalModule):
     name = "slippage_min"
     kind = "execution"
     priority = "CRITICAL"
+    _PARAMS = (
+        ("thresholds", "low_volatility_threshold", 0.01),
+    )
 
     def compute(self, ctx: AlphaContext, cfg: Dict[str, Any]):
-        order_size = self._to_float(ctx.m("order_size", None), None)
-        avg_vol_per_min = self._to_float(ctx.f("avg_volume_per_minute", None), None)
-        volatility = self._to_float(ctx.f("volatility", None), None)
+        order_size = _to_float(ctx.m("order_size", None), None)
+        avg_vol_per_min = _to_float(ctx.f("avg_volume_per_minute", None), None)
+        volatility = _to_float(ctx.f("volatility", None), None)
 
         if order_size is None or avg_vol_per_min is None or volatility is None:
             return self._inactive("missing:order_size|avg_volume_per_minute|volatility")
 
-        vol_thr = float((cfg.get("thresholds", {}) or {}).get("low_volatility_threshold", 0.01))
-        if float(order_size) > float(avg_vol_per_min) * 0.1:
-            method = "twap" if float(volatility) < vol_thr else "vwap"
+        vol_thr = self._params(cfg).low_volatility_threshold
+        if order_size > avg_vol_per_min * 0.1:
+            method = "twap" if volatility < vol_thr else "vwap"
         else:
             method = "market"
 
@@ -100,19 +137,46 @@ class SlippageMinSignal(SignalModule):
         )
 
 
+    def compute_batch(self, ctxs: Sequence[AlphaContext], cfg: Dict[str, Any]) -> SignalBatch:
+        vol_thr = self._params(cfg).low_volatility_threshold
+        n = len(ctxs)
+        order_size = np.fromiter(
+            (_to_float(c.meta.get("order_size"), np.nan) for c in ctxs), dtype=np.float64, count=n
+        )
+        avg_vol = _feature_column(ctxs, "avg_volume_per_minute")
+        volatility = _feature_column(ctxs, "volatility")
+        active = ~(np.isnan(order_size) | np.isnan(avg_vol) | np.isnan(volatility))
+
+        sliced = order_size > avg_vol * 0.1
+        method = np.where(sliced, np.where(volatility < vol_thr, 1, 2), 0).astype(np.int8)
+        return self._mk_batch(
+            active,
+            np.zeros(n),
+            np.zeros(n),
+            np.where(active, 0.70, 0.0),
+            np.where(active, 0.20, 0.0),
+            np.where(active, method, 0).astype(np.int8),
+            _EXEC_METHODS,
+        )
+
+
 class AdverseSelectionSignal(SignalModule):
     name = "adverse_selection"
     kind = "execution"
     priority = "CRITICAL"
+    _PARAMS = (
+        ("thresholds", "score_threshold", 70.0),
+        ("thresholds", "latency_ms_threshold", 50.0),
+    )
 
     def compute(self, ctx: AlphaContext, cfg: Dict[str, Any]):
-        adverse_score = self._to_float(ctx.f("adverse_selection_score", None), None)
+        adverse_score = _to_float(ctx.f("adverse_selection_score", None), None)
 
-        thr = cfg.get("thresholds", {}) or {}
-        score_thr = float(thr.get("score_threshold", 70.0))
+        p = self._params(cfg)
+        score_thr = p.score_threshold
 
         if adverse_score is not None:
-            detected = float(adverse_score) > score_thr
+            detected = adverse_score > score_thr
             return self._mk(
                 active=True,
                 direction=0,
@@ -123,11 +187,11 @@ class AdverseSelectionSignal(SignalModule):
                 outputs={"adverse_selection_detected": bool(detected), "adverse_selection_score": adverse_score},
             )
 
-        latency_ms = self._to_float(ctx.f("latency_ms", None), None)
+        latency_ms = _to_float(ctx.f("latency_ms", None), None)
         stale = bool(ctx.f("stale_quote_flag", False))
 
-        latency_thr = float(thr.get("latency_ms_threshold", 50.0))
-        detected = bool(stale) or (latency_ms is not None and float(latency_ms) > latency_thr)
+        latency_thr = p.latency_ms_threshold
+        detected = bool(stale) or (latency_ms is not None and latency_ms > latency_thr)
 
         return self._mk(
             active=True,
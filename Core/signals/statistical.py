@@ -5,47 +5,107 @@ try:
 except Exception:
     ZoneInfo = None  # type: ignore
 
-from typing import Dict, Any
+# Resolved once; None when zoneinfo or its tz database is unavailable.
+try:
+    _NY_TZ = ZoneInfo("America/New_York") if ZoneInfo is not None else None
+except Exception:
+    _NY_TZ = None
+
+from typing import Dict, Any, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .base import AlphaContext, SignalBatch, SignalModule, _feature_column, _fmax, _fmin, _sign, _to_float
+
+
+# New York session windows: (start_min, end_min, bias, size_mult), end exclusive.
+_SEASONALITY = (
+    (9 * 60 + 30, 10 * 60, "breakout", 1.0),
+    (12 * 60, 13 * 60, "mean_reversion", 0.6),
+    (15 * 60, 16 * 60, "trend", 1.2),
+)
 
-from .base import AlphaContext, SignalModule
+
+# Numeric cores: plain float/None in, plain tuple out (see structural.py).
+def _mean_reversion_core(
+    z: Optional[float], boll: Optional[float], sr: Optional[float]
+) -> Tuple[int, float, float, float]:
+    """(direction, score, confidence, urgency); direction 0 means no deviation."""
+    direction = 0
+    if z is not None:
+        if z > 2.5:
+            direction = -1
+        elif z < -2.5:
+            direction = 1
+    if direction == 0 and boll is not None:
+        if boll > 0.95:
+            direction = -1
+        elif boll < 0.05:
+            direction = 1
+
+    if direction == 0:
+        return 0, 0.0, 0.0, 0.0
+
+    conf = 0.60 if sr is None else _fmax(0.0, _fmin(1.0, sr / 0.50))
+    urg = _fmin(1.0, 0.25 + 0.65 * conf)
+    mag = abs(z) if z is not None else 2.5
+    return direction, direction * _fmin(4.0, mag / 2.5), conf, urg
+
+
+def _lead_lag_core(
+    leader_move: float, lead_strength: float, beta: float, leader_move_thr: float
+) -> Tuple[float, int, float, float, float]:
+    """(expected lagger move, direction, score, confidence, urgency)"""
+    expected = leader_move * beta * lead_strength
+    direction = _sign(expected)
+    conf = _fmin(1.0, abs(lead_strength))
+    urg = _fmin(1.0, 0.30 + 0.60 * conf)
+    score = direction * _fmin(3.0, abs(expected) / _fmax(leader_move_thr, 1e-9))
+    return expected, direction, score, conf, urg
 
 
 class MeanReversionSignal(SignalModule):
     name = "mean_reversion"
     kind = "statistical"
     priority = "MEDIUM"
+    _PARAMS = (
+        ("activation", "min_success_rate", 0.55),
+    )
+    _DEFAULT_REGIMES = ("DIRECTIONAL_COMPRESSION", "VOLATILITY_COMPRESSION")
 
-    def compute(self, ctx: AlphaContext, cfg: Dict[str, Any]):
+    def _param_source(self, cfg: Dict[str, Any]):
         activation = cfg.get("activation", {}) or {}
-        allowed_regimes = [str(x).upper() for x in activation.get("regimes_allow", ["DIRECTIONAL_COMPRESSION", "VOLATILITY_COMPRESSION"])]
+        return super()._param_source(cfg) + (tuple(activation.get("regimes_allow", self._DEFAULT_REGIMES)),)
 
-        if str(ctx.regime_label or "UNKNOWN").upper() not in allowed_regimes:
+    def _build_params(self, cfg: Dict[str, Any], src):
+        p = super()._build_params(cfg, src[:-1])
+        # cached alongside the thresholds: upper-cased once per allow list, not per tick
+        p.allowed_regimes = frozenset(str(x).upper() for x in src[-1])
+        return p
+
+    def compute(self, ctx: AlphaContext, cfg: Dict[str, Any]):
+        p = self._params(cfg)
+
+        # regime gate first: rejected ticks touch no features
+        label = ctx.regime_label or "UNKNOWN"
+        allowed = type(label) is str and label in p.allowed_regimes
+        if not allowed and str(label).upper() not in p.allowed_regimes:
             return self._inactive(f"regime_block({ctx.regime_label})")
 
         if bool(ctx.m("structural_trend_override", False)):
             return self._inactive("blocked_by_structural_trend")
 
-        z = self._to_float(ctx.f("z_score_vwap", None), None)
-        boll = self._to_float(ctx.f("bollinger_position", None), None)
+        z = _to_float(ctx.f("z_score_vwap", None), None)
+        boll = _to_float(ctx.f("bollinger_position", None), None)
         if z is None and boll is None:
             return self._inactive("missing:z_score_vwap|bollinger_position")
 
-        sr = self._to_float(ctx.f("reversion_success_rate", None), None)
-        sr_min = float(activation.get("min_success_rate", 0.55))
+        sr = _to_float(ctx.f("reversion_success_rate", None), None)
+        sr_min = p.min_success_rate
         if sr is not None and sr < sr_min:
             return self._inactive(f"low_success_rate({sr:.2f} < {sr_min:.2f})")
 
-        direction = 0
-        if z is not None:
-            if z > 2.5:
-                direction = -1
-            elif z < -2.5:
-                direction = 1
-        if direction == 0 and boll is not None:
-            if boll > 0.95:
-                direction = -1
-            elif boll < 0.05:
-                direction = 1
+        direction, score, conf, urg = _mean_reversion_core(z, boll, sr)
 
         if direction == 0:
             return self._mk(
@@ -58,11 +118,6 @@ class MeanReversionSignal(SignalModule):
                 outputs={"reversion_signal": 0, "z_score_vwap": z, "bollinger_position": boll, "success_rate": sr},
             )
 
-        conf = 0.60 if sr is None else max(0.0, min(1.0, sr / 0.50))
-        urg = min(1.0, 0.25 + 0.65 * conf)
-        mag = abs(z) if z is not None else 2.5
-        score = direction * min(4.0, mag / 2.5)
-
         return self._mk(
             active=True,
             direction=direction,
@@ -74,20 +129,64 @@ class MeanReversionSignal(SignalModule):
         )
 
 
+    def compute_batch(self, ctxs: Sequence[AlphaContext], cfg: Dict[str, Any]) -> SignalBatch:
+        p = self._params(cfg)
+        allowed_regimes = p.allowed_regimes
+        sr_min = p.min_success_rate
+        n = len(ctxs)
+
+        gate = np.fromiter(
+            (
+                str(c.regime_label or "UNKNOWN").upper() in allowed_regimes
+                and not bool(c.meta.get("structural_trend_override", False))
+                for c in ctxs
+            ),
+            dtype=bool,
+            count=n,
+        )
+        z = _feature_column(ctxs, "z_score_vwap")
+        boll = _feature_column(ctxs, "bollinger_position")
+        sr = _feature_column(ctxs, "reversion_success_rate")
+        z_na = np.isnan(z)
+        sr_na = np.isnan(sr)
+        gate &= ~(z_na & np.isnan(boll)) & (sr_na | (sr >= sr_min))
+
+        # z decides when it is past +/-2.5; otherwise the Bollinger position
+        direction = np.select(
+            [z > 2.5, z < -2.5, boll > 0.95, boll < 0.05], [-1, 1, -1, 1], default=0
+        )
+        direction[~gate] = 0
+        active = direction != 0
+
+        conf = np.where(sr_na, 0.60, np.clip(sr / 0.50, 0.0, 1.0))
+        mag = np.where(z_na, 2.5, np.abs(z))
+        return self._mk_batch(
+            active,
+            direction,
+            np.where(active, direction * np.minimum(4.0, mag / 2.5), 0.0),
+            np.where(active, conf, 0.0),
+            np.where(active, np.minimum(1.0, 0.25 + 0.65 * conf), 0.0),
+        )
+
+
 class LeadLagSignal(SignalModule):
     name = "lead_lag"
     kind = "statistical"
     priority = "MEDIUM"
+    _PARAMS = (
+        ("activation", "min_lead_strength", 0.7),
+        ("activation", "leader_move_threshold", 0.01),
+    )
 
     def compute(self, ctx: AlphaContext, cfg: Dict[str, Any]):
-        act = cfg.get("activation", {}) or {}
-        lead_strength_min = float(act.get("min_lead_strength", 0.7))
-        leader_move_thr = float(act.get("leader_move_threshold", 0.01))
+        p = self._params(cfg)
+        lead_strength_min = p.min_lead_strength
+        leader_move_thr = p.leader_move_threshold
 
-        leader_move = self._to_float(ctx.f("leader_move", None), None)
-        lead_strength = self._to_float(ctx.f("lead_strength", None), None)
-        beta = self._to_float(ctx.f("beta", None), 1.0) or 1.0
-        optimal_lag = self._to_float(ctx.f("optimal_lag", None), None)
+        leader_move = _to_float(ctx.f("leader_move", None), None)
+        lead_strength = _to_float(ctx.f("lead_strength", None), None)
+        beta = _to_float(ctx.f("beta", None), 1.0) or 1.0
+        optimal_lag = _to_float(ctx.f("optimal_lag", None), None)
 
         if leader_move is None or lead_strength is None:
             return self._inactive("missing:leader_move|lead_strength")
@@ -98,12 +197,7 @@ class LeadLagSignal(SignalModule):
         if abs(lead_strength) < lead_strength_min:
             return self._inactive(f"weak_lead_strength({lead_strength:.2f})")
 
-        expected = float(leader_move) * float(beta) * float(lead_strength)
-        direction = self._sign(expected)
-
-        conf = min(1.0, abs(float(lead_strength)))
-        urg = min(1.0, 0.30 + 0.60 * conf)
-        score = direction * min(3.0, abs(expected) / max(leader_move_thr, 1e-9))
+        expected, direction, score, conf, urg = _lead_lag_core(leader_move, lead_strength, beta, leader_move_thr)
 
         return self._mk(
             active=True,
@@ -126,37 +220,30 @@ class IntradaySeasonalitySignal(SignalModule):
     name = "intraday_seasonality"
     kind = "statistical"
     priority = "MEDIUM"
+    _PARAMS = (
+        ("thresholds", "min_edge", 0.15),
+    )
 
     def compute(self, ctx: AlphaContext, cfg: Dict[str, Any]):
         now = ctx.now
-        if ZoneInfo is not None:
-            try:
-                now = now.astimezone(ZoneInfo("America/New_York"))
+        if _NY_TZ is not None:
+            try:  # naive/out-of-range datetimes can still fail to convert
+                now = now.astimezone(_NY_TZ)
             except Exception:
                 pass
 
         hhmm = now.hour * 60 + now.minute
 
-        def in_range(sh: int, sm: int, eh: int, em: int) -> bool:
-            s = sh * 60 + sm
-            e = eh * 60 + em
-            return s <= hhmm < e
-
         bias = "neutral"
         size_mult = 1.0
+        for start, end, window_bias, window_mult in _SEASONALITY:
+            if start <= hhmm < end:
+                bias = window_bias
+                size_mult = window_mult
+                break
 
-        if in_range(9, 30, 10, 0):
-            bias = "breakout"
-            size_mult = 1.0
-        elif in_range(12, 0, 13, 0):
-            bias = "mean_reversion"
-            size_mult = 0.6
-        elif in_range(15, 0, 16, 0):
-            bias = "trend"
-            size_mult = 1.2
-
-        edge = self._to_float(ctx.f("seasonality_edge", None), None)
-        min_edge = float((cfg.get("thresholds", {}) or {}).get("min_edge", 0.15))
+        edge = _to_float(ctx.f("seasonality_edge", None), None)
+        min_edge = self._params(cfg).min_edge
 
         active = (bias != "neutral") and (edge is None or edge >= min_edge)
 
@@ -171,7 +258,7 @@ class IntradaySeasonalitySignal(SignalModule):
                 outputs={"time_of_day_bias": bias, "size_multiplier": size_mult, "seasonality_edge": edge},
             )
 
-        conf = 0.50 if edge is None else min(1.0, float(edge) / max(min_edge, 1e-9))
+        conf = 0.50 if edge is None else _fmin(1.0, edge / _fmax(min_edge, 1e-9))
         return self._mk(
             active=True,
             direction=0,
@@ -1,55 +1,148 @@
 from __future__ import annotations
 
-from typing import Dict, Any
-
-from .base import AlphaContext, SignalModule
+from typing import Dict, Any, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .base import AlphaContext, SignalBatch, SignalModule, _feature_column, _fmax, _fmin, _memo_decision, _sign, _to_float
+
+# Numeric cores: plain float/int in, plain tuple out. The compute() methods
+# only unpack the context and build the decision around them.
+_TREND_STATES = ("WEAK", "NEUTRAL", "STRONG")
+_VOL_STATES = ("stable", "expanding", "compressing")
+_VOL_ASYM = ("neutral", "upside", "downside")
+
+# dealer gamma regime -> expected volatility multiplier
+_GAMMA_MULT = {
+    "positive_gamma_above": 0.7,
+    "positive_gamma_below": 1.3,
+    "negative_gamma": 1.8,
+}
+
+
+def _trend_core(ps: float, strong_abs: float, weak_abs: float) -> Tuple[bool, int, float, float, float, int]:
+    """(active, direction, score, confidence, urgency, state index into _TREND_STATES)"""
+    abs_ps = abs(ps)
+    if abs_ps < weak_abs:
+        return False, 0, 0.0, _fmin(0.30, abs_ps / _fmax(weak_abs, 1e-9)), 0.0, 0
+    conf = _fmin(1.0, abs_ps / _fmax(strong_abs, 1e-9))
+    urg = _fmin(1.0, 0.25 + 0.75 * conf)
+    return True, _sign(ps), ps, conf, urg, 2 if abs_ps >= strong_abs else 1
+
+
+def _vol_expansion_core(
+    exp_ratio: float, vol_skew: Optional[float], mom: float, exp_ratio_thr: float, skew_up: float, skew_dn: float
+) -> Tuple[bool, int, float, float, float, int, int]:
+    """(active, direction, score, confidence, urgency, _VOL_STATES index, _VOL_ASYM index)"""
+    state = 0
+    if exp_ratio > exp_ratio_thr:
+        state = 1
+    elif exp_ratio < (1.0 / _fmax(exp_ratio_thr, 1e-9)):
+        state = 2
+
+    asym = 0
+    if vol_skew is not None:
+        if vol_skew > skew_up:
+            asym = 1
+        elif vol_skew < skew_dn:
+            asym = 2
+
+    if state == 0:
+        return False, 0, 0.0, 0.0, 0.0, state, asym
+
+    direction = _sign(mom) if state == 1 else 0
+    raw = exp_ratio - 1.0
+    score = raw * (direction if direction != 0 else 1.0)
+    conf = _fmin(1.0, abs(raw) / _fmax(exp_ratio_thr - 1.0, 1e-9))
+    urg = _fmin(1.0, 0.20 + 0.70 * conf)
+    return True, direction, score, conf, urg, state, asym
 
 
 class TrendPersistenceSignal(SignalModule):
     name = "trend_persistence"
     kind = "structural"
     priority = "HIGHEST"
+    _PARAMS = (
+        ("thresholds", "strong_abs", 2.5),
+        ("thresholds", "weak_abs", 1.0),
+    )
 
     def compute(self, ctx: AlphaContext, cfg: Dict[str, Any]):
-        thr = (cfg.get("thresholds", {}) or {})
-        strong_abs = float(thr.get("strong_abs", 2.5))
-        weak_abs = float(thr.get("weak_abs", 1.0))
+        p = self._params(cfg)
+        strong_abs = p.strong_abs
+        weak_abs = p.weak_abs
 
-        ps = self._to_float(ctx.f("persistence_score", None), None)
+        ps = _to_float(ctx.f("persistence_score", None), None)
 
         if ps is None:
-            gap = self._to_float(ctx.f("gap_pct", None), None)
-            base = self._to_float(ctx.f("gap_base_pct", None), 0.02) or 0.02
+            gap = _to_float(ctx.f("gap_pct", None), None)
+            base = _to_float(ctx.f("gap_base_pct", None), 0.02) or 0.02
             if gap is None:
                 return self._inactive("missing:persistence_score|gap_pct")
             ps = (gap / base)
 
-        direction = self._sign(ps)
-        abs_ps = abs(ps)
+        return self._decide(ps, strong_abs, weak_abs)
+
+    @_memo_decision()
+    def _decide(self, ps: float, strong_abs: float, weak_abs: float):
+        active, direction, score, conf, urg, state = _trend_core(ps, strong_abs, weak_abs)
 
-        if abs_ps < weak_abs:
+        if not active:
             return self._mk(
                 active=False,
                 direction=0,
                 score=0.0,
-                confidence=min(0.30, abs_ps / max(weak_abs, 1e-9)),
+                confidence=conf,
                 urgency=0.0,
-                reason=f"weak_trend(abs={abs_ps:.2f} < {weak_abs:.2f})",
+                reason=f"weak_trend(abs={abs(ps):.2f} < {weak_abs:.2f})",
                 outputs={"persistence_score": ps, "trend_direction": 0, "state": "WEAK"},
             )
 
-        state = "STRONG" if abs_ps >= strong_abs else "NEUTRAL"
-        conf = min(1.0, abs_ps / max(strong_abs, 1e-9))
-        urg = min(1.0, 0.25 + 0.75 * conf)
-
         return self._mk(
             active=True,
             direction=direction,
-            score=float(ps),
+            score=score,
             confidence=conf,
             urgency=urg,
             reason="ok",
-            outputs={"persistence_score": ps, "trend_direction": direction, "state": state},
+            outputs={"persistence_score": ps, "trend_direction": direction, "state": _TREND_STATES[state]},
+        )
+
+
+    def compute_batch(self, ctxs: Sequence[AlphaContext], cfg: Dict[str, Any]) -> SignalBatch:
+        p = self._params(cfg)
+        strong_abs = p.strong_abs
+        weak_abs = p.weak_abs
+
+        ps = _feature_column(ctxs, "persistence_score")
+        miss = np.isnan(ps)
+        if miss.any():
+            gap = _feature_column(ctxs, "gap_pct")
+            base = _feature_column(ctxs, "gap_base_pct", 0.02)
+            base[base == 0.0] = 0.02  # `or 0.02`
+            ps = np.where(miss, gap / base, ps)
+
+        valid = ~np.isnan(ps)
+        abs_ps = np.abs(ps)
+        weak = abs_ps < weak_abs
+        active = valid & ~weak
+
+        conf = np.where(
+            weak,
+            np.minimum(0.30, abs_ps / _fmax(weak_abs, 1e-9)),
+            np.minimum(1.0, abs_ps / _fmax(strong_abs, 1e-9)),
+        )
+        conf[~valid] = 0.0
+        urg = np.where(active, np.minimum(1.0, 0.25 + 0.75 * conf), 0.0)
+        state = np.where(active, np.where(abs_ps >= strong_abs, 2, 1), 0).astype(np.int8)
+        return self._mk_batch(
+            active,
+            np.where(active, np.sign(ps), 0),
+            np.where(active, ps, 0.0),
+            conf,
+            urg,
+            state,
+            _TREND_STATES,
         )
 
 
@@ -57,58 +150,92 @@ class VolatilityExpansionSignal(SignalModule):
     name = "volatility_expansion"
     kind = "structural"
     priority = "HIGHEST"
+    _PARAMS = (
+        ("thresholds", "expansion_ratio", 1.5),
+        ("thresholds", "skew_up", 1.2),
+        ("thresholds", "skew_down", 0.8),
+    )
 
     def compute(self, ctx: AlphaContext, cfg: Dict[str, Any]):
-        thr = (cfg.get("thresholds", {}) or {})
-        exp_ratio_thr = float(thr.get("expansion_ratio", 1.5))
-        skew_up = float(thr.get("skew_up", 1.2))
-        skew_dn = float(thr.get("skew_down", 0.8))
+        p = self._params(cfg)
+        exp_ratio_thr = p.expansion_ratio
+        skew_up = p.skew_up
+        skew_dn = p.skew_down
 
-        exp_ratio = self._to_float(ctx.f("expansion_ratio", None), None)
-        vol_skew = self._to_float(ctx.f("vol_skew", None), None)
+        exp_ratio = _to_float(ctx.f("expansion_ratio", None), None)
+        vol_skew = _to_float(ctx.f("vol_skew", None), None)
 
         if exp_ratio is None:
-            rv_short = self._to_float(ctx.f("rv_short", None), None)
-            rv_med = self._to_float(ctx.f("rv_medium", None), None)
+            rv_short = _to_float(ctx.f("rv_short", None), None)
+            rv_med = _to_float(ctx.f("rv_medium", None), None)
             if rv_short is not None and rv_med and rv_med > 0:
                 exp_ratio = rv_short / rv_med
 
         if exp_ratio is None:
             return self._inactive("missing:expansion_ratio|rv_short+rv_medium")
 
-        state = "stable"
-        active = False
-
-        if exp_ratio > exp_ratio_thr:
-            state = "expanding"
-            active = True
-        elif exp_ratio < (1.0 / max(exp_ratio_thr, 1e-9)):
-            state = "compressing"
-            active = True
-
-        asym = "neutral"
-        if vol_skew is not None:
-            if vol_skew > skew_up:
-                asym = "upside"
-            elif vol_skew < skew_dn:
-                asym = "downside"
-
-        mom = self._to_float(ctx.f("momentum", None), 0.0) or 0.0
-        direction = self._sign(mom) if state == "expanding" else 0
-
-        raw = (float(exp_ratio) - 1.0)
-        score = raw * (direction if direction != 0 else 1.0)
-        conf = min(1.0, abs(raw) / max(exp_ratio_thr - 1.0, 1e-9))
-        urg = min(1.0, 0.20 + 0.70 * conf)
+        mom = _to_float(ctx.f("momentum", None), 0.0) or 0.0
+        return self._decide(exp_ratio, vol_skew, mom, exp_ratio_thr, skew_up, skew_dn)
+
+    @_memo_decision()
+    def _decide(
+        self,
+        exp_ratio: float,
+        vol_skew: Optional[float],
+        mom: float,
+        exp_ratio_thr: float,
+        skew_up: float,
+        skew_dn: float,
+    ):
+        active, direction, score, conf, urg, state, asym = _vol_expansion_core(
+            exp_ratio, vol_skew, mom, exp_ratio_thr, skew_up, skew_dn
+        )
 
         return self._mk(
             active=active,
             direction=direction,
-            score=score if active else 0.0,
-            confidence=conf if active else 0.0,
-            urgency=urg if active else 0.0,
+            score=score,
+            confidence=conf,
+            urgency=urg,
             reason="ok" if active else "stable",
-            outputs={"expansion_ratio": exp_ratio, "vol_skew": vol_skew, "asymmetry": asym, "expansion_state": state},
+            outputs={
+                "expansion_ratio": exp_ratio,
+                "vol_skew": vol_skew,
+                "asymmetry": _VOL_ASYM[asym],
+                "expansion_state": _VOL_STATES[state],
+            },
+        )
+
+
+    def compute_batch(self, ctxs: Sequence[AlphaContext], cfg: Dict[str, Any]) -> SignalBatch:
+        p = self._params(cfg)
+        exp_ratio_thr = p.expansion_ratio
+
+        er = _feature_column(ctxs, "expansion_ratio")
+        miss = np.isnan(er)
+        if miss.any():
+            rv_short = _feature_column(ctxs, "rv_short")
+            rv_med = _feature_column(ctxs, "rv_medium")
+            ok = miss & ~np.isnan(rv_short) & (rv_med > 0)
+            er = np.where(ok, rv_short / np.where(ok, rv_med, 1.0), er)
+
+        mom = _feature_column(ctxs, "momentum", 0.0)
+        mom[np.isnan(mom)] = 0.0  # _sign(nan) == 0
+        expanding = er > exp_ratio_thr
+        compressing = ~expanding & (er < (1.0 / _fmax(exp_ratio_thr, 1e-9)))
+        active = expanding | compressing  # NaN (missing) compares False
+
+        direction = np.where(expanding, np.sign(mom), 0.0)
+        raw = er - 1.0
+        conf = np.minimum(1.0, np.abs(raw) / _fmax(exp_ratio_thr - 1.0, 1e-9))
+        return self._mk_batch(
+            active,
+            direction,
+            np.where(active, raw * np.where(direction != 0, direction, 1.0), 0.0),
+            np.where(active, conf, 0.0),
+            np.where(active, np.minimum(1.0, 0.20 + 0.70 * conf), 0.0),
+            np.where(expanding, 1, np.where(compressing, 2, 0)).astype(np.int8),
+            _VOL_STATES,
         )
 
 
@@ -116,15 +243,18 @@ class LiquiditySeekingSignal(SignalModule):
     name = "liquidity_seeking"
     kind = "structural"
     priority = "HIGHEST"
+    _PARAMS = (
+        ("thresholds", "max_distance_pct", 0.001),
+    )
 
     def compute(self, ctx: AlphaContext, cfg: Dict[str, Any]):
-        dist = self._to_float(ctx.f("liquidity_zone_distance_pct", None), None)
+        dist = _to_float(ctx.f("liquidity_zone_distance_pct", None), None)
         approaching = bool(ctx.f("approaching_liquidity_zone", False))
-        target = self._to_float(ctx.f("target_liquidity_zone_price", None), None)
-        px = self._to_float(ctx.q("last", ctx.f("price", None)), None)
+        target = _to_float(ctx.f("target_liquidity_zone_price", None), None)
+        px = _to_float(ctx.q("last", ctx.f("price", None)), None)
 
-        thr = cfg.get("thresholds", {}) or {}
-        max_dist = float(thr.get("max_distance_pct", 0.001))
+        p = self._params(cfg)
+        max_dist = p.max_distance_pct
 
         if dist is None or px is None or target is None:
             return self._inactive("missing:liquidity_zone_distance_pct|price|target_liquidity_zone_price")
@@ -141,9 +271,9 @@ class LiquiditySeekingSignal(SignalModule):
                 outputs={"liquidity_seeking": False, "target_price": target, "distance_pct": dist},
             )
 
-        direction = self._sign(float(target) - float(px))
-        conf = min(1.0, (max_dist - abs(float(dist))) / max(max_dist, 1e-9))
-        urg = min(1.0, 0.35 + 0.65 * conf)
+        direction = _sign(target - px)
+        conf = _fmin(1.0, (max_dist - abs(dist)) / _fmax(max_dist, 1e-9))
+        urg = _fmin(1.0, 0.35 + 0.65 * conf)
 
         return self._mk(
             active=True,
@@ -162,19 +292,15 @@ class DealerGammaSignal(SignalModule):
     priority = "HIGHEST"
 
     def compute(self, ctx: AlphaContext, cfg: Dict[str, Any]):
-        net_gamma = self._to_float(ctx.f("net_gamma", None), None)
-        spot = self._to_float(ctx.f("spot", None), None)
-        flip = self._to_float(ctx.f("gamma_flip_level", None), None)
+        net_gamma = _to_float(ctx.f("net_gamma", None), None)
+        spot = _to_float(ctx.f("spot", None), None)
+        flip = _to_float(ctx.f("gamma_flip_level", None), None)
 
         if net_gamma is None or spot is None or flip is None:
             return self._inactive("missing:net_gamma|spot|gamma_flip_level")
 
         regime = "negative_gamma" if net_gamma < 0 else ("positive_gamma_above" if spot > flip else "positive_gamma_below")
-        mult = {
-            "positive_gamma_above": 0.7,
-            "positive_gamma_below": 1.3,
-            "negative_gamma": 1.8,
-        }.get(regime, 1.0)
+        mult = _GAMMA_MULT.get(regime, 1.0)
 
         return self._mk(
             active=True,
@@ -183,5 +309,5 @@ class DealerGammaSignal(SignalModule):
             confidence=1.0,
             urgency=0.60 if regime == "negative_gamma" else 0.20,
             reason="ok",
-            outputs={"gamma_regime": regime, "volatility_expectation_multiplier": float(mult)},
+            outputs={"gamma_regime": regime, "volatility_expectation_multiplier": mult},
         )
@@ -1,10 +1,25 @@
 from __future__ import annotations
 
 import json
+import logging
+import queue
+import struct
+import threading
 import time
+from bisect import bisect_left, insort
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+try:
+    import orjson  # optional: C encoder for the per-fill event log
+except Exception:  # pragma: no cover
+    orjson = None
+
+LOG = logging.getLogger("slippage_tracker")
 
 
 def _safe_float(x: Any, default: float = 0.0) -> float:
@@ -21,10 +36,47 @@ def _safe_int(x: Any, default: int = 0) -> int:
         return default
 
 
-def _percentile(values: List[float], p: float) -> Optional[float]:
-    if not values:
+# Fill journal record: (seq, ts, slip_bps, abs_usd), 32 bytes little-endian.
+_JOURNAL_REC = struct.Struct("<Qddd")
+# Same layout as a NumPy record, for writing a whole batch in one go.
+_JOURNAL_DTYPE = np.dtype([("seq", "<u8"), ("ts", "<f8"), ("slip_bps", "<f8"), ("abs_usd", "<f8")])
+
+_RECENT_MAX = 500
+
+_BUY_SIDES = frozenset(("BUY", "B", "LONG"))
+# Already-normalized side strings skip the upper()/strip() round trip.
+_CANON_SIDES = _BUY_SIDES | {"SELL", "S", "SHORT"}
+
+def _json_default(o: Any) -> Any:
+    # NumPy scalars/arrays in `extra`
+    if hasattr(o, "tolist"):
+        return o.tolist()
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def _json_line(event: Dict[str, Any]) -> bytes:
+    return (json.dumps(event, default=_json_default) + "\n").encode("utf-8")
+
+
+if orjson is not None:
+    _EVENT_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY
+
+    def _event_line(event: Dict[str, Any]) -> bytes:
+        try:
+            line = orjson.dumps(event, option=_EVENT_OPTS, default=_json_default)
+        except TypeError:  # orjson.JSONEncodeError; json may still manage (e.g. big ints)
+            return _json_line(event)
+        # orjson writes NaN/inf as null; re-encode so they keep json's NaN/Infinity
+        return _json_line(event) if b"null" in line else line
+
+else:
+    _event_line = _json_line
+
+
+def _percentile_sorted(v: List[float], p: float) -> Optional[float]:
+    """Linear-interpolated percentile of an already ascending list."""
+    if not v:
         return None
-    v = sorted(values)
     if len(v) == 1:
         return v[0]
     k = (len(v) - 1) * (p / 100.0)
@@ -73,19 +125,81 @@ class SlippageTracker:
         hourly_slippage_limit_usd: float = 500.0,
         daily_slippage_limit_usd: float = 2000.0,
         equity_slippage_limit_pct: float = 0.001,  # 0.1% of equity
+        snapshot_every: int = 64,
+        async_snapshots: bool = False,
     ):
         self.state_path = Path(state_path)
         self.events_path = Path(events_path)
 
-        self.max_acceptable_slippage_bps = float(max_acceptable_slippage_bps)
-        self.severe_multiplier = float(severe_multiplier)
-        self.warn_multiplier = float(warn_multiplier)
+        self._max_bps = float(max_acceptable_slippage_bps)
+        self._severe_mult = float(severe_multiplier)
+        self._warn_mult = float(warn_multiplier)
+        self._refresh_thresholds()
 
         self.hourly_slippage_limit_usd = float(hourly_slippage_limit_usd)
         self.daily_slippage_limit_usd = float(daily_slippage_limit_usd)
         self.equity_slippage_limit_pct = float(equity_slippage_limit_pct)
 
+        # Fills go to an append-only journal; the JSON snapshot is rewritten
+        # every `snapshot_every` fills and on pause/resume/reset/roll.
+        self.journal_path = self.state_path.with_suffix(".jrnl")
+        self.snapshot_every = max(1, int(snapshot_every))
+        self._since_snapshot = 0
+        self._journal = None
+        self._events_fh = None
+        # Opt-in: the periodic snapshot is written by a background thread.
+        # pause/resume/reset/roll/flush always write synchronously.
+        self.async_snapshots = bool(async_snapshots)
+        self._journal_lock = threading.Lock()
+        self._save_q: Optional[queue.Queue] = None
+        self._writer: Optional[threading.Thread] = None
+
         self._state = self._load_state()
+        self._replay_journal()
+
+        # Rolling slippage window: FIFO for eviction order plus a sorted copy
+        # kept in step (bisect), so stats() indexes percentiles directly.
+        # The FIFO owns the window; "recent_bps" is only materialized into
+        # the snapshot payload when writing it.
+        self._recent: deque = deque(
+            (float(x) for x in self._state.pop("recent_bps", [])), maxlen=_RECENT_MAX
+        )
+        self._recent_sorted: List[float] = sorted(self._recent)
+
+    # ---------------- thresholds ----------------
+    # The per-fill warn/severe cut-offs are derived once; the setters keep
+    # them in step if a caller retunes the tracker at runtime.
+
+    def _refresh_thresholds(self) -> None:
+        self._warn_bps = self._max_bps * self._warn_mult
+        self._severe_bps = self._max_bps * self._severe_mult
+
+    @property
+    def max_acceptable_slippage_bps(self) -> float:
+        return self._max_bps
+
+    @max_acceptable_slippage_bps.setter
+    def max_acceptable_slippage_bps(self, value: float) -> None:
+        self._max_bps = float(value)
+        self._refresh_thresholds()
+
+    @property
+    def warn_multiplier(self) -> float:
+        return self._warn_mult
+
+    @warn_multiplier.setter
+    def warn_multiplier(self, value: float) -> None:
+        self._warn_mult = float(value)
+        self._refresh_thresholds()
+
+    @property
+    def severe_multiplier(self) -> float:
+        return self._severe_mult
+
+    @severe_multiplier.setter
+    def severe_multiplier(self, value: float) -> None:
+        self._severe_mult = float(value)
+        self._refresh_thresholds()
 
     # ---------------- state ----------------
 
@@ -105,14 +219,155 @@ class SlippageTracker:
             "recent_bps": [],  # rolling list for median/p90
         }
 
-    def _save_state(self) -> None:
+    def _snapshot(self) -> Dict[str, Any]:
+        return dict(self._state, recent_bps=list(self._recent))
+
+    def _write_snapshot(self, payload: Dict[str, Any]) -> None:
         self.state_path.parent.mkdir(parents=True, exist_ok=True)
-        self.state_path.write_text(json.dumps(self._state, indent=2), encoding="utf-8")
+        self.state_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
 
-    def _append_event(self, event: Dict[str, Any]) -> None:
-        self.events_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.events_path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(event) + "\n")
+    def _save_state(self) -> None:
+        self._drain_writer()  # a queued snapshot must not land after this one
+        self._write_snapshot(self._snapshot())
+        # Everything journaled so far is in the snapshot now (its journal_seq
+        # also guards a replay if we die before the truncate).
+        with self._journal_lock:
+            if self._journal is not None:
+                self._journal.truncate(0)
+        # keep the event log at least as current as the snapshot
+        if self._events_fh is not None:
+            self._events_fh.flush()
+        self._since_snapshot = 0
+
+    def _replay_journal(self) -> None:
+        """Fold journal records newer than the snapshot back into the state."""
+        try:
+            raw = self.journal_path.read_bytes()
+        except OSError:
+            return
+        seq0 = _safe_int(self._state.get("journal_seq", 0), 0)
+        recent = self._state.setdefault("recent_bps", [])
+        size = _JOURNAL_REC.size
+        # a torn trailing record (crash mid-write) is ignored
+        for seq, _ts, slip_bps, abs_usd in _JOURNAL_REC.iter_unpack(raw[: len(raw) - len(raw) % size]):
+            if seq <= seq0:
+                continue
+            recent.append(slip_bps)
+            self._state["hourly_usd"] = float(self._state.get("hourly_usd", 0.0)) + abs_usd
+            self._state["daily_usd"] = float(self._state.get("daily_usd", 0.0)) + abs_usd
+            self._state["journal_seq"] = seq0 = seq
+        if len(recent) > _RECENT_MAX:
+            del recent[:-_RECENT_MAX]
+
+    def _journal_write(self, data: bytes, count: int) -> None:
+        """Append `count` packed journal records, opening the journal lazily."""
+        with self._journal_lock:
+            if self._journal is None:
+                self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+                self._journal = open(self.journal_path, "ab", buffering=0)
+            self._journal.write(data)
+        self._since_snapshot += count
+
+    def _maybe_snapshot(self) -> None:
+        if self._since_snapshot >= self.snapshot_every:
+            if self.async_snapshots:
+                self._queue_snapshot()
+            else:
+                self._save_state()
+
+    # ---------------- background snapshots ----------------
+
+    def _queue_snapshot(self) -> None:
+        if self._writer is None:
+            self._save_q = queue.Queue(maxsize=1)
+            self._writer = threading.Thread(target=self._writer_loop, name="slippage-snapshot", daemon=True)
+            self._writer.start()
+        if self._events_fh is not None:
+            self._events_fh.flush()
+        try:  # a snapshot the writer has not picked up yet is superseded
+            self._save_q.get_nowait()
+            self._save_q.task_done()
+        except queue.Empty:
+            pass
+        self._save_q.put_nowait(self._snapshot())
+        self._since_snapshot = 0
+
+    def _writer_loop(self) -> None:
+        q = self._save_q
+        while True:
+            payload = q.get()
+            try:
+                if payload is None:
+                    return
+                self._write_snapshot(payload)
+                # Fills journaled after the payload was taken are not in it,
+                # so the journal can only be emptied if none arrived since.
+                with self._journal_lock:
+                    if self._journal is not None and self._state.get("journal_seq") == payload.get("journal_seq"):
+                        self._journal.truncate(0)
+            except Exception:  # the journal still holds every fill
+                LOG.exception("background slippage snapshot failed")
+            finally:
+                q.task_done()
+
+    def _drain_writer(self) -> None:
+        if self._save_q is not None:
+            self._save_q.join()
+
+    def _stop_writer(self) -> None:
+        if self._writer is not None:
+            self._save_q.put(None)
+            self._writer.join()
+            self._writer = None
+            self._save_q = None
+
+    def _push_recent(self, bps: float) -> None:
+        ordered = self._recent_sorted
+        if len(self._recent) == _RECENT_MAX:
+            old = self._recent[0]
+            i = bisect_left(ordered, old)
+            if i < len(ordered) and ordered[i] == old:
+                del ordered[i]
+            else:  # NaN never compares equal; rebuild after the append below
+                ordered = None
+        self._recent.append(bps)
+        if ordered is None:
+            self._recent_sorted = sorted(self._recent)
+        else:
+            insort(ordered, bps)
+
+    def flush(self) -> None:
+        """Write the snapshot now (e.g. on shutdown) and empty the journal."""
+        if self._since_snapshot:
+            self._save_state()
+        else:
+            self._drain_writer()
+        if self._events_fh is not None:
+            self._events_fh.flush()
+
+    def close(self) -> None:
+        """Flush everything, stop the snapshot writer and release file handles."""
+        self.flush()
+        self._stop_writer()
+        for fh in (self._events_fh, self._journal):
+            if fh is not None:
+                fh.close()
+        self._events_fh = None
+        self._journal = None
+
+    def _events_out(self):
+        # One buffered handle for the tracker's lifetime; SEVERE events are
+        # pushed to disk immediately, the rest ride the buffer (or flush()).
+        if self._events_fh is None:
+            self.events_path.parent.mkdir(parents=True, exist_ok=True)
+            self._events_fh = open(self.events_path, "ab", buffering=1 << 16)
+        return self._events_fh
+
+    def _write_event(self, line: bytes, severe: bool) -> None:
+        fh = self._events_out()
+        fh.write(line)
+        if severe:
+            fh.flush()
 
     # ---------------- public API ----------------
 
@@ -139,15 +394,20 @@ class SlippageTracker:
 
     def maybe_roll_windows(self) -> None:
         now = time.time()
+        rolled = False
         # hourly window
         if now - float(self._state.get("hourly_start_ts", now)) >= 3600.0:
             self._state["hourly_usd"] = 0.0
             self._state["hourly_start_ts"] = now
+            rolled = True
         # daily window
         if now - float(self._state.get("daily_start_ts", now)) >= 86400.0:
             self._state["daily_usd"] = 0.0
             self._state["daily_start_ts"] = now
-        self._save_state()
+            rolled = True
+        # a roll must reach the snapshot before later journal records replay onto it
+        if rolled:
+            self._save_state()
 
     def record_fill(
         self,
@@ -174,64 +434,53 @@ class SlippageTracker:
         exp = float(expected_price)
         fill = float(fill_price)
 
-        side_u = str(side).upper().strip()
-        direction = +1 if side_u in ("BUY", "B", "LONG") else -1
+        side_u = side if type(side) is str and side in _CANON_SIDES else str(side).upper().strip()
+        direction = +1 if side_u in _BUY_SIDES else -1
 
         # direction-adjusted
         slip = (fill - exp) if direction == +1 else (exp - fill)
         slip_bps = 0.0 if exp <= 0 else (slip / exp) * 10000.0
-        slip_usd = slip * float(qty_i)
-
-        # Update rolling stats
-        recent = list(self._state.get("recent_bps", []))
-        recent.append(float(slip_bps))
-        max_n = 500
-        if len(recent) > max_n:
-            recent = recent[-max_n:]
-        self._state["recent_bps"] = recent
-
-        # Update budgets (use absolute $ impact for budgets)
-        abs_usd = abs(float(slip_usd))
-        self._state["hourly_usd"] = float(self._state.get("hourly_usd", 0.0)) + abs_usd
-        self._state["daily_usd"] = float(self._state.get("daily_usd", 0.0)) + abs_usd
-
-        # Equity-based daily cap
-        equity_cap_usd = None
-        if account_equity is not None:
-            equity_cap_usd = float(account_equity) * float(self.equity_slippage_limit_pct)
+        slip_usd = slip * qty_i
+
+        # Budgets (absolute $ impact) and severity are resolved first, and the
+        # event line is encoded before any state changes: an event that cannot
+        # be serialized must not leave budgets/seq/pause ahead of the journal.
+        st = self._state
+        abs_usd = abs(slip_usd)
+        hourly_usd = float(st.get("hourly_usd", 0.0)) + abs_usd
+        daily_usd = float(st.get("daily_usd", 0.0)) + abs_usd
 
         # Severity checks
         severity = "OK"
         reason = ""
+        pause_reasons: List[str] = []
 
-        warn_bps = self.max_acceptable_slippage_bps * self.warn_multiplier
-        severe_bps = self.max_acceptable_slippage_bps * self.severe_multiplier
-
-        if slip_bps >= severe_bps:
+        if slip_bps >= self._severe_bps:
             severity = "SEVERE"
-            reason = f"single_trade_slippage_bps={slip_bps:.2f} >= severe({severe_bps:.2f})"
-            self.pause(reason)
-        elif slip_bps >= warn_bps:
+            reason = f"single_trade_slippage_bps={slip_bps:.2f} >= severe({self._severe_bps:.2f})"
+            pause_reasons.append(reason)
+        elif slip_bps >= self._warn_bps:
             severity = "WARN"
-            reason = f"single_trade_slippage_bps={slip_bps:.2f} >= warn({warn_bps:.2f})"
+            reason = f"single_trade_slippage_bps={slip_bps:.2f} >= warn({self._warn_bps:.2f})"
 
-        # Budget breach checks
-        daily_limit = self.daily_slippage_limit_usd
-        if equity_cap_usd is not None:
-            daily_limit = min(daily_limit, equity_cap_usd)
+        # Budget breach checks (daily limit tightened by the equity-based cap)
+        daily_limit = float(self.daily_slippage_limit_usd)
+        if account_equity is not None:
+            daily_limit = min(daily_limit, float(account_equity) * float(self.equity_slippage_limit_pct))
 
-        if float(self._state["daily_usd"]) >= float(daily_limit):
+        if daily_usd >= daily_limit:
             severity = "SEVERE"
-            reason = f"daily_slippage_usd={self._state['daily_usd']:.2f} >= limit({daily_limit:.2f})"
-            self.pause(reason)
+            reason = f"daily_slippage_usd={daily_usd:.2f} >= limit({daily_limit:.2f})"
+            pause_reasons.append(reason)
 
-        if float(self._state["hourly_usd"]) >= float(self.hourly_slippage_limit_usd):
-            if severity != "SEVERE":
-                severity = "WARN"
-                reason = f"hourly_slippage_usd={self._state['hourly_usd']:.2f} >= limit({self.hourly_slippage_limit_usd:.2f})"
+        hourly_limit = float(self.hourly_slippage_limit_usd)
+        if hourly_usd >= hourly_limit and severity != "SEVERE":
+            severity = "WARN"
+            reason = f"hourly_slippage_usd={hourly_usd:.2f} >= limit({hourly_limit:.2f})"
+
+        paused = bool(pause_reasons) or self.is_paused()
 
-        # Persist event
-        event = {
+        line = _event_line({
             "ts": now,
             "symbol": symbol,
             "side": side_u,
@@ -242,30 +491,175 @@ class SlippageTracker:
             "slippage_bps": slip_bps,
             "slippage_usd": slip_usd,
             "abs_slippage_usd": abs_usd,
-            "hourly_usd": self._state["hourly_usd"],
-            "daily_usd": self._state["daily_usd"],
-            "paused": self.is_paused(),
+            "hourly_usd": hourly_usd,
+            "daily_usd": daily_usd,
+            "paused": paused,
             "severity": severity,
             "reason": reason,
             "extra": extra or {},
-        }
-        self._append_event(event)
-        self._save_state()
+        })
+
+        # Commit: rolling stats, budgets, then the journal seq together with the
+        # state change, so a snapshot taken by pause() already counts this fill.
+        self._push_recent(slip_bps)
+        st["hourly_usd"] = hourly_usd
+        st["daily_usd"] = daily_usd
+        seq = _safe_int(st.get("journal_seq", 0), 0) + 1
+        st["journal_seq"] = seq
+        for why in pause_reasons:
+            self.pause(why)
+
+        self._write_event(line, severity == "SEVERE")
+        self._journal_write(_JOURNAL_REC.pack(seq, now, slip_bps, abs_usd), 1)
+        self._maybe_snapshot()
 
         return SlippageResult(
-            realized_bps=float(slip_bps),
-            realized_usd=float(slip_usd),
-            hourly_usd=float(self._state["hourly_usd"]),
-            daily_usd=float(self._state["daily_usd"]),
-            paused=self.is_paused(),
+            realized_bps=slip_bps,
+            realized_usd=slip_usd,
+            hourly_usd=hourly_usd,
+            daily_usd=daily_usd,
+            paused=paused,
             severity=severity,
             reason=reason,
         )
 
+    def record_fills_batch(
+        self,
+        *,
+        symbols: Sequence[str],
+        sides: Sequence[str],
+        qtys: Sequence[int],
+        expected_prices: Sequence[float],
+        fill_prices: Sequence[float],
+        account_equity: Optional[float] = None,
+        ts: Optional[Sequence[float]] = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ) -> List[SlippageResult]:
+        """
+        record_fill() over a burst of fills, in order, with the arithmetic
+        vectorized. Results, events, budgets and pause state match calling
+        record_fill() once per fill; windows roll once up front, the journal
+        is appended in one write and the snapshot is taken at most once.
+        `ts` defaults to the current time for every fill. All columns must
+        have the same length; a mismatch raises ValueError before any state
+        changes.
+        """
+        n = len(symbols)
+        columns = {"sides": sides, "qtys": qtys, "expected_prices": expected_prices, "fill_prices": fill_prices}
+        if ts is not None:
+            columns["ts"] = ts
+        for name, col in columns.items():
+            if len(col) != n:
+                raise ValueError(f"record_fills_batch: {name} has {len(col)} entries, expected {n} (len(symbols))")
+        if n == 0:
+            return []
+        self.maybe_roll_windows()
+        st = self._state
+
+        now = np.full(n, time.time()) if ts is None else np.asarray(ts, dtype=np.float64)
+        qty = np.maximum(np.trunc(np.asarray(qtys, dtype=np.float64)), 0.0).astype(np.int64)
+        exp = np.asarray(expected_prices, dtype=np.float64)
+        fill = np.asarray(fill_prices, dtype=np.float64)
+        side_u = [s if type(s) is str and s in _CANON_SIDES else str(s).upper().strip() for s in sides]
+        buy = np.fromiter((s in _BUY_SIDES for s in side_u), dtype=bool, count=n)
+
+        slip = np.where(buy, fill - exp, exp - fill)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slip_bps = np.where(exp <= 0, 0.0, (slip / exp) * 10000.0)
+        slip_usd = slip * qty
+        abs_usd = np.abs(slip_usd)
+        # running budgets after each fill (cumsum adds left to right, like the loop)
+        hourly = np.cumsum(np.concatenate(([float(st.get("hourly_usd", 0.0))], abs_usd)))[1:]
+        daily = np.cumsum(np.concatenate(([float(st.get("daily_usd", 0.0))], abs_usd)))[1:]
+        seq0 = _safe_int(st.get("journal_seq", 0), 0)
+
+        daily_limit = float(self.daily_slippage_limit_usd)
+        if account_equity is not None:
+            daily_limit = min(daily_limit, float(account_equity) * float(self.equity_slippage_limit_pct))
+        hourly_limit = float(self.hourly_slippage_limit_usd)
+
+        severe_fill = slip_bps >= self._severe_bps
+        warn_fill = ~severe_fill & (slip_bps >= self._warn_bps)
+        daily_hit = daily >= daily_limit
+        hourly_hit = hourly >= hourly_limit
+        pauses = severe_fill | daily_hit
+        paused = np.logical_or.accumulate(pauses) | self.is_paused()
+
+        # 0 OK / 1 WARN / 2 SEVERE, with the same precedence as record_fill
+        sev = np.where(severe_fill | daily_hit, 2, np.where(warn_fill | hourly_hit, 1, 0))
+        reasons = [""] * n
+        for i in np.flatnonzero(sev).tolist():
+            b = float(slip_bps[i])
+            if daily_hit[i]:
+                reasons[i] = f"daily_slippage_usd={daily[i]:.2f} >= limit({daily_limit:.2f})"
+            elif severe_fill[i]:
+                reasons[i] = f"single_trade_slippage_bps={b:.2f} >= severe({self._severe_bps:.2f})"
+            elif hourly_hit[i]:
+                reasons[i] = f"hourly_slippage_usd={hourly[i]:.2f} >= limit({hourly_limit:.2f})"
+            else:
+                reasons[i] = f"single_trade_slippage_bps={b:.2f} >= warn({self._warn_bps:.2f})"
+
+        labels = ("OK", "WARN", "SEVERE")
+        cols = zip(
+            now.tolist(), symbols, side_u, qty.tolist(), exp.tolist(), fill.tolist(), slip.tolist(),
+            slip_bps.tolist(), slip_usd.tolist(), abs_usd.tolist(), hourly.tolist(), daily.tolist(),
+            paused.tolist(), sev.tolist(), reasons,
+        )
+        results: List[SlippageResult] = []
+        lines = []
+        for t, sym, sd, q, e, f, sl, bps, usd, a_usd, h, d, p, sv, why in cols:
+            lines.append(_event_line({
+                "ts": t,
+                "symbol": sym,
+                "side": sd,
+                "qty": q,
+                "expected_price": e,
+                "fill_price": f,
+                "slippage": sl,
+                "slippage_bps": bps,
+                "slippage_usd": usd,
+                "abs_slippage_usd": a_usd,
+                "hourly_usd": h,
+                "daily_usd": d,
+                "paused": p,
+                "severity": labels[sv],
+                "reason": why,
+                "extra": extra or {},
+            }))
+            results.append(SlippageResult(bps, usd, h, d, p, labels[sv], why))
+
+        # every event encoded: now commit rolling stats and budgets
+        if n >= 64:
+            self._recent.extend(slip_bps.tolist())
+            self._recent_sorted = sorted(self._recent)
+        else:
+            for b in slip_bps.tolist():
+                self._push_recent(b)
+
+        st["hourly_usd"] = float(hourly[-1])
+        st["daily_usd"] = float(daily[-1])
+        st["journal_seq"] = seq0 + n
+
+        self._events_out().write(b"".join(lines))
+
+        rec = np.empty(n, dtype=_JOURNAL_DTYPE)
+        rec["seq"] = np.arange(seq0 + 1, seq0 + n + 1, dtype=np.uint64)
+        rec["ts"] = now
+        rec["slip_bps"] = slip_bps
+        rec["abs_usd"] = abs_usd
+        self._journal_write(rec.tobytes(), n)
+
+        if pauses.any():
+            last = int(np.flatnonzero(pauses)[-1])
+            self.pause(reasons[last])  # snapshots synchronously and flushes events
+        else:
+            self._maybe_snapshot()
+        return results
+
     def stats(self) -> Dict[str, Any]:
-        recent = list(self._state.get("recent_bps", []))
-        median = _percentile(recent, 50.0)
-        p90 = _percentile(recent, 90.0)
+        recent = self._recent_sorted
+        median = _percentile_sorted(recent, 50.0)
+        p90 = _percentile_sorted(recent, 90.0)
         return {
             "paused": self.is_paused(),
             "pause_reason": self._state.get("pause_reason", ""),
@@ -1,10 +1,19 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-import yaml
+import numpy as np
+
+from Core.config_cache import load_yaml_cached
+
+
+_ML_FACTOR_CACHE_MAX = 4096
+
+# side spelling -> canonical side
+_SIDES = {"BUY": "BUY", "SELL": "SELL", "buy": "BUY", "sell": "SELL", "Buy": "BUY", "Sell": "SELL"}
 
 
 def _clamp(x: float, lo: float, hi: float) -> float:
@@ -16,6 +25,23 @@ def _safe_upper(x: Optional[str], default: str) -> str:
     return s if s else default
 
 
+def _intern(k: Any) -> Any:
+    return sys.intern(k) if type(k) is str else k
+
+
+def _regime_table(mults: Dict[Any, Any]) -> Tuple[Dict[Any, float], float]:
+    """Regime multipliers as floats (interned keys), plus the UNKNOWN fallback (1.0 if absent)."""
+    table = {_intern(k): float(v) for k, v in mults.items()}
+    return table, table.get("UNKNOWN", 1.0)
+
+
+def _factorize(values: Sequence[Any]) -> Tuple[np.ndarray, List[Any]]:
+    """Integer code per row plus the distinct values in first-seen order."""
+    index: Dict[Any, int] = {}
+    codes = np.fromiter((index.setdefault(v, len(index)) for v in values), dtype=np.intp, count=len(values))
+    return codes, list(index)
+
+
 def _spread_pct(bid: float, ask: float) -> float:
     mid = (bid + ask) / 2.0
     if mid <= 0:
@@ -23,7 +49,7 @@ def _spread_pct(bid: float, ask: float) -> float:
     return (ask - bid) / mid
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StopInputs:
     symbol: str
     side: str                 # "BUY"/"SELL" or "buy"/"sell"
@@ -44,7 +70,7 @@ class StopInputs:
     qty: Optional[int] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StopResult:
     stop_price: float
     stop_distance_usd: float
@@ -66,6 +92,23 @@ class StopResult:
     reason: str
 
 
+def _blocked(
+    reason: str,
+    method: str = "UNKNOWN",
+    base_distance_usd: float = 0.0,
+    regime_mult: float = 0.0,
+    liquidity_mult: float = 0.0,
+    buffer_usd: float = 0.0,
+    spread_pct: Optional[float] = None,
+) -> StopResult:
+    """BLOCK result: zero stop, no max-loss outputs, diagnostics up to the failing step."""
+    # positional: a frozen dataclass init is cheaper without keyword binding
+    return StopResult(
+        0.0, 0.0, method, base_distance_usd, regime_mult, liquidity_mult, buffer_usd,
+        spread_pct, None, None, None, True, reason,
+    )
+
+
 class StopModule:
     """
     STEP 11 — Stops module
@@ -85,33 +128,73 @@ class StopModule:
     def reload(self) -> None:
         if not self.config_path.exists():
             raise FileNotFoundError(f"Stops config not found: {self.config_path}")
-        with self.config_path.open("r", encoding="utf-8") as f:
-            self._cfg = yaml.safe_load(f) or {}
+        # re-parses only when the file's mtime/size changed since the last load
+        self._cfg = load_yaml_cached(self.config_path)
         if not isinstance(self._cfg, dict):
             raise ValueError("Stops YAML must be a mapping at top-level")
+        self._compile()
+
+    def _compile(self) -> None:
+        """Resolve every config scalar once per reload; compute() only does arithmetic."""
+        base = self._cfg.get("base", {}) or {}
+        self._base_method = _safe_upper(str(base.get("method", "PCT")), "PCT")
+        self._stop_pct = float(base.get("stop_pct", 0.005))
+        self._atr_mult = float(base.get("atr_multiple", 1.5))
+        self._min_stop_pct = max(0.0, float(base.get("min_stop_pct", 0.001)))
+        self._max_stop_pct = max(0.0, float(base.get("max_stop_pct", 0.050)))
+
+        self._reg_mults, self._reg_default = _regime_table(self._cfg.get("regime_multipliers", {}) or {})
+        # keys already in _safe_upper form: an exact hit needs no strip/upper
+        self._reg_canon = {
+            k: v for k, v in self._reg_mults.items() if type(k) is str and k and k == k.strip().upper()
+        }
+
+        liq = self._cfg.get("liquidity", {}) or {}
+        self._liq_enabled = bool(liq.get("enabled", True))
+        self._max_spread_pct = float(liq.get("max_spread_pct", 0.02))
+        self._block_if_wide = bool(liq.get("block_if_spread_too_wide", False))
+        self._widen_threshold_pct = float(liq.get("widen_threshold_pct", 0.0015))
+        self._widen_slope = float(liq.get("widen_slope", 0.75))
+        self._max_widen = float(liq.get("max_widen_mult", 1.75))
+        self._min_buffer_bps = float(liq.get("min_buffer_bps", 2.0))
+        self._per_spread_bps = float(liq.get("buffer_bps_per_spread_bps", 0.50))
+        self._max_buffer_bps = float(liq.get("max_buffer_bps", 12.0))
+
+        c = self._cfg.get("confidence", {}) or {}
+        self._conf_enabled = bool(c.get("enabled", True))
+        self._min_conf = float(c.get("min_conf", 0.20))
+        self._max_conf = float(c.get("max_conf", 0.80))
+        self._floor_mult = float(c.get("floor_mult", 0.80))
+        self._ceil_mult = float(c.get("ceil_mult", 1.10))
+        # interpolation is a no-op (mult 1.0) unless max_conf > min_conf
+        self._conf_ramp = self._conf_enabled and self._max_conf > self._min_conf
+        self._conf_range = self._max_conf - self._min_conf
+        self._conf_span = self._ceil_mult - self._floor_mult
+
+        mx = self._cfg.get("max_loss", {}) or {}
+        self._ml_enabled = bool(mx.get("enabled", True))
+        self._ml_default_risk_pct = float(mx.get("risk_per_trade_pct", 0.0025))
+        self._ml_risk_pct = {
+            _intern(sid): float((row or {}).get("risk_per_trade_pct", self._ml_default_risk_pct))
+            for sid, row in (mx.get("strategies", {}) or {}).items()
+        }
+        self._ml_reg_mults, self._ml_reg_default = _regime_table(mx.get("regime_multipliers", {}) or {})
+        cap = mx.get("max_risk_usd", None)
+        self._ml_cap = None if cap is None else float(cap)
+        # (regime, strategy_id, confidence) -> (risk_pct, regime_mult, conf_mult)
+        self._ml_factors: Dict[Tuple[Any, Any, Any], Tuple[float, float, float]] = {}
 
     # ---------------------------
     # Confidence multiplier (same shape as sizing)
     # ---------------------------
     def _confidence_mult(self, conf: Optional[float]) -> float:
-        c = self._cfg.get("confidence", {}) or {}
-        if not bool(c.get("enabled", True)):
-            return 1.0
-        if conf is None:
+        if conf is None or not self._conf_ramp:
             return 1.0
 
         conf = _clamp(float(conf), 0.0, 1.0)
-        min_conf = float(c.get("min_conf", 0.20))
-        max_conf = float(c.get("max_conf", 0.80))
-        floor_mult = float(c.get("floor_mult", 0.80))
-        ceil_mult = float(c.get("ceil_mult", 1.10))
-
-        if max_conf <= min_conf:
-            return 1.0
-
-        conf_clip = _clamp(conf, min_conf, max_conf)
-        t = (conf_clip - min_conf) / (max_conf - min_conf)  # 0..1
-        return floor_mult + t * (ceil_mult - floor_mult)
+        conf_clip = _clamp(conf, self._min_conf, self._max_conf)
+        t = (conf_clip - self._min_conf) / self._conf_range  # 0..1
+        return self._floor_mult + t * self._conf_span
 
     # ---------------------------
     # Max-loss budget (optional enforcement)
@@ -124,32 +207,34 @@ class StopModule:
         strategy_id: str,
         confidence: Optional[float],
     ) -> Optional[float]:
-        mx = self._cfg.get("max_loss", {}) or {}
-        if not bool(mx.get("enabled", True)):
+        if not self._ml_enabled:
             return None
 
         if equity_usd <= 0:
             return None
 
-        # risk pct default + optional strategy override
-        default_risk_pct = float(mx.get("risk_per_trade_pct", 0.0025))
-        strat = (mx.get("strategies", {}) or {}).get(strategy_id, {}) or {}
-        risk_pct = float(strat.get("risk_per_trade_pct", default_risk_pct))
+        key = (regime, strategy_id, confidence)
+        factors = self._ml_factors.get(key)
+        if factors is None:
+            # risk pct default + optional strategy override
+            risk_pct = self._ml_risk_pct.get(strategy_id, self._ml_default_risk_pct)
+
+            # regime multiplier (for max-loss budget)
+            regime_mult = self._ml_reg_mults.get(_safe_upper(regime, "UNKNOWN"), self._ml_reg_default)
 
-        # regime multiplier (for max-loss budget)
-        reg_mults = mx.get("regime_multipliers", {}) or {}
-        reg = _safe_upper(regime, "UNKNOWN")
-        regime_mult = float(reg_mults.get(reg, reg_mults.get("UNKNOWN", 1.0)))
+            # confidence multiplier
+            conf_mult = self._confidence_mult(confidence)
 
-        # confidence multiplier
-        conf_mult = self._confidence_mult(confidence)
+            if len(self._ml_factors) >= _ML_FACTOR_CACHE_MAX:
+                self._ml_factors.clear()
+            factors = self._ml_factors[key] = (risk_pct, regime_mult, conf_mult)
+        risk_pct, regime_mult, conf_mult = factors
 
         budget = equity_usd * risk_pct * regime_mult * conf_mult
 
         # hard cap
-        cap = mx.get("max_risk_usd", None)
-        if cap is not None:
-            budget = min(budget, float(cap))
+        if self._ml_cap is not None:
+            budget = min(budget, self._ml_cap)
 
         # if regime_mult is 0 => budget is 0 => block upstream
         return max(0.0, float(budget))
@@ -184,61 +269,24 @@ class StopModule:
     # Main stop computation
     # ---------------------------
     def compute(self, inp: StopInputs) -> StopResult:
-        base = self._cfg.get("base", {}) or {}
-        liq = self._cfg.get("liquidity", {}) or {}
-        reg_mults = self._cfg.get("regime_multipliers", {}) or {}
-
-        sym = (inp.symbol or "").upper()
-        side = (inp.side or "").strip().upper()
-        if side not in {"BUY", "SELL"}:
-            # allow "buy"/"sell"
-            if side.lower() == "buy":
-                side = "BUY"
-            elif side.lower() == "sell":
-                side = "SELL"
-            else:
-                return StopResult(
-                    stop_price=0.0,
-                    stop_distance_usd=0.0,
-                    method="UNKNOWN",
-                    base_distance_usd=0.0,
-                    regime_mult=0.0,
-                    liquidity_mult=0.0,
-                    buffer_usd=0.0,
-                    spread_pct=None,
-                    max_loss_usd=None,
-                    max_qty_for_loss=None,
-                    qty_capped_to=None,
-                    blocked=True,
-                    reason=f"BLOCK: invalid side '{inp.side}' for {sym}",
-                )
+        side = _SIDES.get(inp.side)
+        if side is None:
+            # padded / mixed-case spellings
+            side = _SIDES.get((inp.side or "").strip().upper())
+            if side is None:
+                return _blocked(f"BLOCK: invalid side '{inp.side}' for {(inp.symbol or '').upper()}")
 
         if inp.entry_price <= 0:
-            return StopResult(
-                stop_price=0.0,
-                stop_distance_usd=0.0,
-                method="UNKNOWN",
-                base_distance_usd=0.0,
-                regime_mult=0.0,
-                liquidity_mult=0.0,
-                buffer_usd=0.0,
-                spread_pct=None,
-                max_loss_usd=None,
-                max_qty_for_loss=None,
-                qty_capped_to=None,
-                blocked=True,
-                reason=f"BLOCK: entry_price must be > 0 for {sym}",
-            )
-
-        method = _safe_upper(str(base.get("method", "PCT")), "PCT")
+            sym = (inp.symbol or "").upper()
+            return _blocked(f"BLOCK: entry_price must be > 0 for {sym}")
 
-        stop_pct = float(base.get("stop_pct", 0.005))
-        atr_mult = float(base.get("atr_multiple", 1.5))
+        method = self._base_method
+        stop_pct = self._stop_pct
 
         # base distance
         if method == "ATR":
             if inp.atr is not None and float(inp.atr) > 0:
-                base_dist = float(inp.atr) * atr_mult
+                base_dist = float(inp.atr) * self._atr_mult
             else:
                 # fallback
                 base_dist = inp.entry_price * stop_pct
@@ -248,32 +296,23 @@ class StopModule:
             method = "PCT"
 
         # clamp base distance by min/max pct
-        min_stop_pct = float(base.get("min_stop_pct", 0.001))
-        max_stop_pct = float(base.get("max_stop_pct", 0.050))
-
-        min_dist = inp.entry_price * max(0.0, min_stop_pct)
-        max_dist = inp.entry_price * max(0.0, max_stop_pct)
+        min_dist = inp.entry_price * self._min_stop_pct
+        max_dist = inp.entry_price * self._max_stop_pct
         if max_dist > 0:
             base_dist = _clamp(base_dist, min_dist, max_dist)
 
         # regime multiplier for stop width
-        reg = _safe_upper(inp.regime, "UNKNOWN")
-        regime_mult = float(reg_mults.get(reg, reg_mults.get("UNKNOWN", 1.0)))
+        reg = inp.regime
+        regime_mult = self._reg_canon.get(reg)
+        if regime_mult is None:
+            reg = _safe_upper(reg, "UNKNOWN")
+            regime_mult = self._reg_mults.get(reg, self._reg_default)
         if regime_mult <= 0:
-            return StopResult(
-                stop_price=0.0,
-                stop_distance_usd=0.0,
+            return _blocked(
+                f"BLOCK: regime stop multiplier <= 0 for regime={reg}",
                 method=method,
                 base_distance_usd=float(base_dist),
                 regime_mult=regime_mult,
-                liquidity_mult=0.0,
-                buffer_usd=0.0,
-                spread_pct=None,
-                max_loss_usd=None,
-                max_qty_for_loss=None,
-                qty_capped_to=None,
-                blocked=True,
-                reason=f"BLOCK: regime stop multiplier <= 0 for regime={reg}",
             )
 
         dist = float(base_dist) * regime_mult
@@ -283,47 +322,32 @@ class StopModule:
         buffer_usd = 0.0
         sp_pct: Optional[float] = None
 
-        if bool(liq.get("enabled", True)) and inp.bid is not None and inp.ask is not None:
+        if self._liq_enabled and inp.bid is not None and inp.ask is not None:
             bid = float(inp.bid)
             ask = float(inp.ask)
             sp_pct = _spread_pct(bid, ask)
 
-            max_spread_pct = float(liq.get("max_spread_pct", 0.02))
-            if bool(liq.get("block_if_spread_too_wide", False)) and sp_pct > max_spread_pct:
-                return StopResult(
-                    stop_price=0.0,
-                    stop_distance_usd=0.0,
+            max_spread_pct = self._max_spread_pct
+            if self._block_if_wide and sp_pct > max_spread_pct:
+                return _blocked(
+                    f"BLOCK: spread {sp_pct:.3%} > max_spread_pct {max_spread_pct:.3%}",
                     method=method,
                     base_distance_usd=float(base_dist),
                     regime_mult=regime_mult,
-                    liquidity_mult=0.0,
-                    buffer_usd=0.0,
                     spread_pct=sp_pct,
-                    max_loss_usd=None,
-                    max_qty_for_loss=None,
-                    qty_capped_to=None,
-                    blocked=True,
-                    reason=f"BLOCK: spread {sp_pct:.3%} > max_spread_pct {max_spread_pct:.3%}",
                 )
 
-            widen_threshold_pct = float(liq.get("widen_threshold_pct", 0.0015))
-            slope = float(liq.get("widen_slope", 0.75))
-            max_widen = float(liq.get("max_widen_mult", 1.75))
-
+            widen_threshold_pct = self._widen_threshold_pct
             if widen_threshold_pct > 0 and sp_pct > widen_threshold_pct:
                 excess = (sp_pct - widen_threshold_pct) / widen_threshold_pct
-                liquidity_mult = 1.0 + slope * excess
-                liquidity_mult = _clamp(liquidity_mult, 1.0, max_widen)
+                liquidity_mult = 1.0 + self._widen_slope * excess
+                liquidity_mult = _clamp(liquidity_mult, 1.0, self._max_widen)
                 dist *= liquidity_mult
 
             # add a buffer in bps (spread-aware)
             spread_bps = sp_pct * 10000.0
-            min_buffer_bps = float(liq.get("min_buffer_bps", 2.0))
-            per_spread_bps = float(liq.get("buffer_bps_per_spread_bps", 0.50))
-            max_buffer_bps = float(liq.get("max_buffer_bps", 12.0))
-
-            buffer_bps = max(min_buffer_bps, spread_bps * per_spread_bps)
-            buffer_bps = min(buffer_bps, max_buffer_bps)
+            buffer_bps = max(self._min_buffer_bps, spread_bps * self._per_spread_bps)
+            buffer_bps = min(buffer_bps, self._max_buffer_bps)
 
             buffer_usd = inp.entry_price * (buffer_bps / 10000.0)
             dist += buffer_usd
@@ -331,20 +355,14 @@ class StopModule:
         # final sanity
         dist = float(dist)
         if dist <= 0:
-            return StopResult(
-                stop_price=0.0,
-                stop_distance_usd=0.0,
+            return _blocked(
+                "BLOCK: computed stop distance <= 0",
                 method=method,
                 base_distance_usd=float(base_dist),
                 regime_mult=regime_mult,
                 liquidity_mult=float(liquidity_mult),
                 buffer_usd=float(buffer_usd),
                 spread_pct=sp_pct,
-                max_loss_usd=None,
-                max_qty_for_loss=None,
-                qty_capped_to=None,
-                blocked=True,
-                reason="BLOCK: computed stop distance <= 0",
             )
 
         stop_price = inp.entry_price - dist if side == "BUY" else inp.entry_price + dist
@@ -385,3 +403,159 @@ class StopModule:
             blocked=False,
             reason="OK",
         )
+
+    # ---------------------------
+    # Batched compute (backtest sweeps)
+    # ---------------------------
+    def compute_batch(
+        self,
+        *,
+        sides: Sequence[Any],
+        entry_prices: Sequence[float],
+        regimes: Sequence[Any],
+        strategy_ids: Optional[Sequence[Any]] = None,
+        confidences: Optional[Sequence[Optional[float]]] = None,
+        bids: Optional[Sequence[Optional[float]]] = None,
+        asks: Optional[Sequence[Optional[float]]] = None,
+        atrs: Optional[Sequence[Optional[float]]] = None,
+        equity_usd: Optional[Sequence[Optional[float]]] = None,
+        qtys: Optional[Sequence[Optional[float]]] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Columnar compute(): row i gives the same numbers as compute() on the
+        matching StopInputs. Optional columns may be omitted or hold None/NaN
+        for "not provided".
+
+        Returns StopResult fields as arrays: float64 for the prices/diagnostics
+        (NaN where compute() gives None for spread_pct / max_loss_usd), int64
+        max_qty_for_loss / qty_capped_to (-1 for None) and bool `blocked`.
+        method/reason are not materialised; call compute() on a blocked row
+        for its message.
+        """
+        n = len(sides)
+        entry = np.asarray(entry_prices, dtype=np.float64)
+
+        def col(values: Optional[Sequence[Any]]) -> np.ndarray:
+            # None converts to NaN under a float64 cast
+            if values is None:
+                return np.full(n, np.nan)
+            return np.asarray(values, dtype=np.float64)
+
+        # text columns are resolved once per distinct value, then gathered by code
+        side_codes, side_vals = _factorize(sides)
+        side_u = [_SIDES.get(s) or _SIDES.get((s or "").strip().upper()) for s in side_vals]
+        valid = np.array([s is not None for s in side_u], dtype=bool)[side_codes] & ~(entry <= 0)
+        sell = np.array([s == "SELL" for s in side_u], dtype=bool)[side_codes]
+
+        reg_codes, reg_vals = _factorize(regimes)
+        reg_keys = [_safe_upper(r, "UNKNOWN") for r in reg_vals]
+        regime_mult = np.array(
+            [self._reg_mults.get(k, self._reg_default) for k in reg_keys], dtype=np.float64
+        )[reg_codes]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # base distance
+            base = entry * self._stop_pct
+            if self._base_method == "ATR":
+                atr = col(atrs)
+                base = np.where(atr > 0, atr * self._atr_mult, base)
+
+            # clamp base distance by min/max pct (same comparisons as _clamp)
+            min_dist = entry * self._min_stop_pct
+            max_dist = entry * self._max_stop_pct
+            clamped = np.where(base < max_dist, base, max_dist)
+            clamped = np.where(clamped > min_dist, clamped, min_dist)
+            base = np.where(max_dist > 0, clamped, base)
+
+            reg_block = valid & (regime_mult <= 0)
+            ok = valid & ~reg_block
+            dist = base * regime_mult
+
+            # liquidity widening + buffer
+            liquidity_mult = np.ones(n)
+            buffer_usd = np.zeros(n)
+            sp_pct = np.full(n, np.nan)
+            wide_block = np.zeros(n, dtype=bool)
+            if self._liq_enabled:
+                bid = col(bids)
+                ask = col(asks)
+                quoted = ~np.isnan(bid) & ~np.isnan(ask)
+                mid = (bid + ask) / 2.0
+                sp_pct = np.where(quoted, np.where(mid <= 0, 1.0, (ask - bid) / mid), np.nan)
+
+                if self._block_if_wide:
+                    wide_block = ok & quoted & (sp_pct > self._max_spread_pct)
+                    ok &= ~wide_block
+
+                thr = self._widen_threshold_pct
+                if thr > 0:
+                    widen = quoted & (sp_pct > thr)
+                    lm = 1.0 + self._widen_slope * ((sp_pct - thr) / thr)
+                    lm = np.where(lm < self._max_widen, lm, self._max_widen)
+                    lm = np.where(lm > 1.0, lm, 1.0)
+                    liquidity_mult = np.where(widen, lm, 1.0)
+                    dist = np.where(widen, dist * liquidity_mult, dist)
+
+                buffer_bps = sp_pct * 10000.0 * self._per_spread_bps
+                buffer_bps = np.where(buffer_bps > self._min_buffer_bps, buffer_bps, self._min_buffer_bps)
+                buffer_bps = np.where(self._max_buffer_bps < buffer_bps, self._max_buffer_bps, buffer_bps)
+                buffer_usd = np.where(quoted, entry * (buffer_bps / 10000.0), 0.0)
+                dist = np.where(quoted, dist + buffer_usd, dist)
+
+            ok &= ~(dist <= 0)
+            stop_price = np.where(sell, entry + dist, entry - dist)
+
+            # max-loss enforcement outputs
+            max_loss_usd = np.full(n, np.nan)
+            max_qty_for_loss = np.full(n, -1, dtype=np.int64)
+            qty_capped_to = np.full(n, -1, dtype=np.int64)
+            eq = col(equity_usd)
+            funded = ok & (eq > 0)
+            if self._ml_enabled and funded.any():
+                sid_codes, sid_vals = _factorize([None] * n if strategy_ids is None else strategy_ids)
+                risk_pct = np.array(
+                    [self._ml_risk_pct.get(_safe_upper(sid, "UNKNOWN"), self._ml_default_risk_pct) for sid in sid_vals],
+                    dtype=np.float64,
+                )[sid_codes]
+                ml_mult = np.array(
+                    [self._ml_reg_mults.get(k, self._ml_reg_default) for k in reg_keys], dtype=np.float64
+                )[reg_codes]
+                conf_mult = np.ones(n)
+                if self._conf_ramp:
+                    conf = col(confidences)
+                    c = np.where(conf < 1.0, conf, 1.0)
+                    c = np.where(c > 0.0, c, 0.0)
+                    c = np.where(c < self._max_conf, c, self._max_conf)
+                    c = np.where(c > self._min_conf, c, self._min_conf)
+                    t = (c - self._min_conf) / self._conf_range
+                    conf_mult = np.where(np.isnan(conf), 1.0, self._floor_mult + t * self._conf_span)
+
+                budget = eq * risk_pct * ml_mult * conf_mult
+                if self._ml_cap is not None:
+                    budget = np.where(self._ml_cap < budget, self._ml_cap, budget)
+                budget = np.where(budget > 0.0, budget, 0.0)
+                max_loss_usd = np.where(funded, budget, np.nan)
+
+                mq = np.where(funded, budget // np.where(funded, dist, 1.0), 0.0).astype(np.int64)
+                mq = np.maximum(mq, 0)
+                max_qty_for_loss = np.where(funded, mq, -1)
+
+                qty = col(qtys)
+                sized = funded & ~np.isnan(qty)
+                q = np.trunc(np.where(sized, qty, 0.0)).astype(np.int64)
+                qty_capped_to = np.where(sized, np.minimum(q, mq), -1)
+
+        diag = valid & ~reg_block
+        return {
+            "stop_price": np.where(ok, stop_price, 0.0),
+            "stop_distance_usd": np.where(ok, dist, 0.0),
+            "base_distance_usd": np.where(valid, base, 0.0),
+            "regime_mult": np.where(valid, regime_mult, 0.0),
+            "liquidity_mult": np.where(diag & ~wide_block, liquidity_mult, 0.0),
+            "buffer_usd": np.where(diag & ~wide_block, buffer_usd, 0.0),
+            "spread_pct": np.where(diag, sp_pct, np.nan),
+            "max_loss_usd": max_loss_usd,
+            "max_qty_for_loss": max_qty_for_loss,
+            "qty_capped_to": qty_capped_to,
+            "blocked": ~ok,
+        }
@@ -1,13 +1,14 @@
 # Core/strategy_eligibility_mask.py
 from __future__ import annotations
 
+import re
+import sys
 from dataclasses import dataclass
-from fnmatch import fnmatchcase
+from fnmatch import translate
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-
-import yaml
+from typing import Any, Dict, FrozenSet, List, Optional, Pattern, Tuple
 
+from Core.config_cache import load_yaml_cached
 from Core.decision import Decision
 
 
@@ -15,29 +16,47 @@ def _as_list(x: Any) -> List[str]:
     if x is None:
         return []
     if isinstance(x, list):
-        return [str(i) for i in x]
-    return [str(x)]
+        return [sys.intern(str(i)) for i in x]
+    return [sys.intern(str(x))]
 
 
-def _matches_any(patterns: List[str], value: str) -> bool:
+def _compile_patterns(patterns: List[str]) -> Tuple[FrozenSet[str], Optional[Pattern[str]]]:
     """
-    Supports exact + wildcard patterns (e.g., 'MEAN_*').
+    Exact + wildcard patterns (e.g., 'MEAN_*') compiled once: every pattern
+    also matches itself literally, and the wildcard ones are joined into a
+    single fnmatch-equivalent regex.
     """
-    for p in patterns:
-        p = str(p)
-        if p == value:
-            return True
-        # wildcard support
-        if any(ch in p for ch in ["*", "?", "["]):
-            if fnmatchcase(value, p):
-                return True
-    return False
-
-
-@dataclass(frozen=True)
+    wild = [translate(p) for p in patterns if any(ch in p for ch in "*?[")]
+    return frozenset(patterns), (re.compile("|".join(wild)) if wild else None)
+
+
+def _matches(exact: FrozenSet[str], rx: Optional[Pattern[str]], value: str) -> bool:
+    return value in exact or (rx is not None and rx.match(value) is not None)
+
+
+@dataclass(frozen=True, slots=True)
 class RegimeRule:
     allow: List[str]
     prohibit: List[str]
+    allow_exact: FrozenSet[str] = frozenset()
+    allow_re: Optional[Pattern[str]] = None
+    prohibit_exact: FrozenSet[str] = frozenset()
+    prohibit_re: Optional[Pattern[str]] = None
+
+
+def _rule(row: Dict[str, Any]) -> RegimeRule:
+    allow = _as_list(row.get("allow"))
+    prohibit = _as_list(row.get("prohibit")) + _as_list(row.get("block"))
+    allow_exact, allow_re = _compile_patterns(allow)
+    prohibit_exact, prohibit_re = _compile_patterns(prohibit)
+    return RegimeRule(
+        allow=allow,
+        prohibit=prohibit,
+        allow_exact=allow_exact,
+        allow_re=allow_re,
+        prohibit_exact=prohibit_exact,
+        prohibit_re=prohibit_re,
+    )
 
 
 class StrategyEligibilityMask:
@@ -68,6 +87,8 @@ class StrategyEligibilityMask:
         if config is None:
             config = {}
 
+        if isinstance(config, StrategyEligibilityMask):
+            raise TypeError("StrategyEligibilityMask is already constructed; use it directly instead of re-wrapping.")
         if not isinstance(config, dict):
             raise TypeError("StrategyEligibilityMask config must be a dict (or use keyword args).")
 
@@ -83,10 +104,7 @@ class StrategyEligibilityMask:
 
     @classmethod
     def from_yaml(cls, path: str | Path) -> "StrategyEligibilityMask":
-        path = Path(path)
-        with path.open("r", encoding="utf-8") as f:
-            cfg = yaml.safe_load(f) or {}
-        return cls(cfg)
+        return cls(load_yaml_cached(path))
 
     def _load_from_config_dict(self, cfg: Dict[str, Any]) -> None:
         self.min_confidence_to_trade = float(cfg.get("min_confidence_to_trade", 0.0))
@@ -106,24 +124,23 @@ class StrategyEligibilityMask:
         self.regimes = {}
         if isinstance(matrix, dict):
             for regime, row in matrix.items():
-                row = row or {}
-                allow = _as_list(row.get("allow"))
-                prohibit = _as_list(row.get("prohibit")) + _as_list(row.get("block"))
-                self.regimes[str(regime)] = RegimeRule(allow=allow, prohibit=prohibit)
+                self.regimes[sys.intern(str(regime))] = _rule(row or {})
 
     def _normalize_regimes(self, regimes: Dict[str, Any]) -> Dict[str, RegimeRule]:
         out: Dict[str, RegimeRule] = {}
         for regime, row in regimes.items():
-            row = row or {}
-            allow = _as_list(row.get("allow"))
-            prohibit = _as_list(row.get("prohibit")) + _as_list(row.get("block"))
-            out[str(regime)] = RegimeRule(allow=allow, prohibit=prohibit)
+            out[sys.intern(str(regime))] = _rule(row or {})
         return out
 
     # ----------- TEST SIGNATURE -----------
-    def decide(self, regime: str, strategy_id: str, *, confidence: float = 1.0, qty: int = 1) -> Decision:
+    def decide(
+        self, regime: str, strategy_id: str, *, confidence: float = 1.0, qty: int = 1, verbose: bool = True
+    ) -> Decision:
         """
         Unit tests call: decide("RANGE", "MEAN_REVERSION", confidence=0.90)
+
+        verbose=False leaves `details` empty on ALLOW decisions, for callers
+        that only inspect blocks; blocked decisions always carry details.
         """
         regime = str(regime)
         strategy_id = str(strategy_id)
@@ -151,6 +168,8 @@ class StrategyEligibilityMask:
         rule = self.regimes.get(regime)
         if rule is None:
             allowed = (self.default_policy == "ALLOW")
+            if allowed and not verbose:
+                return Decision(True, int(qty), "UNKNOWN_REGIME_DEFAULT_POLICY", action="ALLOW")
             return Decision(
                 allowed=allowed,
                 qty=int(qty) if allowed else 0,
@@ -159,45 +178,57 @@ class StrategyEligibilityMask:
                 action="ALLOW" if allowed else "BLOCK",
             )
 
-        # Prohibit always wins (supports wildcards)
-        if _matches_any(rule.prohibit, strategy_id):
+        verdict = self._verdict(rule, strategy_id)
+        if not verbose and verdict.startswith("ALLOWED"):
+            return Decision(True, int(qty), verdict, action="ALLOW")
+        if verdict == "prohibited_by_mask":
             return Decision(
                 allowed=False,
                 qty=0,
-                reason="prohibited_by_mask",
+                reason=verdict,
                 details={"regime": regime, "strategy": strategy_id, "prohibit": rule.prohibit},
                 action="BLOCK",
             )
-
-        # Allow-list exists => must match (supports wildcards)
-        if rule.allow:
-            if _matches_any(rule.allow, strategy_id):
-                return Decision(
-                    allowed=True,
-                    qty=int(qty),
-                    reason="ALLOWED_BY_MASK",
-                    details={"regime": regime, "strategy": strategy_id, "allow": rule.allow},
-                    action="ALLOW",
-                )
+        if verdict == "NOT_IN_ALLOW_LIST":
             return Decision(
                 allowed=False,
                 qty=0,
-                reason="NOT_IN_ALLOW_LIST",
+                reason=verdict,
                 details={"regime": regime, "strategy": strategy_id, "allow": rule.allow},
                 action="BLOCK",
             )
-
-        # No allow list => allow unless prohibited
+        if verdict == "ALLOWED_BY_MASK":
+            return Decision(
+                allowed=True,
+                qty=int(qty),
+                reason=verdict,
+                details={"regime": regime, "strategy": strategy_id, "allow": rule.allow},
+                action="ALLOW",
+            )
         return Decision(
             allowed=True,
             qty=int(qty),
-            reason="ALLOWED_BY_DEFAULT",
+            reason=verdict,
             details={"regime": regime, "strategy": strategy_id},
             action="ALLOW",
         )
 
+    @staticmethod
+    def _verdict(rule: RegimeRule, strategy_id: str) -> str:
+        """Reason code for strategy_id under rule, from the precompiled patterns."""
+        # Prohibit always wins (supports wildcards)
+        if _matches(rule.prohibit_exact, rule.prohibit_re, strategy_id):
+            return "prohibited_by_mask"
+        # Allow-list exists => must match (supports wildcards)
+        if rule.allow:
+            if _matches(rule.allow_exact, rule.allow_re, strategy_id):
+                return "ALLOWED_BY_MASK"
+            return "NOT_IN_ALLOW_LIST"
+        # No allow list => allow unless prohibited
+        return "ALLOWED_BY_DEFAULT"
+
     # ----------- ENGINE COMPAT (optional) -----------
-    def check(self, order: Any, meta: Dict[str, Any]) -> Decision:
+    def check(self, order: Any, meta: Dict[str, Any], *, verbose: bool = True) -> Decision:
         """
         Engine-friendly wrapper if you call it with order/meta.
         """
@@ -205,7 +236,7 @@ class StrategyEligibilityMask:
         regime = str(meta.get("regime") or meta.get("regime_label") or "UNKNOWN")
         confidence = meta.get("regime_conf", 1.0)
         qty = int(getattr(order, "qty", 1))
-        return self.decide(regime, strategy_id, confidence=confidence, qty=qty)
+        return self.decide(regime, strategy_id, confidence=confidence, qty=qty, verbose=verbose)
 
 
 def load_strategy_eligibility_mask(path: str | Path) -> StrategyEligibilityMask:
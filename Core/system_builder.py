@@ -4,18 +4,16 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional
 
-import yaml
-
+from Core.config_cache import load_yaml_cached
 from Core.policy_engine import PolicyEngine
 from Core.portfolio_constraints import PortfolioConstraintsGate, MetaPortfolioProvider
-from Core.strategy_eligibility_mask import StrategyEligibilityMask, load_strategy_eligibility_mask
+from Core.strategy_eligibility_mask import load_strategy_eligibility_mask
 
 
 def _load_yaml_if_exists(path: Path) -> dict:
     if not path.exists():
         return {}
-    with path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    return load_yaml_cached(path)
 
 
 def build_system(config_dir: str = "Config") -> PolicyEngine:
@@ -28,7 +26,7 @@ def build_system(config_dir: str = "Config") -> PolicyEngine:
     sem_path = cfg_dir / "strategy_eligibility_mask.yaml"
     eligibility_mask = None
     if sem_path.exists():
-        eligibility_mask = StrategyEligibilityMask(load_strategy_eligibility_mask(sem_path))
+        eligibility_mask = load_strategy_eligibility_mask(sem_path)
 
     # Portfolio constraints
     pc_path = cfg_dir / "portfolio_constraints.yaml"
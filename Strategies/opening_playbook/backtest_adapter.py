@@ -5,15 +5,22 @@ from pathlib import Path
 from typing import Any, Dict, List
 import csv
 
-from Core.promotion.backtest_engine import Bar
+from Core.promotion.backtest_engine import Bar, BarArrays
 
 # =========================================================
 # REQUIRED by promotion_suite:
 #   load_bars() -> List[Bar]
 #   fit(train_bars) -> params
 #   signal(bars, params) -> List[int] targets (-1/0/+1)
+# Optional:
+#   CAUSAL_SIGNAL = True if target[i] depends only on bars[:i+1]
+#   (lets walk-forward reuse one signal run for IS and OOS)
+#   signal_range(soa, start, end, params) -> targets for bars[start:end],
+#   read from BarArrays (walk-forward skips building a Bar list per window)
 # =========================================================
 
+CAUSAL_SIGNAL = True  # MA filter reads closes[i - lb:i] and closes[i] only
+
 def _repo_root() -> Path:
     return Path(__file__).resolve().parents[2]  # BotTrader/
 
@@ -115,18 +122,10 @@ def fit(train_bars: List[Bar]) -> Dict[str, Any]:
 
     return {"ma_lookback": best_lb}
 
-def signal(bars: List[Bar], params: Dict[str, Any]) -> List[int]:
-    """
-    Toy signal (placeholder): MA trend filter
-    +1 if close > MA
-    -1 if close < MA
-     0 otherwise
-    """
-    lb = int(params.get("ma_lookback", 150))
-    closes = [b.close for b in bars]
-    targets: List[int] = [0] * len(bars)
+def _ma_targets(closes: List[float], lb: int) -> List[int]:
+    targets: List[int] = [0] * len(closes)
 
-    for i in range(len(bars)):
+    for i in range(len(closes)):
         if i < lb:
             targets[i] = 0
             continue
@@ -139,3 +138,18 @@ def signal(bars: List[Bar], params: Dict[str, Any]) -> List[int]:
             targets[i] = 0
 
     return targets
+
+def signal(bars: List[Bar], params: Dict[str, Any]) -> List[int]:
+    """
+    Toy signal (placeholder): MA trend filter
+    +1 if close > MA
+    -1 if close < MA
+     0 otherwise
+    """
+    lb = int(params.get("ma_lookback", 150))
+    return _ma_targets([b.close for b in bars], lb)
+
+def signal_range(soa: BarArrays, start: int, end: int, params: Dict[str, Any]) -> List[int]:
+    """signal() over bars[start:end], reading closes straight from the arrays."""
+    lb = int(params.get("ma_lookback", 150))
+    return _ma_targets(soa.close[start:end].tolist(), lb)
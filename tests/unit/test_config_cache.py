@@ -0,0 +1,26 @@
+import os
+from pathlib import Path
+
+from Core.config_cache import load_yaml_cached
+
+
+def test_cached_parse_is_private_copy(tmp_path: Path):
+    cfg = tmp_path / "cfg.yaml"
+    cfg.write_text("limits: {max_qty: 10}\n", encoding="utf-8")
+
+    a = load_yaml_cached(cfg)
+    a["limits"]["max_qty"] = 999
+
+    b = load_yaml_cached(cfg)
+    assert b == {"limits": {"max_qty": 10}}
+
+
+def test_reparses_when_file_changes(tmp_path: Path):
+    cfg = tmp_path / "cfg.yaml"
+    cfg.write_text("limits: {max_qty: 10}\n", encoding="utf-8")
+    assert load_yaml_cached(cfg)["limits"]["max_qty"] == 10
+
+    cfg.write_text("limits: {max_qty: 20}\n", encoding="utf-8")
+    st = cfg.stat()
+    os.utime(cfg, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert load_yaml_cached(cfg)["limits"]["max_qty"] == 20
@@ -1,11 +1,23 @@
 from __future__ import annotations
 
+import json
 import os
 from pathlib import Path
 
+import numpy as np
+import pytest
+
 from Core.execution_alpha import ExecutionAlpha
 from Core.slippage_tracker import SlippageTracker
 
+# Budgets loose enough that only the single-trade bps thresholds can trip.
+SLIPPAGE_LIMITS = dict(
+    max_acceptable_slippage_bps=50.0,
+    hourly_slippage_limit_usd=999999.0,
+    daily_slippage_limit_usd=999999.0,
+    equity_slippage_limit_pct=0.999,
+)
+
 
 def _cfg_path() -> str:
     here = Path(__file__).resolve().parents[2]  # BotTrader/
@@ -66,3 +78,114 @@ def test_slippage_kill_switch_severe_trade(tmp_path: Path):
     )
     assert res.paused is True
     assert st.is_paused() is True
+
+
+def test_slippage_journal_replays_after_restart(tmp_path: Path):
+    state = tmp_path / "slip_state.json"
+    events = tmp_path / "slip_events.jsonl"
+    limits = dict(SLIPPAGE_LIMITS, snapshot_every=4)
+
+    st = SlippageTracker(state_path=state, events_path=events, **limits)
+    for i in range(6):  # one snapshot at 4, two fills only in the journal
+        st.record_fill(symbol="SPY", side="BUY", qty=10, expected_price=100.0, fill_price=100.0 + 0.01 * i)
+
+    restored = SlippageTracker(state_path=state, events_path=events, **limits)
+    assert restored.stats() == st.stats()
+    assert restored.stats()["n"] == 6
+
+
+def test_slippage_async_snapshots_restore_after_close(tmp_path: Path):
+    state = tmp_path / "slip_state.json"
+    events = tmp_path / "slip_events.jsonl"
+    limits = dict(SLIPPAGE_LIMITS, snapshot_every=4)
+
+    st = SlippageTracker(state_path=state, events_path=events, async_snapshots=True, **limits)
+    for i in range(10):
+        st.record_fill(symbol="SPY", side="BUY", qty=10, expected_price=100.0, fill_price=100.0 + 0.01 * i)
+    st.close()
+
+    assert st.journal_path.stat().st_size == 0
+    restored = SlippageTracker(state_path=state, events_path=events, **limits)
+    assert restored.stats() == st.stats()
+    assert restored.stats()["n"] == 10
+
+
+def test_slippage_batch_matches_sequential_fills(tmp_path: Path):
+    limits = dict(
+        SLIPPAGE_LIMITS,
+        max_acceptable_slippage_bps=5.0,
+        hourly_slippage_limit_usd=1.4,
+        daily_slippage_limit_usd=12.0,
+    )
+    fills = [
+        ("BUY", 10, 100.0, 100.02),  # +2 bps
+        ("sell", 10, 100.0, 99.92),  # +8 bps: WARN
+        ("SELL", 50, 100.0, 100.01),  # -1 bps, pushes the hourly budget over
+        ("BUY", 100, 100.0, 100.11),  # +11 bps: SEVERE, daily budget breached
+        ("BUY", 10, 0.0, 1.0),
+    ]
+
+    seq = SlippageTracker(state_path=tmp_path / "a.json", events_path=tmp_path / "a.jsonl", **limits)
+    expected = [
+        seq.record_fill(symbol="SPY", side=s, qty=q, expected_price=e, fill_price=f, ts=1000.0 + i)
+        for i, (s, q, e, f) in enumerate(fills)
+    ]
+
+    batch = SlippageTracker(state_path=tmp_path / "b.json", events_path=tmp_path / "b.jsonl", **limits)
+    got = batch.record_fills_batch(
+        symbols=["SPY"] * len(fills),
+        sides=[f[0] for f in fills],
+        qtys=[f[1] for f in fills],
+        expected_prices=[f[2] for f in fills],
+        fill_prices=[f[3] for f in fills],
+        ts=[1000.0 + i for i in range(len(fills))],
+    )
+
+    assert got == expected
+    assert [r.severity for r in got] == ["OK", "WARN", "WARN", "SEVERE", "SEVERE"]
+    assert batch.stats() == seq.stats()
+    assert batch.is_paused() is True
+
+
+def test_slippage_event_extra_encodes_numpy_and_nan_before_state_changes(tmp_path: Path):
+    events = tmp_path / "slip_events.jsonl"
+    st = SlippageTracker(
+        state_path=tmp_path / "slip_state.json",
+        events_path=events,
+        **SLIPPAGE_LIMITS,
+    )
+    fill = dict(symbol="SPY", side="BUY", qty=10, expected_price=100.0, fill_price=100.01)
+
+    st.record_fill(**fill, extra={"n": np.int64(3), "px": np.float64(1.5), "gap": float("nan")})
+    before = st.stats()
+    with pytest.raises(TypeError):
+        st.record_fill(**fill, extra={"bad": object()})
+    assert st.stats() == before
+
+    st.close()
+    lines = events.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    assert "NaN" in lines[0]
+    assert json.loads(lines[0])["extra"]["n"] == 3
+
+
+def test_slippage_batch_rejects_mismatched_columns(tmp_path: Path):
+    events = tmp_path / "slip_events.jsonl"
+    st = SlippageTracker(state_path=tmp_path / "slip_state.json", events_path=events, **SLIPPAGE_LIMITS)
+    before = st.stats()
+
+    with pytest.raises(ValueError, match="qtys"):
+        st.record_fills_batch(
+            symbols=["X", "Y"], sides=["BUY", "BUY"], qtys=[10],
+            expected_prices=[100.0, 100.0], fill_prices=[100.01, 100.01],
+        )
+    with pytest.raises(ValueError, match="ts"):
+        st.record_fills_batch(
+            symbols=["X", "Y"], sides=["BUY", "BUY"], qtys=[10, 10],
+            expected_prices=[100.0, 100.0], fill_prices=[100.01, 100.01], ts=[1000.0],
+        )
+
+    assert st.stats() == before
+    st.close()
+    for path in (events, st.journal_path):
+        assert not path.exists() or path.stat().st_size == 0
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from Core.order_engine import OrderEngine
+
+
+def _block_symbol(symbol: str):
+    def gate(payload: Dict[str, Any]) -> Dict[str, Any]:
+        if payload["symbol"] == symbol:
+            payload["blocked"] = True
+            payload["reasons"].append("eligibility_block")
+        return payload
+
+    return gate
+
+
+def test_blocking_gate_short_circuits_later_gates():
+    seen: List[str] = []
+
+    def throttle(payload: Dict[str, Any]) -> Dict[str, Any]:
+        seen.append(payload["symbol"])
+        return payload
+
+    eng = OrderEngine(eligibility_mask=_block_symbol("SPY"), trade_throttle=throttle)
+    out = eng.place_order("SPY", "BUY", 1, "TEST")
+
+    assert seen == []
+    assert out["signal"]["meta"]["blocked"] is True
+    steps = {t["step"]: t for t in out["trace"]}
+    assert steps["trade_throttle"]["reason"] == "blocked_upstream"
+
+
+def test_place_orders_prunes_cohort_per_stage():
+    cohorts: List[List[str]] = []
+
+    class BatchThrottle:
+        def __call__(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+            raise AssertionError("batch gate should be called via batch()")
+
+        def batch(self, payloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            cohorts.append([p["symbol"] for p in payloads])
+            return payloads
+
+    eng = OrderEngine(eligibility_mask=_block_symbol("SPY"), trade_throttle=BatchThrottle())
+    outs = eng.place_orders(
+        [
+            {"symbol": "SPY", "side": "BUY", "qty": 1, "strategy": "TEST"},
+            {"symbol": "QQQ", "side": "SELL", "qty": 2, "strategy": "TEST"},
+        ]
+    )
+
+    assert cohorts == [["QQQ"]]
+    assert [o["signal"]["symbol"] for o in outs] == ["SPY", "QQQ"]
+    assert outs[0]["signal"]["meta"]["blocked"] is True
+    assert outs[1]["signal"]["meta"]["blocked"] is False
+
+
+def test_non_positive_qty_is_rejected_before_gates():
+    seen: List[str] = []
+
+    def elig(payload: Dict[str, Any]) -> Dict[str, Any]:
+        seen.append(payload["symbol"])
+        return payload
+
+    eng = OrderEngine(eligibility_mask=elig)
+    out = eng.place_order("SPY", "BUY", 0, "TEST")
+
+    assert seen == []
+    assert out["signal"]["meta"]["blocked"] is True
+    assert out["signal"]["meta"]["reasons"] == ["qty<=0"]
+    assert out["trace"] == [{"step": "sanity", "status": "BLOCKED"}]
+
+
+def test_place_orders_soa_columns():
+    eng = OrderEngine(eligibility_mask=_block_symbol("SPY"))
+    res = eng.place_orders_soa(
+        [
+            {"symbol": "SPY", "side": "BUY", "qty": 1, "strategy": "TEST"},
+            {"symbol": "QQQ", "side": "SELL", "qty": 2, "strategy": "TEST"},
+            {"symbol": "IWM", "side": "BUY", "qty": 0, "strategy": "TEST"},
+        ]
+    )
+
+    assert res["symbol"] == ["SPY", "QQQ", "IWM"]
+    assert list(res["blocked"]) == [1, 0, 1]
+    assert list(res["qty"]) == [1, 2, 0]
+    assert sorted(res["traces"]) == [0, 2]
+
+
+def test_short_batch_result_blocks_every_order():
+    class ShortBatch:
+        def __call__(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+            return payload
+
+        def batch(self, payloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            return payloads[:1]
+
+    eng = OrderEngine(trade_throttle=ShortBatch())
+    outs = eng.place_orders(
+        [
+            {"symbol": "SPY", "side": "BUY", "qty": 1, "strategy": "TEST"},
+            {"symbol": "QQQ", "side": "SELL", "qty": 2, "strategy": "TEST"},
+        ]
+    )
+
+    assert [o["signal"]["meta"]["blocked"] for o in outs] == [True, True]
+    assert all(o["signal"]["meta"]["reasons"][0].startswith("trade_throttle_error:") for o in outs)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 import yaml
@@ -7,7 +8,7 @@ import yaml
 from Core.portfolio_constraints import MetaPortfolioProvider, PortfolioConstraintsGate
 
 
-def _write_cfg(tmp_path: Path) -> Path:
+def _write_cfg(tmp_path: Path, **extra) -> Path:
     cfg = {
         "portfolio_constraints": {
             "version": 1,
@@ -48,6 +49,7 @@ def _write_cfg(tmp_path: Path) -> Path:
             "risk_share": {"min_strategies_for_cap": 2, "strategy_risk_target": 0.30, "strategy_risk_hard_cap": 0.40, "default_daily_vol": 0.015},
         }
     }
+    cfg["portfolio_constraints"].update(extra)
     p = tmp_path / "portfolio_constraints.yaml"
     p.write_text(yaml.safe_dump(cfg), encoding="utf-8")
     return p
@@ -168,3 +170,31 @@ def test_drawdown_halt_blocks_entries(tmp_path: Path):
     dec = gate.check_pre_trade(o, meta=meta, price=100)
     assert dec.allowed is False
     assert dec.action in ("HALT", "BLOCK")
+
+
+def test_peak_nav_writes_deferred_until_flush(tmp_path: Path):
+    cfg_path = _write_cfg(tmp_path, save_interval=0)
+    gate = PortfolioConstraintsGate.from_yaml(cfg_path, meta_provider=MetaPortfolioProvider())
+    gate._state["peak_nav"] = 100_000
+    state_path = cfg_path.with_suffix(".state.json")
+
+    for nav in (101_000, 102_000):
+        order = DummyOrder("AAPL", "BUY", 1, "S1", {})
+        gate.check_pre_trade(order, {"portfolio": {"nav": nav, "positions": []}}, 100.0)
+    assert not state_path.exists()
+
+    gate.flush()
+    assert json.loads(state_path.read_text(encoding="utf-8"))["peak_nav"] == 102_000
+
+
+def test_exposure_tracks_in_place_position_edits():
+    provider = MetaPortfolioProvider()
+    positions = [{"symbol": "SPY", "qty": 100, "price": 100}]
+    meta = {"portfolio": {"nav": 100_000, "positions": positions}}
+    assert provider.exposures(meta, "SPY", 100.0) == (10_000.0, 10_000.0)
+
+    positions[0]["qty"] = 900
+    assert provider.exposures(meta, "SPY", 100.0) == (90_000.0, 90_000.0)
+    positions[0] = {"symbol": "QQQ", "qty": 10, "price": 50}
+    assert provider.symbol_exposure(meta, "SPY", 100.0) == 0.0
+    assert provider.gross_exposure(meta, 100.0) == 500.0
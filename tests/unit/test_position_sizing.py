@@ -57,3 +57,44 @@ clamps: {min_qty: 1, max_qty: 999999, min_notional_usd: 0, max_notional_usd: 1e9
 
     assert off.qty <= on.qty
     assert off.qty == pytest.approx(on.qty * 0.5, rel=0.05)
+
+
+def test_size_batch_matches_scalar(tmp_path: Path):
+    cfg = tmp_path / "position_sizing.yaml"
+    cfg.write_text(
+        """
+version: 1
+base: {risk_per_trade_pct: 0.01, min_stop_distance_pct: 0.01, qty_step: 1}
+regime_multipliers: {RISK_ON: 1.0, RISK_OFF: 0.5, OUTAGE: 0.0, UNKNOWN: 0.0}
+confidence: {enabled: true, min_conf: 0.2, max_conf: 0.8, floor_mult: 0.5, ceil_mult: 1.25}
+clamps: {min_qty: 1, max_qty: 500, min_notional_usd: 0, max_notional_usd: 20000, max_risk_usd: 1e9}
+strategies: {OPENING_FADE: {risk_per_trade_pct: 0.005, strategy_mult: 0.9}}
+""",
+        encoding="utf-8",
+    )
+    sizer = PositionSizer(cfg)
+
+    rows = [
+        SizeInputs(100000, 100, 2, "RISK_ON", "OPENING_FADE", 0.9),
+        SizeInputs(100000, 50, None, "risk_off", "X", None),
+        SizeInputs(100000, 100, 2, "OUTAGE", "X", 0.5),
+        SizeInputs(0, 100, 2, "RISK_ON", "X", 0.5),
+        SizeInputs(100000, 100, 1, "RISK_ON", "X", float("nan")),
+    ]
+    nan = float("nan")
+    batch = sizer.size_batch(
+        [r.equity_usd for r in rows],
+        [r.price for r in rows],
+        [nan if r.stop_distance_usd is None else r.stop_distance_usd for r in rows],
+        [r.regime for r in rows],
+        [r.strategy_id for r in rows],
+        [r.confidence for r in rows],
+    )
+
+    for i, r in enumerate(rows):
+        res = sizer.size(r)
+        assert batch.qty[i] == res.qty
+        assert bool(batch.blocked[i]) == res.blocked
+        assert batch.notional_usd[i] == pytest.approx(res.notional_usd)
+    # NaN confidence clamps like max(lo, min(hi, x)): it lands on max_conf -> ceil_mult
+    assert sizer.size(rows[-1]).confidence_mult == 1.25
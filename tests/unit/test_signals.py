@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from Core.signals import (
+    AlphaContext,
+    MeanReversionSignal,
+    SlippageMinSignal,
+    SpreadCaptureSignal,
+    TrendPersistenceSignal,
+    VolatilityExpansionSignal,
+)
+
+
+def _ctx(regime: str = "VOLATILITY_COMPRESSION", meta=None, quote=None, **features) -> AlphaContext:
+    return AlphaContext(
+        symbol="SPY",
+        now=datetime(2024, 1, 2, 10, 0),
+        regime_label=regime,
+        features=features,
+        quote=quote or {},
+        meta=meta or {},
+    )
+
+
+def test_compute_batch_matches_scalar():
+    ctxs = [
+        _ctx(persistence_score=3.1, expansion_ratio=1.8, momentum=-0.4, z_score_vwap=-2.9, spread_bps=9.0),
+        _ctx(persistence_score=-0.4, expansion_ratio=0.5, bollinger_position=0.97, reversion_success_rate=0.7),
+        _ctx(gap_pct=0.05, rv_short=0.3, rv_medium=0.2, z_score_vwap=3.5, meta={"order_size": 500.0}),
+        _ctx(regime="DIRECTIONAL_EXPANSION", z_score_vwap=4.0, quote={"spread_bps": 2.0}),
+        _ctx(meta={"order_size": 50.0}, avg_volume_per_minute=100.0, volatility=0.02),
+        _ctx(),
+    ]
+    cfg = {"thresholds": {"strong_abs": 2.5, "weak_abs": 1.0}}
+
+    for module in (
+        TrendPersistenceSignal(),
+        VolatilityExpansionSignal(),
+        MeanReversionSignal(),
+        SpreadCaptureSignal(),
+        SlippageMinSignal(),
+    ):
+        batch = module.compute_batch(ctxs, cfg)
+        for i, ctx in enumerate(ctxs):
+            dec = module.compute(ctx, cfg)
+            assert bool(batch.active[i]) == dec.active, (module.name, i)
+            assert int(batch.direction[i]) == dec.direction, (module.name, i)
+            assert float(batch.score[i]) == dec.score, (module.name, i)
+            assert float(batch.confidence[i]) == dec.confidence, (module.name, i)
+            assert float(batch.urgency[i]) == dec.urgency, (module.name, i)
+
+
+def test_memoized_decision_tracks_cfg_and_seals_outputs():
+    module = TrendPersistenceSignal()
+    ctx = _ctx(persistence_score=2.0)
+
+    first = module.compute(ctx, {})
+    assert module.compute(_ctx(persistence_score=2.0), {}) is first
+    assert first.outputs["state"] == "NEUTRAL"
+
+    tightened = module.compute(ctx, {"thresholds": {"weak_abs": 2.5}})
+    assert not tightened.active
+
+    with pytest.raises(TypeError):
+        first.outputs["state"] = "STRONG"
+
+
+def test_params_follow_in_place_cfg_edits():
+    trend = TrendPersistenceSignal()
+    cfg = {"thresholds": {"strong_abs": 2.5, "weak_abs": 1.0}}
+    ctx = _ctx(persistence_score=2.0)
+    assert trend.compute(ctx, cfg).active
+
+    cfg["thresholds"]["weak_abs"] = 2.5
+    assert not trend.compute(ctx, cfg).active
+
+    mr = MeanReversionSignal()
+    mr_cfg = {"activation": {"regimes_allow": ["VOLATILITY_COMPRESSION"]}}
+    assert mr.compute(_ctx(z_score_vwap=-2.9), mr_cfg).reason != "regime_block(VOLATILITY_COMPRESSION)"
+
+    mr_cfg["activation"]["regimes_allow"].remove("VOLATILITY_COMPRESSION")
+    assert mr.compute(_ctx(z_score_vwap=-2.9), mr_cfg).reason == "regime_block(VOLATILITY_COMPRESSION)"
+
+
+def test_memoized_decisions_are_per_instance_and_skip_nan():
+    a, b = TrendPersistenceSignal(), TrendPersistenceSignal()
+    ctx = _ctx(persistence_score=2.0)
+    assert a.compute(ctx, {}) is a.compute(ctx, {})
+    assert b.compute(ctx, {}) is not a.compute(ctx, {})
+
+    vol = VolatilityExpansionSignal()
+    vol.compute(_ctx(expansion_ratio=float("nan")), {})
+    assert not vol._memo.get("_decide")
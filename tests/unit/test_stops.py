@@ -187,3 +187,69 @@ max_loss:
     assert res.max_loss_usd == 50
     assert res.qty_capped_to is not None
     assert res.qty_capped_to < 999
+
+
+def test_compute_batch_matches_compute(tmp_path: Path):
+    cfg = tmp_path / "stops.yaml"
+    cfg.write_text(
+        """
+version: 1
+base:
+  method: ATR
+  stop_pct: 0.01
+  atr_multiple: 1.5
+  min_stop_pct: 0.001
+  max_stop_pct: 0.05
+regime_multipliers:
+  RISK_OFF: 1.5
+  OUTAGE: 0.0
+  UNKNOWN: 1.0
+liquidity:
+  enabled: true
+  widen_threshold_pct: 0.0010
+  widen_slope: 1.0
+  max_widen_mult: 2.0
+  block_if_spread_too_wide: true
+  max_spread_pct: 0.02
+  min_buffer_bps: 2.0
+  buffer_bps_per_spread_bps: 1.0
+  max_buffer_bps: 20.0
+max_loss:
+  enabled: true
+  risk_per_trade_pct: 0.001
+  max_risk_usd: 50
+""",
+        encoding="utf-8",
+    )
+    m = StopModule(cfg)
+
+    rows = [
+        StopInputs(symbol="SPY", side="BUY", entry_price=100.0, regime="RISK_OFF", strategy_id="X",
+                   confidence=0.9, bid=99.5, ask=100.5, atr=0.8, equity_usd=1e5, qty=999),
+        StopInputs(symbol="SPY", side="sell", entry_price=50.0, regime="risk_on", strategy_id="X", atr=None),
+        StopInputs(symbol="SPY", side="BUY", entry_price=100.0, regime="OUTAGE", strategy_id="X"),
+        StopInputs(symbol="SPY", side="BUY", entry_price=100.0, regime="UNKNOWN", strategy_id="X",
+                   bid=95.0, ask=105.0),
+        StopInputs(symbol="SPY", side="HOLD", entry_price=100.0, regime="UNKNOWN", strategy_id="X"),
+    ]
+    out = m.compute_batch(
+        sides=[r.side for r in rows],
+        entry_prices=[r.entry_price for r in rows],
+        regimes=[r.regime for r in rows],
+        strategy_ids=[r.strategy_id for r in rows],
+        confidences=[r.confidence for r in rows],
+        bids=[r.bid for r in rows],
+        asks=[r.ask for r in rows],
+        atrs=[r.atr for r in rows],
+        equity_usd=[r.equity_usd for r in rows],
+        qtys=[r.qty for r in rows],
+    )
+
+    assert out["blocked"].tolist() == [False, False, True, True, True]
+    for i, r in enumerate(rows):
+        res = m.compute(r)
+        assert out["stop_price"][i] == res.stop_price
+        assert out["stop_distance_usd"][i] == res.stop_distance_usd
+        assert out["buffer_usd"][i] == res.buffer_usd
+        assert out["max_qty_for_loss"][i] == (-1 if res.max_qty_for_loss is None else res.max_qty_for_loss)
+        assert out["qty_capped_to"][i] == (-1 if res.qty_capped_to is None else res.qty_capped_to)
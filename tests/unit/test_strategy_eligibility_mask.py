@@ -1,4 +1,7 @@
 import tempfile
+
+import pytest
+
 from Core.strategy_eligibility_mask import StrategyEligibilityMask, load_strategy_eligibility_mask
 
 
@@ -66,3 +69,42 @@ regimes:
     mask = load_strategy_eligibility_mask(path)
     assert mask.decide("RANGE", "MEAN_REVERSION", confidence=0.90).allowed is True
     assert mask.decide("RANGE", "TREND_FOLLOW", confidence=0.90).allowed is False
+
+
+def test_repeated_decisions_are_independent():
+    mask = StrategyEligibilityMask(
+        regimes={"RANGE": {"allow": ["MEAN_*"]}, "NORMAL": {}},
+        default_policy="PROHIBIT",
+    )
+
+    d1 = mask.decide("RANGE", "MEAN_REVERSION", qty=10)
+    assert d1.reason == "ALLOWED_BY_MASK" and d1.qty == 10
+    d1.allowed, d1.qty = False, 0
+    d1.details["regime"] = "NORMAL"
+
+    d2 = mask.decide("RANGE", "MEAN_REVERSION", qty=10)
+    assert d2 is not d1
+    assert d2.allowed is True and d2.qty == 10 and d2.details["regime"] == "RANGE"
+    assert mask.decide("RANGE", "MEAN_REVERSION", qty=5).qty == 5
+    assert mask.decide("NORMAL", "MEAN_REVERSION").reason == "ALLOWED_BY_DEFAULT"
+
+
+def test_non_verbose_decisions_skip_allow_details():
+    mask = StrategyEligibilityMask(
+        regimes={"RANGE": {"allow": ["MEAN_*"]}, "NORMAL": {}},
+        default_policy="PROHIBIT",
+    )
+
+    lean = mask.decide("RANGE", "MEAN_REVERSION", qty=10, verbose=False)
+    full = mask.decide("RANGE", "MEAN_REVERSION", qty=10)
+    assert (lean.allowed, lean.qty, lean.reason, lean.action) == (full.allowed, full.qty, full.reason, full.action)
+    assert lean.details == {} and full.details["allow"] == ["MEAN_*"]
+
+    blocked = mask.decide("RANGE", "TREND_FOLLOW", verbose=False)
+    assert blocked.allowed is False and blocked.details["strategy"] == "TREND_FOLLOW"
+
+
+def test_rewrapping_a_built_mask_is_rejected():
+    mask = StrategyEligibilityMask(regimes={}, default_policy="ALLOW")
+    with pytest.raises(TypeError, match="already constructed"):
+        StrategyEligibilityMask(mask)